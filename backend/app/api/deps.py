@@ -1,11 +1,15 @@
 # app/api/deps.py
-from typing import Annotated
+from typing import Annotated, Collection
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.core.services.authorization import org_authorization
 from app.db.database import get_db
+from app.models.organization import Organizations
+from app.models.organization_member import MemberRole
 from app.models.user import User
 from app.utils.jwt import decode_access_token
 
@@ -50,3 +54,37 @@ async def get_current_active_user(
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+
+async def get_current_admin_user(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+) -> User:
+    """Operators listed in ADMIN_EMAILS"""
+    admins = {email.casefold() for email in settings.ADMIN_EMAILS}
+    if current_user.email.casefold() not in admins:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required"
+        )
+    return current_user
+
+
+def require_org_role(
+    org_id: str,
+    user: User,
+    db: Session,
+    allowed_roles: Collection[MemberRole],
+    detail: str = "You don't have permission to access this organization",
+) -> MemberRole:
+    """Verify the user holds one of `allowed_roles` in the organization"""
+    role = org_authorization.get_role(org_id, user.id, db)
+    if role is None:
+        org_exists = (
+            db.query(Organizations.id).filter(Organizations.id == org_id).first()
+        )
+        if not org_exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found"
+            )
+    if role not in allowed_roles:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+    return role
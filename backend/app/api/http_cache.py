@@ -0,0 +1,48 @@
+# app/api/http_cache.py
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+from app.config import settings
+
+PUBLIC_CACHE_CONTROL = (
+    f"public, max-age={settings.PUBLIC_CACHE_MAX_AGE_SECONDS}, "
+    f"stale-while-revalidate={settings.PUBLIC_CACHE_STALE_WHILE_REVALIDATE_SECONDS}"
+)
+# Per-user responses: never shared, always revalidated with the ETag
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against an ETag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so ignore any W/ prefix
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return etag in candidates
+
+
+def not_modified_response(
+    request: Request, etag: str, cache_control: str
+) -> Optional[Response]:
+    """Return a 304 response if the client already has this version"""
+    if not etag_matches(request, etag):
+        return None
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+def json_response(
+    request: Request, body: bytes, etag: str, cache_control: str
+) -> Response:
+    """Serve a pre-serialized JSON body, or 304 if the ETag matches"""
+    return not_modified_response(request, etag, cache_control) or Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
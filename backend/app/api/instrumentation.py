@@ -0,0 +1,129 @@
+# app/api/instrumentation.py
+import time
+from collections import Counter as StatementCounter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+from app.core.log import get_logger
+from app.core.metrics import (
+    DB_REPEATED_STATEMENTS,
+    DB_SECONDS_PER_REQUEST,
+    DB_STATEMENTS_PER_REQUEST,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    HTTP_RESPONSE_SIZE,
+)
+
+log = get_logger("app.http")
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+@dataclass
+class RequestQueries:
+    """SQL statements executed while handling one request"""
+
+    count: int = 0
+    seconds: float = 0.0
+    statements: StatementCounter = field(default_factory=StatementCounter)
+
+
+# Set by the middleware; sync endpoints run in a thread pool with a copy of the
+# context, so they record into the same RequestQueries object
+_current_queries: ContextVar[Optional[RequestQueries]] = ContextVar(
+    "current_queries", default=None
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_queries.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    queries = _current_queries.get()
+    if queries is None:
+        return
+    started = conn.info.get("query_started_at")
+    if started:
+        queries.seconds += time.perf_counter() - started.pop()
+    queries.count += 1
+    queries.statements[statement] += 1
+
+
+def install_query_hooks(engine: Engine) -> None:
+    """Count and time the SQL statements of each request on `engine`"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _route_name(scope) -> str:
+    # The path template, not the raw path, so ids don't explode label counts
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+def _report_repeated_statements(route: str, queries: RequestQueries) -> None:
+    """Log N+1 patterns: one statement executed once per row of a result"""
+    statement, times = queries.statements.most_common(1)[0]
+    if times < settings.METRICS_N_PLUS_ONE_THRESHOLD:
+        return
+    DB_REPEATED_STATEMENTS.inc(route=route)
+    log.warning(
+        "db.n_plus_one",
+        route=route,
+        times=times,
+        statements=queries.count,
+        statement=" ".join(statement.split()),
+    )
+
+
+class MetricsMiddleware:
+    """Records latency, response size, in-flight requests and SQL statements
+    per route (pure ASGI, so streaming responses are measured to the end)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = RequestQueries()
+        token = _current_queries.set(queries)
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - started_at
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            _current_queries.reset(token)
+
+            method = scope["method"]
+            route = _route_name(scope)
+            HTTP_REQUESTS.inc(method=method, route=route, status=str(status_code))
+            HTTP_REQUEST_DURATION.observe(duration, method=method, route=route)
+            HTTP_RESPONSE_SIZE.observe(response_size, method=method, route=route)
+            DB_STATEMENTS_PER_REQUEST.observe(queries.count, route=route)
+            DB_SECONDS_PER_REQUEST.observe(queries.seconds, route=route)
+            if queries.count:
+                _report_repeated_statements(route, queries)
@@ -0,0 +1,171 @@
+# app/api/pagination.py
+import base64
+import datetime as dt
+import json
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Query, Request, status
+from sqlalchemy import DateTime, and_, false, func, or_
+from sqlalchemy.orm import Query as ORMQuery
+
+from app.config import settings
+
+
+class PageParams(NamedTuple):
+    cursor: Optional[str]
+    limit: int
+
+
+def page_params(
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor from the previous page's X-Next-Cursor"
+    ),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+) -> PageParams:
+    """Dependency for cursor-paginated list endpoints"""
+    return PageParams(cursor=cursor, limit=limit)
+
+
+# (column, descending). NULLs always sort last so the order is portable.
+SortKey = Tuple[Any, bool]
+
+
+class Page(NamedTuple):
+    items: List[Any]
+    next_cursor: Optional[str]
+    total: Optional[int]
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, dt.datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return dt.datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, expected_length: int) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != expected_length:
+            raise ValueError("cursor shape mismatch")
+        return [_decode_value(v) for v in values]
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from e
+
+
+def _after(column: Any, descending: bool, value: Any):
+    """Rows strictly after `value` in (desc|asc) NULLS LAST order"""
+    if value is None:
+        return false()
+    beyond = column < value if descending else column > value
+    return or_(beyond, column.is_(None))
+
+
+def _equal(column: Any, value: Any):
+    return column.is_(None) if value is None else column == value
+
+
+def _sortable(sort_keys: Sequence[SortKey], dialect: str) -> List[SortKey]:
+    """Sort expressions to order and compare by.
+
+    SQLite stores timestamps as text whose format depends on who wrote them
+    (server_default now() has no fractional seconds, bound datetimes do), so
+    they are compared as julian day numbers there.
+    """
+    if dialect != "sqlite":
+        return list(sort_keys)
+    return [
+        (func.julianday(column) if isinstance(column.type, DateTime) else column, desc)
+        for column, desc in sort_keys
+    ]
+
+
+def _bind_value(expression: Any, value: Any) -> Any:
+    if (
+        isinstance(value, dt.datetime)
+        and getattr(expression, "name", "") == "julianday"
+    ):
+        return func.julianday(value.isoformat(sep=" "))
+    return value
+
+
+def keyset_filter(sort_keys: Sequence[SortKey], values: Sequence[Any]):
+    """WHERE clause selecting rows after the cursor row in sort_keys order"""
+    clauses = []
+    for i, (column, descending) in enumerate(sort_keys):
+        prefix = [_equal(col, val) for (col, _), val in zip(sort_keys[:i], values)]
+        clauses.append(and_(*prefix, _after(column, descending, values[i])))
+    return or_(*clauses)
+
+
+def paginate(
+    query: ORMQuery,
+    params: PageParams,
+    sort_keys: Sequence[SortKey],
+    unwrap: bool = False,
+) -> Page:
+    """Apply keyset pagination to `query` ordered by `sort_keys`.
+
+    The last sort key must make the order unique (e.g. a primary key). The
+    total is counted only for the first page, so deep pages stay O(limit).
+    Items are the query's rows; with `unwrap=True` single-entity queries
+    return the entities themselves.
+    """
+    total = query.order_by(None).count() if params.cursor is None else None
+
+    order = _sortable(sort_keys, query.session.get_bind().dialect.name)
+    if params.cursor is not None:
+        values = decode_cursor(params.cursor, len(sort_keys))
+        values = [_bind_value(expr, v) for (expr, _), v in zip(order, values)]
+        query = query.filter(keyset_filter(order, values))
+
+    key_columns = [column for column, _ in sort_keys]
+    query = (
+        query.order_by(None)
+        .order_by(
+            *[
+                (expr.desc() if descending else expr.asc()).nulls_last()
+                for expr, descending in order
+            ]
+        )
+        .add_columns(*key_columns)
+        .limit(params.limit + 1)
+    )
+    rows = query.all()
+
+    key_count = len(key_columns)
+    next_cursor = None
+    if len(rows) > params.limit:
+        rows = rows[: params.limit]
+        next_cursor = encode_cursor(tuple(rows[-1])[-key_count:])
+
+    if unwrap:
+        items = [row[0] for row in rows]
+    else:
+        items = [tuple(row)[:-key_count] for row in rows]
+    return Page(items=items, next_cursor=next_cursor, total=total)
+
+
+def page_headers(request: Request, page: Page) -> Dict[str, str]:
+    """X-Total-Count (first page), X-Next-Cursor and a rel=next Link header"""
+    headers = {}
+    if page.total is not None:
+        headers["X-Total-Count"] = str(page.total)
+    if page.next_cursor is not None:
+        next_url = request.url.include_query_params(cursor=page.next_cursor)
+        headers["X-Next-Cursor"] = page.next_cursor
+        headers["Link"] = f'<{next_url}>; rel="next"'
+    return headers
@@ -1,9 +1,11 @@
 # API routes package
+from app.api.routes.admin import router as admin_router
 from app.api.routes.applications import router as applications_router
 from app.api.routes.auth import router as auth_router
 from app.api.routes.candidates import router as candidates_router
 from app.api.routes.dashboard import router as dashboard_router
 from app.api.routes.job_listing import router as job_listing_router
+from app.api.routes.metrics import router as metrics_router
 from app.api.routes.organization import router as organization_router
 from app.api.routes.resumes import router as resumes_router
 from app.api.routes.saved_jobs import router as saved_jobs_router
@@ -19,4 +21,6 @@ __all__ = [
     "skills_router",
     "resumes_router",
     "saved_jobs_router",
+    "metrics_router",
+    "admin_router",
 ]
@@ -0,0 +1,111 @@
+# app/api/routes/admin.py
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_admin_user
+from app.config import settings
+from app.core.services.outbox import dead_events, outbox_relay, requeue_dead_events
+from app.db.database import get_db
+from app.models.application import JobListingApplication
+from app.models.resume import Resume
+from app.models.user import User
+from app.schemas.admin import (
+    DeadOutboxEvent,
+    OutboxRequeueRequest,
+    OutboxRequeueResponse,
+    PipelineStatsResponse,
+)
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarize_timings(runs: List[Optional[Dict[str, float]]]) -> dict:
+    """p50/p95/max per stage over a list of per-run stage timings"""
+    by_stage: Dict[str, List[float]] = {}
+    for timings in runs:
+        for stage, seconds in (timings or {}).items():
+            by_stage.setdefault(stage, []).append(seconds)
+    stages = {}
+    for stage, values in by_stage.items():
+        values.sort()
+        stages[stage] = {
+            "count": len(values),
+            "p50": _percentile(values, 0.50),
+            "p95": _percentile(values, 0.95),
+            "max": values[-1],
+        }
+    return {"runs": len(runs), "stages": stages}
+
+
+@router.get("/pipeline-stats", response_model=PipelineStatsResponse)
+def get_pipeline_stats(
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+    db: Annotated[Session, Depends(get_db)],
+    window_minutes: int = Query(
+        settings.PIPELINE_STATS_WINDOW_MINUTES, ge=1, le=7 * 24 * 60
+    ),
+):
+    """Stage timing percentiles of resume parsing and ranking runs that
+    finished within the window (read from the rows, so every worker's runs
+    are included)"""
+    since = datetime.now(timezone.utc) - timedelta(minutes=window_minutes)
+    limit = settings.PIPELINE_STATS_MAX_RUNS
+
+    parse_runs = (
+        db.query(Resume.parse_timings)
+        .filter(Resume.parsed_at >= since, Resume.parse_timings.isnot(None))
+        .order_by(Resume.parsed_at.desc())
+        .limit(limit)
+        .all()
+    )
+    rank_runs = (
+        db.query(JobListingApplication.rank_timings)
+        .filter(
+            JobListingApplication.ranked_at >= since,
+            JobListingApplication.rank_timings.isnot(None),
+        )
+        .order_by(JobListingApplication.ranked_at.desc())
+        .limit(limit)
+        .all()
+    )
+
+    return {
+        "window_minutes": window_minutes,
+        "jobs": {
+            "parse-resume": summarize_timings([row[0] for row in parse_runs]),
+            "rank-applicant": summarize_timings([row[0] for row in rank_runs]),
+        },
+    }
+
+
+@router.get("/outbox/dead", response_model=List[DeadOutboxEvent])
+def get_dead_outbox_events(
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+    db: Annotated[Session, Depends(get_db)],
+    limit: int = Query(100, ge=1, le=1000),
+):
+    """Outbox events that used up OUTBOX_MAX_ATTEMPTS and are no longer
+    relayed (payloads left out; they can hold whole resume files)"""
+    return dead_events(db, limit)
+
+
+@router.post("/outbox/requeue", response_model=OutboxRequeueResponse)
+def requeue_outbox_events(
+    body: OutboxRequeueRequest,
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+    db: Annotated[Session, Depends(get_db)],
+):
+    """Give dead outbox events (all, or the given ids) a fresh set of attempts"""
+    requeued = requeue_dead_events(db, body.ids)
+    if requeued:
+        outbox_relay.notify()
+    return {"requeued": requeued}
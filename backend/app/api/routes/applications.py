@@ -1,25 +1,115 @@
-from typing import Annotated, Optional
+from collections import Counter
+from typing import Annotated, Iterator, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, func, or_, select, update
 from sqlalchemy.orm import Session, joinedload
 
-from app.api.deps import get_current_active_user, get_current_user
-from app.core.background.inngest_client import inngest_client
-from app.db.database import get_db
+from app.api.deps import get_current_active_user, get_current_user, require_org_role
+from app.api.http_cache import PRIVATE_CACHE_CONTROL, not_modified_response
+from app.api.pagination import PageParams, page_headers, page_params, paginate
+from app.api.serialization import FastJSONResponse, RowShape, csv_bytes, parse_fields
+from app.core.services.cache import make_etag
+from app.core.services.outbox import enqueue_event, outbox_relay
+from app.db.database import SessionLocal, get_db
 from app.models.application import ApplicationStage, JobListingApplication
 from app.models.candidates import Candidates
 from app.models.job_listing import JobListings, JobListingStatus
 from app.models.user import User
-from app.models.organization import Organizations
+from app.models.organization_member import MemberRole
 from app.schemas.application import (
     ApplicationCreate,
     ApplicationResponse,
     ApplicationUpdate,
+    BulkStageUpdate,
+    BulkStageUpdateResponse,
 )
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
+# Precompiled row -> JSON shapes for the list endpoints
+APPLICATION_FIELDS = {
+    "job_listing_id": JobListingApplication.job_listing_id,
+    "user_id": JobListingApplication.user_id,
+    "cover_letter": JobListingApplication.cover_letter,
+    "rating": JobListingApplication.rating,
+    "ai_analysis": JobListingApplication.ai_analysis,
+    "stage": JobListingApplication.stage,
+    "applied_at": JobListingApplication.applied_at,
+}
+APPLICANT_FIELDS = {
+    "id": User.id,
+    "name": User.name,
+    "email": User.email,
+    "image_url": User.image_url,
+}
+
+JOB_APPLICATION_SHAPE = RowShape({**APPLICATION_FIELDS, "user": APPLICANT_FIELDS})
+# List view: drop the heavy cover letter and AI analysis text
+JOB_APPLICATION_PRESETS = {
+    "summary": [
+        f
+        for f in JOB_APPLICATION_SHAPE.field_names()
+        if f not in ("cover_letter", "ai_analysis")
+    ]
+}
+
+MY_APPLICATION_SHAPE = RowShape(
+    {
+        **APPLICATION_FIELDS,
+        "updated_at": JobListingApplication.updated_at,
+        "job_listing": {
+            "id": JobListings.id,
+            "title": JobListings.title,
+            "description": JobListings.description,
+            "organization_id": JobListings.organization_id,
+            "wage": JobListings.wage,
+            "wage_interval": JobListings.wage_interval,
+            "city": JobListings.city,
+            "state_abbreviation": JobListings.state_abbreviation,
+            "location_requirement": JobListings.location_requirement,
+            "experience_level": JobListings.experience_level,
+            "type": JobListings.type,
+            "status": JobListings.status,
+            "posted_at": JobListings.posted_at,
+        },
+    }
+)
+
+ORGANIZATION_APPLICATION_SHAPE = RowShape(
+    {
+        **APPLICATION_FIELDS,
+        "updated_at": JobListingApplication.updated_at,
+        "user": APPLICANT_FIELDS,
+        "job_listing": {
+            "id": JobListings.id,
+            "title": JobListings.title,
+            "status": JobListings.status,
+        },
+    }
+)
+
+# Flat export rows for offline review
+EXPORT_SHAPE = RowShape(
+    {
+        "job_listing_id": JobListingApplication.job_listing_id,
+        "job_title": JobListings.title,
+        "user_id": JobListingApplication.user_id,
+        "name": User.name,
+        "email": User.email,
+        "stage": JobListingApplication.stage,
+        "rating": JobListingApplication.rating,
+        "applied_at": JobListingApplication.applied_at,
+        "ai_analysis": JobListingApplication.ai_analysis,
+    }
+)
+EXPORT_BATCH_SIZE = 1000
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
 
 @router.post(
     "/", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED
@@ -59,6 +149,11 @@ async def apply_to_job(
             status_code=400, detail="You have already applied to this job"
         )
 
+    # Get candidate_id for the ranking event
+    candidate = (
+        db.query(Candidates).filter(Candidates.user_id == current_user.id).first()
+    )
+
     # Create application
     new_application = JobListingApplication(
         job_listing_id=application_data.job_listing_id,
@@ -69,29 +164,25 @@ async def apply_to_job(
     )
 
     db.add(new_application)
+
+    # Rank the applicant in the background (committed with the application)
+    if candidate:
+        enqueue_event(
+            db,
+            "app/application.created",
+            {
+                "job_listing_id": application_data.job_listing_id,
+                "candidate_id": candidate.id,
+                "organization_id": job.organization_id,
+            },
+        )
     db.commit()
+    outbox_relay.notify()
     db.refresh(new_application)
 
     # Load user relationship for response
     db.refresh(new_application, ["user"])
 
-    # Get candidate_id for the Inngest event
-    candidate = (
-        db.query(Candidates).filter(Candidates.user_id == current_user.id).first()
-    )
-
-    # Trigger background job to rank applicant
-    if candidate:
-        await inngest_client.send(
-            {
-                "name": "app/application.created",
-                "data": {
-                    "job_listing_id": application_data.job_listing_id,
-                    "candidate_id": candidate.id,
-                },
-            }
-        )
-
     # Construct response manually to include user info
     response_data = {
         "job_listing_id": new_application.job_listing_id,
@@ -114,30 +205,51 @@ async def apply_to_job(
     return response_data
 
 
-@router.get("/job/{job_id}")
+@router.get("/job/{job_id}", response_class=FastJSONResponse)
 async def get_job_applications(
     job_id: str,
+    request: Request,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[Session, Depends(get_db)],
-    sort_by: str = Query("rating", regex="^(rating|applied_at)$"),
+    page: Annotated[PageParams, Depends(page_params)],
+    sort_by: str = Query("rating", pattern="^(rating|applied_at)$"),
     stage_filter: Optional[ApplicationStage] = None,
     min_rating: Optional[int] = Query(None, ge=0, le=100),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to return, or 'summary' (without "
+        "cover_letter and ai_analysis). Omit for the full applications.",
+    ),
 ):
     """Get all applications for a job listing, sorted by AI match score"""
+    fields = parse_fields(
+        fields,
+        JOB_APPLICATION_SHAPE.field_names(),
+        JOB_APPLICATION_PRESETS,
+        required=["job_listing_id", "user_id"],
+    )
+    shape = JOB_APPLICATION_SHAPE.subset(fields) if fields else JOB_APPLICATION_SHAPE
 
-    # Verify job exists and user has permission
-    job = db.query(JobListings).filter(JobListings.id == job_id).first()
-    if not job:
+    # Verify job exists and user belongs to its organization
+    org_id = (
+        db.query(JobListings.organization_id).filter(JobListings.id == job_id).scalar()
+    )
+    if org_id is None:
         raise HTTPException(status_code=404, detail="Job listing not found")
 
-    # Check if user is member/admin of organization
-    # (Add your permission check here)
+    require_org_role(
+        org_id,
+        current_user,
+        db,
+        set(MemberRole),
+        detail="Not authorized to view this job's applications",
+    )
 
     # Build query
     query = (
-        db.query(JobListingApplication)
+        db.query(*shape.columns)
+        .join(User, JobListingApplication.user_id == User.id)
         .filter(JobListingApplication.job_listing_id == job_id)
-        .options(joinedload(JobListingApplication.user))
     )
 
     # Apply filters
@@ -147,33 +259,16 @@ async def get_job_applications(
     if min_rating is not None:
         query = query.filter(JobListingApplication.rating >= min_rating)
 
-    # Sort
+    # Sort (user_id breaks ties so the cursor position is unique)
     if sort_by == "rating":
-        query = query.order_by(JobListingApplication.rating.desc().nulls_last())
+        sort_keys = [(JobListingApplication.rating, True)]
     else:
-        query = query.order_by(JobListingApplication.applied_at.desc())
-
-    applications = query.all()
+        sort_keys = [(JobListingApplication.applied_at, True)]
+    sort_keys.append((JobListingApplication.user_id, False))
 
     # Format response with user info
-    return [
-        {
-            "job_listing_id": app.job_listing_id,
-            "user_id": app.user_id,
-            "cover_letter": app.cover_letter,
-            "rating": app.rating,
-            "ai_analysis": app.ai_analysis,
-            "stage": app.stage,
-            "applied_at": app.applied_at,
-            "user": {
-                "id": app.user.id,
-                "name": app.user.name,
-                "email": app.user.email,
-                "image_url": app.user.image_url,
-            },
-        }
-        for app in applications
-    ]
+    result = paginate(query, page, sort_keys)
+    return shape.response(result.items, headers=page_headers(request, result))
 
 
 @router.get("/job/{job_id}/stats")
@@ -185,10 +280,20 @@ async def get_application_stats(
     """Get statistics about applications for a job"""
 
     # Verify permission
-    job = db.query(JobListings).filter(JobListings.id == job_id).first()
-    if not job:
+    org_id = (
+        db.query(JobListings.organization_id).filter(JobListings.id == job_id).scalar()
+    )
+    if org_id is None:
         raise HTTPException(status_code=404, detail="Job listing not found")
 
+    require_org_role(
+        org_id,
+        current_user,
+        db,
+        set(MemberRole),
+        detail="Not authorized to view this job's applications",
+    )
+
     # Calculate stats
     total = (
         db.query(func.count(JobListingApplication.user_id))
@@ -236,6 +341,93 @@ async def get_application_stats(
     }
 
 
+@router.patch("/job/{job_id}/stage", response_model=BulkStageUpdateResponse)
+async def bulk_update_application_stage(
+    job_id: str,
+    update_data: BulkStageUpdate,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[Session, Depends(get_db)],
+):
+    """Move many applications of a job to a new stage in one set-based UPDATE"""
+    org_id = (
+        db.query(JobListings.organization_id).filter(JobListings.id == job_id).scalar()
+    )
+    if org_id is None:
+        raise HTTPException(status_code=404, detail="Job listing not found")
+
+    require_org_role(
+        org_id,
+        current_user,
+        db,
+        {MemberRole.OWNER, MemberRole.ADMIN},
+        detail="Not authorized to manage this job's applications",
+    )
+
+    # Applications already in the target stage are left untouched
+    conditions = [
+        JobListingApplication.job_listing_id == job_id,
+        JobListingApplication.stage != update_data.stage,
+    ]
+    if update_data.user_ids is not None:
+        conditions.append(JobListingApplication.user_id.in_(update_data.user_ids))
+    if update_data.current_stage is not None:
+        conditions.append(JobListingApplication.stage == update_data.current_stage)
+    if update_data.rating_below is not None:
+        below = JobListingApplication.rating < update_data.rating_below
+        if update_data.include_unrated:
+            below = or_(below, JobListingApplication.rating.is_(None))
+        conditions.append(below)
+    selection = and_(*conditions)
+
+    # Lock the selected rows while reading their current stage, and update
+    # exactly those rows, so a concurrent change can't make the reported
+    # previous stages wrong
+    selected = (
+        db.query(JobListingApplication.user_id, JobListingApplication.stage)
+        .filter(selection)
+        .with_for_update()
+        .all()
+    )
+    previous_stages = dict(Counter(stage for _, stage in selected))
+    updated_user_ids = (
+        db.execute(
+            update(JobListingApplication)
+            .where(
+                JobListingApplication.job_listing_id == job_id,
+                JobListingApplication.user_id.in_([user_id for user_id, _ in selected]),
+            )
+            .values(stage=update_data.stage)
+            .returning(JobListingApplication.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        .scalars()
+        .all()
+    )
+
+    # Notify downstream jobs; the relay delivers these in batches
+    for user_id in updated_user_ids:
+        enqueue_event(
+            db,
+            "app/application.stage_changed",
+            {
+                "job_listing_id": job_id,
+                "organization_id": org_id,
+                "user_id": user_id,
+                "stage": update_data.stage.value,
+            },
+        )
+    db.commit()
+    if updated_user_ids:
+        outbox_relay.notify()
+
+    return {
+        "stage": update_data.stage,
+        "updated": len(updated_user_ids),
+        "user_ids": updated_user_ids,
+        "previous_stages": previous_stages,
+    }
+
+
 @router.patch("/{job_id}/{user_id}")
 async def update_application_stage(
     job_id: str,
@@ -263,7 +455,13 @@ async def update_application_stage(
         raise HTTPException(status_code=404, detail="Application not found")
 
     # Verify permission
-    # (Check if user is org admin/member)
+    require_org_role(
+        application.job_listing.organization_id,
+        current_user,
+        db,
+        {MemberRole.OWNER, MemberRole.ADMIN},
+        detail="Not authorized to manage this job's applications",
+    )
 
     # Update stage
     if update_data.stage:
@@ -306,124 +504,181 @@ async def check_application_status(
     }
 
 
-@router.get("/me")
+@router.get("/me", response_class=FastJSONResponse)
 async def get_my_applications(
+    request: Request,
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
+    page: Annotated[PageParams, Depends(page_params)],
     stage_filter: Optional[ApplicationStage] = None,
 ):
     """
     Get all applications submitted by the current user (job seeker view)
     Returns applications with job details
     """
+    # Cheap version check so polling clients get a 304 before the full fetch
+    count, last_applied_at, last_application_update, last_job_update = (
+        db.query(
+            func.count(JobListingApplication.job_listing_id),
+            func.max(JobListingApplication.applied_at),
+            func.max(JobListingApplication.updated_at),
+            func.max(JobListings.updated_at),
+        )
+        .join(JobListings, JobListingApplication.job_listing_id == JobListings.id)
+        .filter(JobListingApplication.user_id == current_user.id)
+        .one()
+    )
+    etag = make_etag(
+        "my-applications",
+        current_user.id,
+        stage_filter.value if stage_filter else None,
+        page.cursor,
+        page.limit,
+        count,
+        last_applied_at,
+        last_application_update,
+        last_job_update,
+    )
+    not_modified = not_modified_response(request, etag, PRIVATE_CACHE_CONTROL)
+    if not_modified:
+        return not_modified
+
     query = (
-        db.query(JobListingApplication)
+        db.query(*MY_APPLICATION_SHAPE.columns)
+        .join(JobListings, JobListingApplication.job_listing_id == JobListings.id)
         .filter(JobListingApplication.user_id == current_user.id)
-        .options(joinedload(JobListingApplication.job_listing))
     )
 
     if stage_filter:
         query = query.filter(JobListingApplication.stage == stage_filter)
 
-    query = query.order_by(JobListingApplication.applied_at.desc())
-    applications = query.all()
-
-    return [
-        {
-            "job_listing_id": app.job_listing_id,
-            "user_id": app.user_id,
-            "cover_letter": app.cover_letter,
-            "rating": app.rating,
-            "ai_analysis": app.ai_analysis,
-            "stage": app.stage,
-            "applied_at": app.applied_at,
-            "updated_at": app.updated_at,
-            "job_listing": {
-                "id": app.job_listing.id,
-                "title": app.job_listing.title,
-                "description": app.job_listing.description,
-                "organization_id": app.job_listing.organization_id,
-                "wage": app.job_listing.wage,
-                "wage_interval": (
-                    app.job_listing.wage_interval.value
-                    if app.job_listing.wage_interval
-                    else None
-                ),
-                "city": app.job_listing.city,
-                "state_abbreviation": app.job_listing.state_abbreviation,
-                "location_requirement": app.job_listing.location_requirement.value,
-                "experience_level": app.job_listing.experience_level.value,
-                "type": app.job_listing.type.value,
-                "status": app.job_listing.status.value,
-                "posted_at": app.job_listing.posted_at,
-            },
-        }
-        for app in applications
-    ]
+    result = paginate(
+        query,
+        page,
+        [
+            (JobListingApplication.applied_at, True),
+            (JobListingApplication.job_listing_id, False),
+        ],
+    )
+    return MY_APPLICATION_SHAPE.response(
+        result.items,
+        headers={
+            **page_headers(request, result),
+            "ETag": etag,
+            "Cache-Control": PRIVATE_CACHE_CONTROL,
+        },
+    )
 
 
-@router.get("/organization/{org_id}")
+@router.get("/organization/{org_id}", response_class=FastJSONResponse)
 async def get_organization_applications(
     org_id: str,
+    request: Request,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[Session, Depends(get_db)],
+    page: Annotated[PageParams, Depends(page_params)],
     stage_filter: Optional[ApplicationStage] = None,
 ):
     """Get all applications for an organization"""
     # Verify organization exists and user has permission
-    org = db.query(Organizations).filter(Organizations.id == org_id).first()
-    if not org:
-        raise HTTPException(status_code=404, detail="Organization not found")
-
-    # Ensure type consistency for comparison
-    org_owner_id = (
-        int(org.owner_user_id)
-        if isinstance(org.owner_user_id, str)
-        else org.owner_user_id
+    require_org_role(
+        org_id,
+        current_user,
+        db,
+        {MemberRole.OWNER},
+        detail="Not authorized to view this organization's applications",
     )
-    if org_owner_id != current_user.id:
-        raise HTTPException(
-            status_code=403, detail="Not authorized to view this organization's applications"
-        )
 
     # Build query
     query = (
-        db.query(JobListingApplication)
-        .join(JobListings)
+        db.query(*ORGANIZATION_APPLICATION_SHAPE.columns)
+        .join(JobListings, JobListingApplication.job_listing_id == JobListings.id)
+        .join(User, JobListingApplication.user_id == User.id)
         .filter(JobListings.organization_id == org_id)
-        .options(
-            joinedload(JobListingApplication.job_listing),
-            joinedload(JobListingApplication.user),
-        )
     )
 
     if stage_filter:
         query = query.filter(JobListingApplication.stage == stage_filter)
 
-    query = query.order_by(JobListingApplication.applied_at.desc())
-    applications = query.all()
-
-    return [
-        {
-            "job_listing_id": app.job_listing_id,
-            "user_id": app.user_id,
-            "cover_letter": app.cover_letter,
-            "rating": app.rating,
-            "ai_analysis": app.ai_analysis,
-            "stage": app.stage,
-            "applied_at": app.applied_at,
-            "updated_at": app.updated_at,
-            "user": {
-                "id": app.user.id,
-                "name": app.user.name,
-                "email": app.user.email,
-                "image_url": app.user.image_url,
-            },
-            "job_listing": {
-                "id": app.job_listing.id,
-                "title": app.job_listing.title,
-                "status": app.job_listing.status.value,
-            },
-        }
-        for app in applications
-    ]
+    result = paginate(
+        query,
+        page,
+        [
+            (JobListingApplication.applied_at, True),
+            (JobListingApplication.job_listing_id, False),
+            (JobListingApplication.user_id, False),
+        ],
+    )
+    return ORGANIZATION_APPLICATION_SHAPE.response(
+        result.items, headers=page_headers(request, result)
+    )
+
+
+def _export_applications(
+    org_id: str, job_id: Optional[str], export_format: str
+) -> Iterator[bytes]:
+    """Yield the export in batches read from a server-side cursor.
+
+    Runs while the response is streamed, after the request's session has been
+    closed, so it uses a session of its own.
+    """
+    db = SessionLocal()
+    try:
+        statement = (
+            select(*EXPORT_SHAPE.columns)
+            .join(JobListings, JobListingApplication.job_listing_id == JobListings.id)
+            .join(User, JobListingApplication.user_id == User.id)
+            .where(JobListings.organization_id == org_id)
+            .order_by(
+                JobListingApplication.job_listing_id,
+                JobListingApplication.applied_at,
+                JobListingApplication.user_id,
+            )
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        if job_id:
+            statement = statement.where(JobListingApplication.job_listing_id == job_id)
+
+        if export_format == "csv":
+            yield csv_bytes([EXPORT_SHAPE.field_names()])
+        for rows in db.execute(statement).partitions():
+            if export_format == "csv":
+                yield csv_bytes(rows)
+            else:
+                yield EXPORT_SHAPE.dumps_lines(rows)
+    finally:
+        db.close()
+
+
+@router.get("/organization/{org_id}/export")
+async def export_organization_applications(
+    org_id: str,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[Session, Depends(get_db)],
+    export_format: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+    job_id: Optional[str] = Query(None, description="Export a single job only"),
+):
+    """Stream all applications of an organization (or one of its jobs) as CSV or NDJSON"""
+    require_org_role(
+        org_id,
+        current_user,
+        db,
+        {MemberRole.OWNER},
+        detail="Not authorized to export this organization's applications",
+    )
+
+    if job_id:
+        job_org_id = (
+            db.query(JobListings.organization_id)
+            .filter(JobListings.id == job_id)
+            .scalar()
+        )
+        if job_org_id != org_id:
+            raise HTTPException(status_code=404, detail="Job listing not found")
+
+    filename = f"applications-{job_id or org_id}.{export_format}"
+    return StreamingResponse(
+        _export_applications(org_id, job_id, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
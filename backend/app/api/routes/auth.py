@@ -1,6 +1,7 @@
 import datetime as dt
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import false
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_active_user
@@ -15,6 +16,37 @@ from app.utils.jwt import create_refresh_token, hash_token
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
+def issue_refresh_token(user_id: int, db: Session) -> str:
+    """Create a refresh token for the user and revoke any beyond the active cap"""
+    refresh_token_str = create_refresh_token()
+    db.add(
+        RefreshToken(
+            user_id=user_id,
+            token_hash=hash_token(refresh_token_str),
+            expires_at=dt.datetime.now(dt.UTC)
+            + dt.timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+    )
+    db.flush()
+
+    # Keep only the newest N active tokens per user (oldest sessions are logged out)
+    excess_ids = (
+        db.query(RefreshToken.id)
+        .filter(
+            RefreshToken.user_id == user_id,
+            RefreshToken.is_revoked == false(),
+        )
+        .order_by(RefreshToken.created_at.desc(), RefreshToken.id.desc())
+        .offset(settings.MAX_ACTIVE_REFRESH_TOKENS_PER_USER)
+        .scalar_subquery()
+    )
+    db.query(RefreshToken).filter(RefreshToken.id.in_(excess_ids)).update(
+        {RefreshToken.is_revoked: True}, synchronize_session=False
+    )
+
+    return refresh_token_str
+
+
 @router.post(
     "/register",
     response_model=TokenResponse,
@@ -48,14 +80,7 @@ async def register(request: RegisterRequest, db: Session = Depends(get_db)):
     )
 
     # Create refresh token
-    refresh_token_str = create_refresh_token()
-    refresh_token = RefreshToken(
-        user_id=new_user.id,
-        token_hash=hash_token(refresh_token_str),
-        expires_at=dt.datetime.now(dt.UTC)
-        + dt.timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
-    )
-    db.add(refresh_token)
+    refresh_token_str = issue_refresh_token(new_user.id, db)
     db.commit()
 
     user_response = UserResponse(
@@ -91,14 +116,7 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
     access_token = create_access_token(data={"sub": str(user.id), "name": user.name})
 
     # Create refresh token
-    refresh_token_str = create_refresh_token()
-    refresh_token = RefreshToken(
-        user_id=user.id,
-        token_hash=hash_token(refresh_token_str),
-        expires_at=dt.datetime.now(dt.UTC)
-        + dt.timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
-    )
-    db.add(refresh_token)
+    refresh_token_str = issue_refresh_token(user.id, db)
     db.commit()
 
     user_response = UserResponse(
@@ -184,14 +202,7 @@ async def refresh_access_token(
     )
 
     # Create new refresh token
-    new_refresh_token_str = create_refresh_token()
-    new_refresh_token = RefreshToken(
-        user_id=user.id,
-        token_hash=hash_token(new_refresh_token_str),
-        expires_at=dt.datetime.now(dt.UTC)
-        + dt.timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
-    )
-    db.add(new_refresh_token)
+    new_refresh_token_str = issue_refresh_token(user.id, db)
     db.commit()
 
     return TokenResponse(
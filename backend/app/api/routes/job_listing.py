@@ -1,12 +1,32 @@
 # app/api/v1/job_listings.py
+import json
 import uuid
 from datetime import datetime, timezone
-from typing import Annotated, List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-
-from app.api.deps import get_current_user
+from typing import Annotated, Any, List, Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, joinedload
+
+from app.api.deps import get_current_user, require_org_role
+from app.api.http_cache import PUBLIC_CACHE_CONTROL, json_response
+from app.api.pagination import PageParams, page_headers, page_params, paginate
+from app.api.serialization import RowShape, parse_fields
+from app.config import settings
+from app.core.log import get_logger
+from app.core.services.cache import job_listing_cache, make_etag
+from app.core.services.outbox import enqueue_event, outbox_relay
 from app.db.database import get_db
 from app.models.job_listing import (
     ExperienceLevel,
@@ -15,8 +35,11 @@ from app.models.job_listing import (
     LocationRequirement,
 )
 from app.models.organization import Organizations
+from app.models.organization_member import MemberRole
 from app.models.user import User
 from app.schemas.job_listing import (
+    BulkJobListingResponse,
+    BulkJobListingResult,
     JobListingCreate,
     JobListingResponse,
     JobListingUpdate,
@@ -24,9 +47,65 @@ from app.schemas.job_listing import (
 
 router = APIRouter(prefix="/job-listings", tags=["job-listings"])
 
+log = get_logger("app.routes.job_listings")
+
+job_listing_list_adapter = TypeAdapter(List[JobListingResponse])
+
+# Sparse fieldsets (`fields=`) select only these columns instead of whole rows
+JOB_LISTING_SHAPE = RowShape(
+    {
+        "id": JobListings.id,
+        "title": JobListings.title,
+        "description": JobListings.description,
+        "wage": JobListings.wage,
+        "wage_interval": JobListings.wage_interval,
+        "state_abbreviation": JobListings.state_abbreviation,
+        "city": JobListings.city,
+        "location_requirement": JobListings.location_requirement,
+        "experience_level": JobListings.experience_level,
+        "type": JobListings.type,
+        "organization_id": JobListings.organization_id,
+        "organization_name": Organizations.name,
+        "status": JobListings.status,
+        "is_featured": JobListings.is_featured,
+        "posted_at": JobListings.posted_at,
+        "created_at": JobListings.created_at,
+    }
+)
+# Card view: everything except the unbounded description text
+JOB_LISTING_PRESETS = {
+    "summary": [f for f in JOB_LISTING_SHAPE.field_names() if f != "description"]
+}
+FIELDS_DESCRIPTION = (
+    "Comma-separated fields to return, or 'summary' for the card view "
+    "(all fields except description). Omit for the full listing."
+)
+# Fields the applicant match score depends on (see match_scoring.ranking_inputs)
+RANKING_FIELDS = ("title", "description", "experience_level", "type")
+
+
+def _job_listing_query(db: Session, fields: Optional[tuple]):
+    """Column projection for a sparse fieldset, else full rows + org name only"""
+    if fields:
+        shape = JOB_LISTING_SHAPE.subset(fields)
+        return db.query(*shape.columns).outerjoin(
+            Organizations, JobListings.organization_id == Organizations.id
+        )
+    return db.query(JobListings).options(
+        joinedload(JobListings.organization).load_only(Organizations.name)
+    )
+
+
+def _normalize_term(value: Optional[str]) -> Optional[str]:
+    """Filters match case-insensitively, so cache keys ignore case/whitespace"""
+    if value is None:
+        return None
+    return value.strip().lower() or None
+
 
 @router.get("/", response_model=List[JobListingResponse])
 def get_public_job_listings(
+    request: Request,
     db: Annotated[Session, Depends(get_db)],
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
@@ -35,9 +114,35 @@ def get_public_job_listings(
     experience_level: Optional[ExperienceLevel] = None,
     min_wage: Optional[int] = Query(None, ge=0),
     location_requirement: Optional[LocationRequirement] = None,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
 ):
     """Get all published job listings (public endpoint with filters and pagination)"""
-    query = db.query(JobListings).filter(
+    search = _normalize_term(search)
+    location = _normalize_term(location)
+    fields = parse_fields(
+        fields, JOB_LISTING_SHAPE.field_names(), JOB_LISTING_PRESETS, required=["id"]
+    )
+
+    cache_key = None
+    if skip <= settings.JOB_LISTING_CACHE_MAX_SKIP:
+        cache_key = job_listing_cache.make_key(
+            "search",
+            search,
+            location,
+            experience_level.value if experience_level else None,
+            min_wage,
+            location_requirement.value if location_requirement else None,
+            skip,
+            limit,
+            fields,
+        )
+        cached = job_listing_cache.get(cache_key)
+        if cached is not None:
+            return json_response(
+                request, cached.body, cached.etag, PUBLIC_CACHE_CONTROL
+            )
+
+    query = _job_listing_query(db, fields).filter(
         JobListings.status == JobListingStatus.PUBLISHED
     )
 
@@ -73,27 +178,26 @@ def get_public_job_listings(
     # Apply pagination
     jobs = query.offset(skip).limit(limit).all()
 
-    return jobs
+    if fields:
+        body = JOB_LISTING_SHAPE.subset(fields).dumps(jobs)
+    else:
+        body = job_listing_list_adapter.dump_json(
+            job_listing_list_adapter.validate_python(jobs, from_attributes=True)
+        )
+    entry = job_listing_cache.set(cache_key, body) if cache_key else None
+    etag = entry.etag if entry else make_etag(body)
+    return json_response(request, body, etag, PUBLIC_CACHE_CONTROL)
 
 
-def check_org_permission(org_id: str, user_id: int, db: Session) -> Organizations:
+def check_org_permission(org_id: str, user: User, db: Session) -> MemberRole:
     """Check if user has permission to manage organization"""
-    org = db.query(Organizations).filter(Organizations.id == org_id).first()
-    if not org:
-        raise HTTPException(status_code=404, detail="Organization not found")
-
-    # Ensure type consistency for comparison
-    org_owner_id = (
-        int(org.owner_user_id)
-        if isinstance(org.owner_user_id, str)
-        else org.owner_user_id
+    return require_org_role(
+        org_id,
+        user,
+        db,
+        {MemberRole.OWNER},
+        detail="Not authorized to manage this organization",
     )
-    if org_owner_id != user_id:
-        raise HTTPException(
-            status_code=403, detail="Not authorized to manage this organization"
-        )
-
-    return org
 
 
 @router.post(
@@ -106,7 +210,7 @@ def create_job_listing(
 ):
     """Create a new job listing"""
     # Check organization permission
-    check_org_permission(job_data.organization_id, current_user.id, db)
+    check_org_permission(job_data.organization_id, current_user, db)
 
     # Create job listing
     new_job = JobListings(
@@ -127,30 +231,174 @@ def create_job_listing(
     db.add(new_job)
     db.commit()
     db.refresh(new_job)
+    job_listing_cache.invalidate()
 
     return new_job
 
 
+def _parse_bulk_rows(body: bytes, content_type: str) -> List[Any]:
+    """Decode a JSON array or NDJSON body into raw rows.
+
+    A malformed NDJSON line becomes a ValueError in its slot so it can be
+    reported per row; a malformed JSON array rejects the whole request.
+    """
+    if "ndjson" in content_type:
+        rows: List[Any] = []
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                rows.append(json.loads(line))
+            except ValueError as e:
+                rows.append(e)
+        return rows
+
+    try:
+        rows = json.loads(body)
+    except ValueError:
+        rows = None
+    if not isinstance(rows, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Request body must be a JSON array or NDJSON",
+        )
+    return rows
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, err['loc'])) or 'row'}: {err['msg']}"
+        for err in error.errors()
+    )
+
+
+@router.post("/bulk", response_model=BulkJobListingResponse)
+async def bulk_create_job_listings(
+    request: Request,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[Session, Depends(get_db)],
+):
+    """Create many job listings from a JSON array or NDJSON body.
+
+    Every row is validated up front, permissions are checked once per
+    organization, and valid rows are inserted in chunked transactions.
+    """
+    body = await request.body()
+    # Validating and inserting thousands of rows is blocking work; keep it
+    # off the event loop
+    return await run_in_threadpool(
+        _bulk_create_job_listings,
+        body,
+        request.headers.get("content-type", ""),
+        current_user,
+        db,
+    )
+
+
+def _bulk_create_job_listings(
+    body: bytes, content_type: str, current_user: User, db: Session
+) -> BulkJobListingResponse:
+    rows = _parse_bulk_rows(body, content_type)
+    if len(rows) > settings.JOB_LISTING_BULK_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.JOB_LISTING_BULK_MAX_ROWS} rows per request",
+        )
+
+    results: List[Optional[BulkJobListingResult]] = [None] * len(rows)
+
+    def fail(index: int, error: str) -> None:
+        results[index] = BulkJobListingResult(index=index, status="error", error=error)
+
+    valid = []
+    for index, row in enumerate(rows):
+        if isinstance(row, ValueError):
+            fail(index, f"Invalid JSON: {row}")
+            continue
+        try:
+            valid.append((index, JobListingCreate.model_validate(row)))
+        except ValidationError as e:
+            fail(index, _format_validation_error(e))
+
+    # Check organization permission once per distinct organization
+    denied = {}
+    for org_id in {job.organization_id for _, job in valid}:
+        try:
+            check_org_permission(org_id, current_user, db)
+        except HTTPException as e:
+            denied[org_id] = e.detail
+
+    allowed = []
+    for index, job in valid:
+        if job.organization_id in denied:
+            fail(index, denied[job.organization_id])
+        else:
+            allowed.append((index, {"id": str(uuid.uuid4()), **job.model_dump()}))
+
+    chunk_size = settings.JOB_LISTING_BULK_CHUNK_SIZE
+    created = 0
+    for start in range(0, len(allowed), chunk_size):
+        chunk = allowed[start : start + chunk_size]
+        try:
+            db.execute(insert(JobListings), [values for _, values in chunk])
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            log.warning("job_listing.bulk_insert_failed", rows=len(chunk), error=e)
+            for index, _ in chunk:
+                fail(index, "Database error while inserting this chunk")
+            continue
+        for index, values in chunk:
+            results[index] = BulkJobListingResult(
+                index=index, status="created", id=values["id"]
+            )
+        created += len(chunk)
+
+    if created:
+        job_listing_cache.invalidate()
+
+    return BulkJobListingResponse(
+        created=created, failed=len(rows) - created, results=results
+    )
+
+
 @router.get("/organization/{org_id}", response_model=List[JobListingResponse])
 def get_organization_job_listings(
     org_id: str,
+    request: Request,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[Session, Depends(get_db)],
+    page: Annotated[PageParams, Depends(page_params)],
     status_filter: JobListingStatus = None,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
 ):
     """Get all job listings for an organization"""
+    fields = parse_fields(
+        fields, JOB_LISTING_SHAPE.field_names(), JOB_LISTING_PRESETS, required=["id"]
+    )
+
     # Verify organization exists
     org = db.query(Organizations).filter(Organizations.id == org_id).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
-    query = db.query(JobListings).filter(JobListings.organization_id == org_id)
+    query = _job_listing_query(db, fields).filter(JobListings.organization_id == org_id)
 
     if status_filter:
         query = query.filter(JobListings.status == status_filter)
 
-    jobs = query.order_by(JobListings.created_at.desc()).all()
-    return jobs
+    jobs = paginate(
+        query,
+        page,
+        [(JobListings.created_at, True), (JobListings.id, False)],
+        unwrap=not fields,
+    )
+    headers = page_headers(request, jobs)
+    if fields:
+        return JOB_LISTING_SHAPE.subset(fields).response(jobs.items, headers=headers)
+    response.headers.update(headers)
+    return jobs.items
 
 
 @router.patch("/{job_id}", response_model=JobListingResponse)
@@ -167,10 +415,15 @@ def update_job_listing(
         raise HTTPException(status_code=404, detail="Job listing not found")
 
     # Check permission
-    check_org_permission(job.organization_id, current_user.id, db)
+    check_org_permission(job.organization_id, current_user, db)
 
     # Update fields
     update_data = job_data.model_dump(exclude_unset=True)
+    ranking_changed = any(
+        getattr(job, field) != update_data[field]
+        for field in RANKING_FIELDS
+        if field in update_data
+    )
     for field, value in update_data.items():
         setattr(job, field, value)
 
@@ -178,19 +431,42 @@ def update_job_listing(
     if job_data.status == JobListingStatus.PUBLISHED and not job.posted_at:
         job.posted_at = datetime.now(timezone.utc)
 
+    # Existing applications were scored against the old posting; the re-rank
+    # job is debounced, so a burst of edits costs one re-rank
+    if ranking_changed:
+        enqueue_event(
+            db,
+            "app/job_listing.updated",
+            {"job_listing_id": job.id, "organization_id": job.organization_id},
+        )
+
     db.commit()
+    if ranking_changed:
+        outbox_relay.notify()
     db.refresh(job)
+    job_listing_cache.invalidate()
 
     return job
 
 
 @router.get("/{job_id}", response_model=JobListingResponse)
-def get_job_listing(job_id: str, db: Annotated[Session, Depends(get_db)]):
+def get_job_listing(
+    job_id: str, request: Request, db: Annotated[Session, Depends(get_db)]
+):
     """Get a single job listing (public)"""
+    # A warm cache answers both full and 304 responses without touching the DB
+    cache_key = job_listing_cache.make_key("job", job_id)
+    cached = job_listing_cache.get(cache_key)
+    if cached is not None:
+        return json_response(request, cached.body, cached.etag, PUBLIC_CACHE_CONTROL)
+
     job = db.query(JobListings).filter(JobListings.id == job_id).first()
     if not job:
         raise HTTPException(status_code=404, detail="Job listing not found")
-    return job
+
+    body = JobListingResponse.model_validate(job).model_dump_json().encode()
+    entry = job_listing_cache.set(cache_key, body)
+    return json_response(request, entry.body, entry.etag, PUBLIC_CACHE_CONTROL)
 
 
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -205,9 +481,10 @@ def delete_job_listing(
         raise HTTPException(status_code=404, detail="Job listing not found")
 
     # Check permission
-    check_org_permission(job.organization_id, current_user.id, db)
+    check_org_permission(job.organization_id, current_user, db)
 
     db.delete(job)
     db.commit()
+    job_listing_cache.invalidate()
 
     return None
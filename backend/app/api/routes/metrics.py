@@ -0,0 +1,55 @@
+# app/api/routes/metrics.py
+import hmac
+import ipaddress
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import PlainTextResponse
+
+from app.config import settings
+from app.core.metrics import CONTENT_TYPE, job_runner_metrics, registry
+
+router = APIRouter(tags=["metrics"])
+
+
+def _is_loopback(host: str) -> bool:
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def require_metrics_access(request: Request) -> None:
+    """Metrics expose routes, queue depths and error rates: scrapers present
+    METRICS_TOKEN as a bearer token; without a token configured, only
+    loopback clients (a sidecar or local agent) are allowed"""
+    if settings.METRICS_TOKEN:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() == "bearer" and hmac.compare_digest(
+            token.encode(), settings.METRICS_TOKEN.encode()
+        ):
+            return
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if request.client is None or not _is_loopback(request.client.host):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Metrics are only served to loopback clients",
+        )
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+    dependencies=[Depends(require_metrics_access)],
+)
+def get_metrics(request: Request):
+    """Prometheus scrape endpoint"""
+    extra = []
+    job_runner = getattr(request.app.state, "job_runner", None)
+    if job_runner is not None:
+        extra = job_runner_metrics(job_runner.stats())
+    return PlainTextResponse(registry.render(extra), media_type=CONTENT_TYPE)
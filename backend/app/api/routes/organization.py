@@ -1,10 +1,13 @@
 import uuid
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_active_user
+from app.api.deps import get_current_active_user, require_org_role
+from app.api.pagination import PageParams, page_headers, page_params, paginate
+from app.core.services.authorization import org_authorization
+from app.core.services.cache import job_listing_cache
 from app.db.database import get_db
 from app.models.organization import Organizations
 from app.models.organization_member import MemberRole, OrganizationMember
@@ -25,17 +28,8 @@ router = APIRouter(prefix="/organizations", tags=["organizations"])
 
 def check_org_ownership(org_id: str, user: User, db: Session) -> Organizations:
     """Helper to verify organization ownership"""
-    org = db.query(Organizations).filter(Organizations.id == org_id).first()
-    if not org:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found"
-        )
-    if org.owner_user_id != user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to access this organization",
-        )
-    return org
+    require_org_role(org_id, user, db, {MemberRole.OWNER})
+    return db.get(Organizations, org_id)
 
 
 @router.post(
@@ -58,6 +52,7 @@ def create_organization(
     db.add(new_org)
     db.commit()
     db.refresh(new_org)
+    org_authorization.invalidate_user(current_user.id)
     return new_org
 
 
@@ -132,6 +127,8 @@ def update_organization(
 
     db.commit()
     db.refresh(org)
+    # Job listing responses embed the organization name
+    job_listing_cache.invalidate()
     return org
 
 
@@ -145,52 +142,46 @@ def delete_organization(
     org = check_org_ownership(org_id, current_user, db)
     db.delete(org)
     db.commit()
+    org_authorization.invalidate_organization(org_id)
+    job_listing_cache.invalidate()
     return None
 
 
 @router.get("/{org_id}/members", response_model=List[OrganizationMemberResponse])
 def get_organization_members(
     org_id: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
+    page: PageParams = Depends(page_params),
 ):
     """Get all members of an organization"""
-    # Check if user has access to org
-    org = db.query(Organizations).filter(Organizations.id == org_id).first()
-    if not org:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found"
-        )
-
     # Check if user is owner or member
-    is_owner = org.owner_user_id == current_user.id
-    is_member = (
-        db.query(OrganizationMember)
-        .filter(
-            OrganizationMember.organization_id == org_id,
-            OrganizationMember.user_id == current_user.id,
-        )
-        .first()
-        is not None
+    require_org_role(
+        org_id,
+        current_user,
+        db,
+        set(MemberRole),
+        detail="You don't have permission to view this organization's members",
     )
 
-    if not is_owner and not is_member:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to view this organization's members",
-        )
-
     # Get all members
-    members = (
+    query = (
         db.query(OrganizationMember, User)
         .join(User, OrganizationMember.user_id == User.id)
         .filter(OrganizationMember.organization_id == org_id)
-        .all()
     )
+    members = paginate(
+        query,
+        page,
+        [(OrganizationMember.added_at, False), (OrganizationMember.user_id, False)],
+    )
+    response.headers.update(page_headers(request, members))
 
     # Format response
     result = []
-    for member, user in members:
+    for member, user in members.items:
         result.append(
             OrganizationMemberResponse(
                 organization_id=member.organization_id,
@@ -218,28 +209,13 @@ def add_organization_member(
 ):
     """Add a member to an organization (owner or admin only)"""
     # Check if user is owner or admin
-    org = db.query(Organizations).filter(Organizations.id == org_id).first()
-    if not org:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found"
-        )
-
-    is_owner = org.owner_user_id == current_user.id
-    user_membership = (
-        db.query(OrganizationMember)
-        .filter(
-            OrganizationMember.organization_id == org_id,
-            OrganizationMember.user_id == current_user.id,
-        )
-        .first()
+    require_org_role(
+        org_id,
+        current_user,
+        db,
+        {MemberRole.OWNER, MemberRole.ADMIN},
+        detail="Only organization owners and admins can add members",
     )
-    is_admin = user_membership and user_membership.role == MemberRole.ADMIN
-
-    if not is_owner and not is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only organization owners and admins can add members",
-        )
 
     # Check if user exists
     target_user = db.query(User).filter(User.id == member_data.user_id).first()
@@ -272,6 +248,7 @@ def add_organization_member(
     db.add(new_member)
     db.commit()
     db.refresh(new_member)
+    org_authorization.invalidate_user(member_data.user_id)
 
     return OrganizationMemberResponse(
         organization_id=new_member.organization_id,
@@ -293,28 +270,13 @@ def update_member_role(
 ):
     """Update a member's role (owner or admin only)"""
     # Check if user is owner or admin
-    org = db.query(Organizations).filter(Organizations.id == org_id).first()
-    if not org:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found"
-        )
-
-    is_owner = org.owner_user_id == current_user.id
-    user_membership = (
-        db.query(OrganizationMember)
-        .filter(
-            OrganizationMember.organization_id == org_id,
-            OrganizationMember.user_id == current_user.id,
-        )
-        .first()
+    require_org_role(
+        org_id,
+        current_user,
+        db,
+        {MemberRole.OWNER, MemberRole.ADMIN},
+        detail="Only organization owners and admins can update member roles",
     )
-    is_admin = user_membership and user_membership.role == MemberRole.ADMIN
-
-    if not is_owner and not is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only organization owners and admins can update member roles",
-        )
 
     # Get member
     member = (
@@ -334,6 +296,7 @@ def update_member_role(
     member.role = MemberRole(member_data.role)
     db.commit()
     db.refresh(member)
+    org_authorization.invalidate_user(user_id)
 
     # Get user details
     user = db.query(User).filter(User.id == user_id).first()
@@ -357,28 +320,13 @@ def remove_organization_member(
 ):
     """Remove a member from an organization (owner or admin only)"""
     # Check if user is owner or admin
-    org = db.query(Organizations).filter(Organizations.id == org_id).first()
-    if not org:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found"
-        )
-
-    is_owner = org.owner_user_id == current_user.id
-    user_membership = (
-        db.query(OrganizationMember)
-        .filter(
-            OrganizationMember.organization_id == org_id,
-            OrganizationMember.user_id == current_user.id,
-        )
-        .first()
+    require_org_role(
+        org_id,
+        current_user,
+        db,
+        {MemberRole.OWNER, MemberRole.ADMIN},
+        detail="Only organization owners and admins can remove members",
     )
-    is_admin = user_membership and user_membership.role == MemberRole.ADMIN
-
-    if not is_owner and not is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only organization owners and admins can remove members",
-        )
 
     # Get member
     member = (
@@ -395,7 +343,12 @@ def remove_organization_member(
         )
 
     # Prevent removing the owner
-    if user_id == org.owner_user_id:
+    owner_user_id = (
+        db.query(Organizations.owner_user_id)
+        .filter(Organizations.id == org_id)
+        .scalar()
+    )
+    if user_id == owner_user_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot remove the organization owner",
@@ -404,4 +357,5 @@ def remove_organization_member(
     # Remove member
     db.delete(member)
     db.commit()
+    org_authorization.invalidate_user(user_id)
     return None
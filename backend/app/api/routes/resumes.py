@@ -4,10 +4,9 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from sqlalchemy.orm import Session
-import inngest  # ← IMPORTANT: Add this import!
 
 from app.api.deps import get_current_active_user
-from app.core.background.inngest_client import inngest_client
+from app.core.services.outbox import enqueue_event, outbox_relay
 from app.db.database import get_db
 from app.models.candidates import Candidates
 from app.models.resume import Resume, ResumeParseStatus
@@ -17,22 +16,23 @@ from app.schemas.resume import ResumeResponse
 router = APIRouter(prefix="/resumes", tags=["resumes"])
 
 
-async def trigger_resume_parsing(candidate_id: int, file_content: bytes, file_type: str):
-    """Helper function to trigger resume parsing job"""
-    try:
-        await inngest_client.send(
-            inngest.Event(
-                name="app/resume.uploaded",
-                data={
-                    "candidate_id": candidate_id,
-                    "file_content": base64.b64encode(file_content).decode("utf-8"),
-                    "file_type": file_type,
-                },
-            )
-        )
-    except Exception as e:
-        # Log error but don't fail the upload
-        print(f"Error triggering resume parsing job: {e}")
+def trigger_resume_parsing(
+    db: Session, candidate_id: int, file_content: bytes, file_type: str
+):
+    """Helper function to trigger resume parsing job.
+
+    The event is staged in the outbox and committed together with the resume
+    row, so an upload is never left without its parse job.
+    """
+    enqueue_event(
+        db,
+        "app/resume.uploaded",
+        {
+            "candidate_id": candidate_id,
+            "file_content": base64.b64encode(file_content).decode("utf-8"),
+            "file_type": file_type,
+        },
+    )
 
 
 @router.post(
@@ -91,11 +91,12 @@ async def upload_resume(
         existing_resume.parse_status = ResumeParseStatus.PENDING
         existing_resume.extracted_text = None
         existing_resume.ai_summary = None
-        db.commit()
-        db.refresh(existing_resume)
 
         # Trigger background job to parse resume with AI
-        await trigger_resume_parsing(candidate.id, file_content, file_type)
+        trigger_resume_parsing(db, candidate.id, file_content, file_type)
+        db.commit()
+        outbox_relay.notify()
+        db.refresh(existing_resume)
 
         return existing_resume
 
@@ -109,11 +110,12 @@ async def upload_resume(
         parse_status=ResumeParseStatus.PENDING,
     )
     db.add(new_resume)
-    db.commit()
-    db.refresh(new_resume)
 
     # Trigger background job to parse resume with AI
-    await trigger_resume_parsing(candidate.id, file_content, file_type)
+    trigger_resume_parsing(db, candidate.id, file_content, file_type)
+    db.commit()
+    outbox_relay.notify()
+    db.refresh(new_resume)
 
     return new_resume
 
@@ -157,4 +159,4 @@ def delete_my_resume(
 
     db.delete(resume)
     db.commit()
-    return None
\ No newline at end of file
+    return None
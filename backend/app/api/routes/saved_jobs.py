@@ -1,10 +1,15 @@
 # app/api/routes/saved_jobs.py
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_active_user
+from app.api.http_cache import PRIVATE_CACHE_CONTROL, not_modified_response
+from app.api.pagination import PageParams, page_headers, page_params, paginate
+from app.api.serialization import FastJSONResponse, RowShape, parse_fields
+from app.core.services.cache import make_etag
 from app.db.database import get_db
 from app.models.job_listing import JobListings
 from app.models.saved_jobs import SavedJob
@@ -12,6 +17,33 @@ from app.models.user import User
 
 router = APIRouter(prefix="/saved-jobs", tags=["saved-jobs"])
 
+SAVED_JOB_SHAPE = RowShape(
+    {
+        "saved_at": SavedJob.saved_at,
+        "job_listing": {
+            "id": JobListings.id,
+            "title": JobListings.title,
+            "description": JobListings.description,
+            "organization_id": JobListings.organization_id,
+            "wage": JobListings.wage,
+            "wage_interval": JobListings.wage_interval,
+            "city": JobListings.city,
+            "state_abbreviation": JobListings.state_abbreviation,
+            "location_requirement": JobListings.location_requirement,
+            "experience_level": JobListings.experience_level,
+            "type": JobListings.type,
+            "status": JobListings.status,
+            "posted_at": JobListings.posted_at,
+        },
+    }
+)
+# Card view: the saved job without its unbounded description text
+SAVED_JOB_PRESETS = {
+    "summary": [
+        f for f in SAVED_JOB_SHAPE.field_names("job_listing") if f != "description"
+    ]
+}
+
 
 @router.post("/{job_id}", status_code=status.HTTP_201_CREATED)
 def save_job(
@@ -55,41 +87,73 @@ def save_job(
     }
 
 
-@router.get("/")
+@router.get("/", response_class=FastJSONResponse)
 def get_saved_jobs(
+    request: Request,
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
+    page: Annotated[PageParams, Depends(page_params)],
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated job_listing fields to return, or 'summary' "
+        "(all except description). Omit for the full listing.",
+    ),
 ):
     """Get all saved jobs for the current user"""
-    saved_jobs = (
-        db.query(SavedJob, JobListings)
+    fields = parse_fields(
+        fields,
+        SAVED_JOB_SHAPE.field_names("job_listing"),
+        SAVED_JOB_PRESETS,
+        required=["id"],
+    )
+    shape = (
+        SAVED_JOB_SHAPE.subset(fields, within="job_listing")
+        if fields
+        else SAVED_JOB_SHAPE
+    )
+
+    # Cheap version check so polling clients get a 304 before the full fetch
+    count, last_saved_at, last_job_update = (
+        db.query(
+            func.count(SavedJob.job_listing_id),
+            func.max(SavedJob.saved_at),
+            func.max(JobListings.updated_at),
+        )
         .join(JobListings, SavedJob.job_listing_id == JobListings.id)
         .filter(SavedJob.user_id == current_user.id)
-        .order_by(SavedJob.saved_at.desc())
-        .all()
+        .one()
+    )
+    etag = make_etag(
+        "saved-jobs",
+        current_user.id,
+        fields,
+        page.cursor,
+        page.limit,
+        count,
+        last_saved_at,
+        last_job_update,
     )
+    not_modified = not_modified_response(request, etag, PRIVATE_CACHE_CONTROL)
+    if not_modified:
+        return not_modified
 
-    return [
-        {
-            "saved_at": saved_job.saved_at,
-            "job_listing": {
-                "id": job.id,
-                "title": job.title,
-                "description": job.description,
-                "organization_id": job.organization_id,
-                "wage": job.wage,
-                "wage_interval": job.wage_interval.value if job.wage_interval else None,
-                "city": job.city,
-                "state_abbreviation": job.state_abbreviation,
-                "location_requirement": job.location_requirement.value,
-                "experience_level": job.experience_level.value,
-                "type": job.type.value,
-                "status": job.status.value,
-                "posted_at": job.posted_at,
-            },
-        }
-        for saved_job, job in saved_jobs
-    ]
+    query = (
+        db.query(*shape.columns)
+        .join(JobListings, SavedJob.job_listing_id == JobListings.id)
+        .filter(SavedJob.user_id == current_user.id)
+    )
+    saved_jobs = paginate(
+        query, page, [(SavedJob.saved_at, True), (SavedJob.job_listing_id, False)]
+    )
+
+    return shape.response(
+        saved_jobs.items,
+        headers={
+            **page_headers(request, saved_jobs),
+            "ETag": etag,
+            "Cache-Control": PRIVATE_CACHE_CONTROL,
+        },
+    )
 
 
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1,10 +1,12 @@
 from typing import Annotated, List
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_active_user
-from app.db.database import get_db
+from app.core.services.skill_dictionary import skill_dictionary
+from app.db.database import dialect_insert, get_db
 from app.models.candidates import Candidates
 from app.models.skills import CandidateSkill, Skill
 from app.models.user import User
@@ -12,9 +14,12 @@ from app.schemas.skill import (
     CandidateSkillCreate,
     CandidateSkillResponse,
     CandidateSkillUpdate,
+    CandidateSkillUpsert,
     SkillCreate,
     SkillResponse,
+    SkillSuggestion,
 )
+from app.utils.skills import clean_skill_name, normalize_skill_name
 
 router = APIRouter(prefix="/skills", tags=["skills"])
 
@@ -36,24 +41,48 @@ def list_all_skills(
     return skills
 
 
+@router.get("/autocomplete", response_model=List[SkillSuggestion])
+def autocomplete_skills(
+    db: Annotated[Session, Depends(get_db)],
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """Suggest skills by case-insensitive prefix, alias or close spelling"""
+    skill_dictionary.ensure_loaded(db)
+    return [
+        {"id": skill_id, "name": name}
+        for skill_id, name in skill_dictionary.search(q, limit)
+    ]
+
+
 @router.post("/", response_model=SkillResponse, status_code=status.HTTP_201_CREATED)
 def create_skill(
     skill_data: SkillCreate,
     db: Annotated[Session, Depends(get_db)],
 ):
     """Create a new skill (for demo - normally admin only)"""
-    # Check if skill already exists
-    existing = db.query(Skill).filter(Skill.name == skill_data.name).first()
+    # Check if skill already exists (case-insensitively, aliases included)
+    skill_dictionary.ensure_loaded(db)
+    name = clean_skill_name(skill_data.name)
+    skill_id = skill_dictionary.resolve(name)
+    if skill_id is not None:
+        existing = db.get(Skill, skill_id)
+    else:
+        # Created by another worker since the dictionary was loaded
+        existing = (
+            db.query(Skill).filter(func.lower(Skill.name) == name.lower()).first()
+        )
     if existing:
         return existing  # Return existing skill instead of error
 
     new_skill = Skill(
-        name=skill_data.name,
+        name=name,
         category=skill_data.category,
     )
     db.add(new_skill)
     db.commit()
     db.refresh(new_skill)
+    skill_dictionary.add(new_skill.id, new_skill.name)
     return new_skill
 
 
@@ -147,6 +176,117 @@ def add_my_skill(
     )
 
 
+@router.put("/my-skills", response_model=List[CandidateSkillResponse])
+def upsert_my_skills(
+    skills_data: Annotated[
+        List[CandidateSkillUpsert], Body(min_length=1, max_length=200)
+    ],
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[Session, Depends(get_db)],
+):
+    """Add or update many skills on current user's profile in one request.
+
+    Skills are given by id or by name; names are matched case-insensitively
+    and unknown names are created as new skills.
+    """
+    candidate_id = (
+        db.query(Candidates.id).filter(Candidates.user_id == current_user.id).scalar()
+    )
+    if not candidate_id:
+        raise HTTPException(
+            status_code=404, detail="Candidate profile not found. Create one first."
+        )
+
+    skill_dictionary.ensure_loaded(db)
+    names = {}  # skill_id -> name, for the response
+
+    # Skill ids unknown to the dictionary may have been created by another worker
+    unknown_ids = {
+        item.skill_id
+        for item in skills_data
+        if item.skill_id is not None and skill_dictionary.name_of(item.skill_id) is None
+    }
+    if unknown_ids:
+        found = db.query(Skill.id, Skill.name).filter(Skill.id.in_(unknown_ids)).all()
+        names.update(found)
+        missing = unknown_ids - set(names)
+        if missing:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Skills not found: {', '.join(map(str, sorted(missing)))}",
+            )
+
+    # Create skills for names the dictionary doesn't know (never a blank one)
+    new_names = {
+        normalize_skill_name(item.name): clean_skill_name(item.name)
+        for item in skills_data
+        if item.name is not None and skill_dictionary.resolve(item.name) is None
+    }
+    if "" in new_names:
+        raise HTTPException(status_code=422, detail="Skill name must not be blank")
+    resolved = {}
+    if new_names:
+        # Other workers may have created some of them, in any letter case
+        lowered = [name.lower() for name in new_names.values()]
+        for skill_id, name in (
+            db.query(Skill.id, Skill.name)
+            .filter(func.lower(Skill.name).in_(lowered))
+            .all()
+        ):
+            resolved[normalize_skill_name(name)] = skill_id
+            names[skill_id] = name
+        created = [name for key, name in new_names.items() if key not in resolved]
+        if created:
+            db.execute(
+                dialect_insert(Skill)
+                .values([{"name": name} for name in created])
+                .on_conflict_do_nothing(index_elements=["name"])
+            )
+            for skill_id, name in (
+                db.query(Skill.id, Skill.name).filter(Skill.name.in_(created)).all()
+            ):
+                resolved[normalize_skill_name(name)] = skill_id
+                names[skill_id] = name
+
+    # One row per skill; a skill listed twice keeps its last values
+    rows = {}
+    for item in skills_data:
+        if item.skill_id is not None:
+            skill_id = item.skill_id
+        else:
+            skill_id = skill_dictionary.resolve(item.name) or resolved.get(
+                normalize_skill_name(item.name)
+            )
+        rows[skill_id] = {
+            "candidate_id": candidate_id,
+            "skill_id": skill_id,
+            "proficiency_level": item.proficiency_level,
+            "years_experience": item.years_experience,
+        }
+
+    statement = dialect_insert(CandidateSkill).values(list(rows.values()))
+    statement = statement.on_conflict_do_update(
+        index_elements=["candidate_id", "skill_id"],
+        set_={
+            "proficiency_level": statement.excluded.proficiency_level,
+            "years_experience": statement.excluded.years_experience,
+        },
+    )
+    db.execute(statement)
+    db.commit()
+    skill_dictionary.add_many(names.items())
+
+    return [
+        CandidateSkillResponse(
+            skill_id=row["skill_id"],
+            skill_name=skill_dictionary.name_of(row["skill_id"]),
+            proficiency_level=row["proficiency_level"],
+            years_experience=row["years_experience"],
+        )
+        for row in rows.values()
+    ]
+
+
 @router.patch("/my-skills/{skill_id}", response_model=CandidateSkillResponse)
 def update_my_skill(
     skill_id: int,
@@ -0,0 +1,171 @@
+# app/api/serialization.py
+import csv
+import datetime as dt
+import enum
+import io
+import json
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from fastapi import HTTPException, Response, status
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (dt.datetime, dt.date, dt.time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize plain Python data (incl. datetimes and str enums) to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(
+        content, default=_json_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """JSON response that skips jsonable_encoder and serializes with orjson.
+
+    Opt-in per route: return it directly with plain dicts/lists (or bytes that
+    are already serialized, e.g. from `RowShape.dumps`).
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+ShapeSpec = Mapping[str, Union[Any, "ShapeSpec"]]
+
+
+class RowShape:
+    """Precompiled serializer from flat SELECT rows to (nested) dicts.
+
+    The spec maps output keys to SQLAlchemy columns, or to nested specs for
+    nested objects. `columns` is the flat column list to select; `to_dict` is
+    built once from an `operator.itemgetter` per row index, so a row costs no
+    attribute access or `.value` lookups (enums are emitted as their string
+    values by the JSON encoder).
+    """
+
+    def __init__(self, spec: ShapeSpec):
+        self.spec = spec
+        self.columns: List[Any] = []
+        self.to_dict = self._compile(spec)
+        self._subsets: Dict[Tuple[Tuple[str, ...], Optional[str]], "RowShape"] = {}
+
+    def _compile(self, spec: ShapeSpec) -> Callable[[Sequence[Any]], Dict[str, Any]]:
+        getters = []
+        for key, value in spec.items():
+            if isinstance(value, Mapping):
+                getters.append((key, self._compile(value)))
+            else:
+                getters.append((key, itemgetter(len(self.columns))))
+                self.columns.append(value)
+        return lambda row: {key: get(row) for key, get in getters}
+
+    def field_names(self, within: Optional[str] = None) -> List[str]:
+        """Output keys at the top level, or inside the nested `within` object"""
+        spec = self.spec if within is None else self.spec[within]
+        return list(spec)
+
+    def subset(self, fields: Sequence[str], within: Optional[str] = None) -> "RowShape":
+        """Shape restricted to `fields`, compiled once per distinct field set"""
+        key = (tuple(fields), within)
+        shape = self._subsets.get(key)
+        if shape is None:
+            if within is None:
+                spec = {k: v for k, v in self.spec.items() if k in fields}
+            else:
+                nested = {k: v for k, v in self.spec[within].items() if k in fields}
+                spec = {**self.spec, within: nested}
+            shape = self._subsets[key] = RowShape(spec)
+        return shape
+
+    def to_list(self, rows: Iterable[Sequence[Any]]) -> List[Dict[str, Any]]:
+        to_dict = self.to_dict
+        return [to_dict(row) for row in rows]
+
+    def dumps(self, rows: Iterable[Sequence[Any]]) -> bytes:
+        return dumps(self.to_list(rows))
+
+    def dumps_lines(self, rows: Iterable[Sequence[Any]]) -> bytes:
+        """Serialize rows as newline-delimited JSON (one object per line)"""
+        to_dict = self.to_dict
+        return b"".join(dumps(to_dict(row)) + b"\n" for row in rows)
+
+    def response(
+        self,
+        rows: Iterable[Sequence[Any]],
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> FastJSONResponse:
+        return FastJSONResponse(content=self.dumps(rows), headers=headers)
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (dt.datetime, dt.date, dt.time)):
+        return value.isoformat()
+    return value
+
+
+def csv_bytes(rows: Iterable[Sequence[Any]]) -> bytes:
+    """Encode rows as CSV lines (enums as values, datetimes as ISO 8601)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def parse_fields(
+    raw: Optional[str],
+    allowed: Sequence[str],
+    presets: Optional[Mapping[str, Sequence[str]]] = None,
+    required: Sequence[str] = (),
+) -> Optional[Tuple[str, ...]]:
+    """Parse a sparse fieldset (`fields=a,b,summary`) into allowed field names.
+
+    Preset names expand to their field lists. Returns None when no fieldset was
+    requested, so the caller keeps its full response. The result follows the
+    order of `allowed`, so equivalent requests share one compiled shape.
+    """
+    if not raw:
+        return None
+    presets = presets or {}
+    selected = set(required)
+    for name in (part.strip() for part in raw.split(",")):
+        if not name:
+            continue
+        for field in presets.get(name, (name,)):
+            if field not in allowed:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unknown field '{field}'. Allowed fields: "
+                    + ", ".join([*presets, *allowed]),
+                )
+            selected.add(field)
+    return tuple(field for field in allowed if field in selected)
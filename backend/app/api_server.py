@@ -0,0 +1,92 @@
+# app/api_server.py
+# API-only entry point: uvicorn app.api_server:create_app --factory
+#
+# Registers no background job functions, so API workers never import the job
+# modules or what they pull in (Inngest functions, PDF/DOCX parsers, the LLM
+# SDK). Run app.worker next to it for the jobs, or app.main for both in one
+# process (required with JOB_BACKEND=local).
+from app.api.routes import (
+    admin_router,
+    applications_router,
+    auth_router,
+    candidates_router,
+    dashboard_router,
+    job_listing_router,
+    metrics_router,
+    organization_router,
+    resumes_router,
+    saved_jobs_router,
+    skills_router,
+)
+from app.api.instrumentation import MetricsMiddleware, install_query_hooks
+from app.config import settings
+from app.core.services.outbox import outbox_relay
+from app.core.services.skill_dictionary import skill_dictionary
+from app.db import init_db
+from app.db.database import SessionLocal, engine
+from dotenv import load_dotenv
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+# Load environment variables first
+load_dotenv()
+
+
+async def lifespan(app: FastAPI):
+    # Startup
+    init_db()
+    with SessionLocal() as db:
+        skill_dictionary.load(db)
+    app.state.job_runner = None
+    # Events staged by the routes are relayed from here
+    async with outbox_relay.running():
+        yield
+
+
+def create_app(lifespan=lifespan) -> FastAPI:
+    app = FastAPI(title="JobLinker API", lifespan=lifespan)
+
+    # CORS middleware - allow all origins
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=False,  # Must be False when allow_origins is ["*"]
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["ETag", "Link", "X-Next-Cursor", "X-Total-Count"],
+    )
+
+    # Request latency, response size and per-request SQL statement metrics
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+        install_query_hooks(engine)
+
+    # Include routers
+    app.include_router(auth_router)
+    app.include_router(applications_router)
+    app.include_router(dashboard_router)
+    app.include_router(job_listing_router)
+    app.include_router(organization_router)
+    app.include_router(candidates_router)
+    app.include_router(skills_router)
+    app.include_router(resumes_router)
+    app.include_router(saved_jobs_router)
+    app.include_router(admin_router)
+    if settings.METRICS_ENABLED:
+        app.include_router(metrics_router)
+
+    @app.get("/")
+    async def root():
+        return {"message": "JobLinker API", "version": settings.VERSION}
+
+    @app.get("/health")
+    async def health_check():
+        health = {"status": "healthy", "version": settings.VERSION}
+        job_runner = getattr(app.state, "job_runner", None)
+        if job_runner is not None:
+            # Queue depth and wait times per lane of the in-process runner
+            health["jobs"] = job_runner.stats()
+        return health
+
+    return app
+
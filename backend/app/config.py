@@ -1,5 +1,5 @@
 # app/config.py
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,9 +18,46 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    MAX_ACTIVE_REFRESH_TOKENS_PER_USER: int = 10
+
+    # Refresh token cleanup (background sweeper)
+    REFRESH_TOKEN_CLEANUP_CRON: str = "0 * * * *"  # Every hour
+    REFRESH_TOKEN_CLEANUP_BATCH_SIZE: int = 1000
+    REFRESH_TOKEN_CLEANUP_MAX_BATCHES: int = 50
+
+    # Caching
+    ORG_PERMISSION_CACHE_TTL_SECONDS: int = 60
+    # memory:// is per worker; redis://host:6379/0 shares entries across workers
+    CACHE_BACKEND_URL: str = "memory://"
+    CACHE_MAX_ENTRIES: int = 2048
+    JOB_LISTING_CACHE_TTL_SECONDS: int = 30  # 0 disables the job listing cache
+    JOB_LISTING_CACHE_MAX_SKIP: int = 100  # Only the first pages are cached
+
+    # HTTP caching (Cache-Control for public endpoints, CDN/reverse proxy)
+    PUBLIC_CACHE_MAX_AGE_SECONDS: int = 30
+    PUBLIC_CACHE_STALE_WHILE_REVALIDATE_SECONDS: int = 60
+
+    # Cursor pagination for list endpoints
+    PAGE_SIZE_DEFAULT: int = 50
+    PAGE_SIZE_MAX: int = 200
+
+    # Bulk job listing import
+    JOB_LISTING_BULK_MAX_ROWS: int = 5000
+    JOB_LISTING_BULK_CHUNK_SIZE: int = 500  # Rows per INSERT/commit
 
     # AI Services
     GEMINI_API_KEY: Optional[str] = None
+    LLM_PROVIDER: str = "gemini"  # "gemini" or "fake" (offline, for load tests)
+    LLM_MODEL: str = "gemini-2.5-flash"
+    LLM_CACHE_SIZE: int = 0  # >0 caches responses to identical prompts (LRU)
+    # Price per million tokens, for cost estimates
+    LLM_INPUT_COST_PER_MTOK: float = 0.30
+    LLM_OUTPUT_COST_PER_MTOK: float = 2.50
+    # Fake provider: log-normal latency, share of calls rejected as rate limited
+    LLM_FAKE_LATENCY_MEDIAN_SECONDS: float = 1.5
+    LLM_FAKE_LATENCY_SIGMA: float = 0.5
+    LLM_FAKE_RATE_LIMIT_RATE: float = 0.0
+    LLM_FAKE_SEED: int = 0
 
     # Inngest
     INNGEST_BASE_URL: Optional[str] = None
@@ -34,6 +71,60 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: Optional[str] = None
     EMAIL_FROM: str = "noreply@joblinker.com"
     EMAIL_FROM_NAME: str = "JobLinker"
+    SMTP_USE_TLS: bool = True  # STARTTLS; disable for local test servers
+    SMTP_POOL_SIZE: int = 4  # Concurrent connections used by batched sends
+    SMTP_TIMEOUT_SECONDS: int = 30
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100
+
+    # Daily application digest for employers
+    DAILY_DIGEST_CRON: str = "0 9 * * *"  # Every day at 9 AM
+    DAILY_DIGEST_BATCH_SIZE: int = 500  # Organizations per step
+    DAILY_DIGEST_TOP_MATCHES: int = 10
+
+    # Transactional outbox for background events
+    OUTBOX_RELAY_ENABLED: bool = True  # Run the relay loop in this process
+    OUTBOX_PUBLISHER: str = "inngest"  # "inngest" or "local" (in-process queue)
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 1.0
+    OUTBOX_MAX_ATTEMPTS: int = 10  # Rows that exhaust retries stay for inspection
+    OUTBOX_RETRY_BASE_SECONDS: int = 2
+    OUTBOX_RETRY_MAX_SECONDS: int = 300
+
+    # Background jobs
+    JOB_BACKEND: str = "inngest"  # "inngest" or "local" (in-process runner)
+    RANKING_CONCURRENCY: int = 8  # Ranking runs at once, leaving room for parsing
+    RANKING_CONCURRENCY_PER_ORG: int = 2  # So one employer can't take every slot
+    RERANK_DEBOUNCE_SECONDS: int = 300  # Coalesce edits made within this window
+    RERANK_LLM_FINALISTS: int = 20  # Top keyword matches re-scored by the LLM
+    LOCAL_RUNNER_WORKERS: int = 8  # Runs at once across all functions
+    LOCAL_RUNNER_CONCURRENCY: int = 4  # Concurrent runs per function
+    # Lane priority per function id (higher is scheduled first, default 0)
+    LOCAL_RUNNER_PRIORITIES: Dict[str, int] = {"parse-resume": 10, "rank-applicant": 5}
+    # Fair-queuing weight per organization id (default 1.0)
+    LOCAL_RUNNER_ORG_WEIGHTS: Dict[str, float] = {}
+    LOCAL_RUNNER_RETRIES: int = 3  # For functions without their own `retries`
+    LOCAL_RUNNER_RETRY_BASE_SECONDS: float = 1.0
+    LOCAL_RUNNER_PROCESS_WORKERS: int = 0  # >0 runs module-level steps in processes
+
+    # Metrics
+    METRICS_ENABLED: bool = True  # Request/SQL metrics middleware and /metrics
+    METRICS_N_PLUS_ONE_THRESHOLD: int = 10  # Same statement this often = N+1
+    # Bearer token for scraping /metrics; without one only loopback clients may
+    METRICS_TOKEN: Optional[str] = None
+    PIPELINE_STATS_WINDOW_MINUTES: int = 60  # Default window of /admin/pipeline-stats
+    PIPELINE_STATS_MAX_RUNS: int = 5000  # Most recent runs summarized per job
+
+    # Logging
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"  # "text" (key=value) or "json"
+    LOG_MAX_FIELD_CHARS: int = 512  # Longer field values are truncated
+    # Fraction of records kept per event name, for chatty events
+    LOG_SAMPLE_RATES: Dict[str, float] = {"email.sent": 0.1}
+    LOG_QUEUE_SIZE: int = 10000  # Records beyond this are dropped, never blocking
+    LOG_DEBUG_PAYLOADS: bool = False  # Log event payloads and text previews
+
+    # Operators allowed to use the /admin endpoints
+    ADMIN_EMAILS: List[str] = []
 
     # Server
     HOST: str = "0.0.0.0"
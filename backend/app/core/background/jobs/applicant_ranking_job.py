@@ -1,18 +1,68 @@
 # app/core/background/jobs/applicant_ranking_job.py
 import json
+import time
+from datetime import datetime, timezone
 from typing import Optional
 
-import google.generativeai as genai
 import inngest
 from app.config import settings
 from app.core.background.inngest_client import inngest_client
+from app.core.log import get_logger
+from app.core.metrics import StageTimer
+from app.core.services.llm import RateLimitError, get_llm_provider
+from app.core.services.match_scoring import input_fingerprint, ranking_inputs
 from app.db.database import SessionLocal
 from app.models.application import JobListingApplication
+from app.models.candidates import Candidates
 from app.models.job_listing import JobListings
 from app.models.resume import Resume
 
+log = get_logger("app.jobs.ranking")
 
-def calculate_match_score_with_gemini(
+
+# The exact shape the LLM must return
+MATCH_SCORE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "overall_score": {"type": "integer"},
+        "breakdown": {
+            "type": "object",
+            "properties": {
+                "technical_skills": {"type": "integer"},
+                "experience": {"type": "integer"},
+                "education": {"type": "integer"},
+                "application_quality": {"type": "integer"},
+            },
+            "required": [
+                "technical_skills",
+                "experience",
+                "education",
+                "application_quality",
+            ],
+        },
+        "reasoning": {"type": "string"},
+        "key_strengths": {
+            "type": "array",
+            "items": {"type": "string"},
+        },
+        "concerns": {
+            "type": "array",
+            "items": {"type": "string"},
+        },
+        "recommendation": {"type": "string"},
+    },
+    "required": [
+        "overall_score",
+        "breakdown",
+        "reasoning",
+        "key_strengths",
+        "concerns",
+        "recommendation",
+    ],
+}
+
+
+def calculate_match_score(
     job_title: str,
     job_description: str,
     experience_level: str,
@@ -24,8 +74,9 @@ def calculate_match_score_with_gemini(
     min_years_experience: Optional[int] = None,
     required_education: Optional[str] = None,
 ) -> dict:
-    """Calculate match score using Gemini with JSON mode"""
-    if not settings.GEMINI_API_KEY:
+    """Calculate match score with the configured LLM provider in JSON mode"""
+    provider = get_llm_provider()
+    if provider is None:
         return {
             "rating": None,
             "reasoning": "No API key configured",
@@ -34,55 +85,6 @@ def calculate_match_score_with_gemini(
         }
 
     try:
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        
-        # Define the exact schema Gemini should return
-        model = genai.GenerativeModel(
-            "gemini-2.5-flash",
-            generation_config={
-                "response_mime_type": "application/json",
-                "response_schema": {
-                    "type": "object",
-                    "properties": {
-                        "overall_score": {"type": "integer"},
-                        "breakdown": {
-                            "type": "object",
-                            "properties": {
-                                "technical_skills": {"type": "integer"},
-                                "experience": {"type": "integer"},
-                                "education": {"type": "integer"},
-                                "application_quality": {"type": "integer"},
-                            },
-                            "required": [
-                                "technical_skills",
-                                "experience",
-                                "education",
-                                "application_quality",
-                            ],
-                        },
-                        "reasoning": {"type": "string"},
-                        "key_strengths": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                        },
-                        "concerns": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                        },
-                        "recommendation": {"type": "string"},
-                    },
-                    "required": [
-                        "overall_score",
-                        "breakdown",
-                        "reasoning",
-                        "key_strengths",
-                        "concerns",
-                        "recommendation",
-                    ],
-                },
-            },
-        )
-
         # Build prompt with actual data
         prompt = f"""You are an expert recruiter conducting initial candidate screening.
 
@@ -146,7 +148,7 @@ Return valid JSON with:
 - If information is insufficient, score conservatively and note in reasoning
 - Focus on job-relevant qualifications"""
 
-        response = model.generate_content(prompt)
+        response = provider.generate(prompt, response_schema=MATCH_SCORE_SCHEMA)
         result = json.loads(response.text)
 
         # Validate and return
@@ -159,8 +161,11 @@ Return valid JSON with:
             "recommendation": result.get("recommendation", "INSUFFICIENT_DATA"),
         }
 
+    except RateLimitError:
+        # Fail the step so it is retried later
+        raise
     except Exception as e:
-        print(f"Error calculating match score with Gemini: {e}")
+        log.warning("ranking.llm_failed", job_title=job_title, error=e)
         return {
             "rating": None,
             "reasoning": f"Error: {str(e)}",
@@ -169,9 +174,27 @@ Return valid JSON with:
         }
 
 
+def score_application(inputs: dict) -> dict:
+    """Match score plus how long it took, measured inside the step so the
+    duration is recorded once even though Inngest replays the function"""
+    started_at = time.perf_counter()
+    result = calculate_match_score(**inputs)
+    result["duration_seconds"] = round(time.perf_counter() - started_at, 6)
+    return result
+
+
 @inngest_client.create_function(
     fn_id="rank-applicant",
     trigger=inngest.TriggerEvent(event="app/application.created"),
+    # A global cap keeps capacity free for resume parsing; the per-organization
+    # key makes Inngest share ranking slots fairly between employers
+    concurrency=[
+        inngest.Concurrency(limit=settings.RANKING_CONCURRENCY),
+        inngest.Concurrency(
+            limit=settings.RANKING_CONCURRENCY_PER_ORG,
+            key="event.data.organization_id",
+        ),
+    ],
 )
 async def rank_applicant_job(ctx, step):
     event_data = ctx.event.data
@@ -179,62 +202,61 @@ async def rank_applicant_job(ctx, step):
     candidate_id = event_data["candidate_id"]
 
     db = SessionLocal()
+    timer = StageTimer("rank-applicant")
     try:
-        # Get application with related data
-        application = (
-            db.query(JobListingApplication)
-            .filter(
-                JobListingApplication.job_listing_id == job_listing_id,
-                JobListingApplication.user_id == candidate_id,
+        with timer.stage("load"):
+            # Get application with related data (applications are keyed by the
+            # candidate's user id, the event carries the candidate profile id)
+            application = (
+                db.query(JobListingApplication)
+                .join(Candidates, Candidates.user_id == JobListingApplication.user_id)
+                .filter(
+                    JobListingApplication.job_listing_id == job_listing_id,
+                    Candidates.id == candidate_id,
+                )
+                .first()
             )
-            .first()
-        )
 
-        if not application:
-            return {"error": "Application not found"}
+            if not application:
+                return {"error": "Application not found"}
 
-        # Get job listing
-        job = db.query(JobListings).filter(JobListings.id == job_listing_id).first()
+            # Get job listing
+            job = db.query(JobListings).filter(JobListings.id == job_listing_id).first()
 
-        # Get resume
-        resume = db.query(Resume).filter(Resume.candidate_id == candidate_id).first()
+            # Get resume
+            resume = db.query(Resume).filter(Resume.candidate_id == candidate_id).first()
 
-        if not job:
-            return {"error": "Job listing not found"}
+            if not job:
+                return {"error": "Job listing not found"}
 
-        # Extract job details (with safe fallbacks)
-        required_skills = getattr(job, "required_skills", None)
-        preferred_skills = getattr(job, "preferred_skills", None)
-        min_years = getattr(job, "min_years_experience", None)
-        required_education = getattr(job, "required_education", None)
+            inputs = ranking_inputs(
+                job, resume.ai_summary if resume else None, application.cover_letter
+            )
+            fingerprint = input_fingerprint(inputs)
+            if application.input_fingerprint == fingerprint:
+                return {"success": True, "skipped": "Rating is up to date"}
 
         # Calculate match score using Gemini
-        result = await step.run(
-            "calculate-match-score",
-            lambda: calculate_match_score_with_gemini(
-                job_title=job.title,
-                job_description=job.description or "",
-                experience_level=job.experience_level.value if hasattr(job.experience_level, 'value') else str(job.experience_level),
-                job_type=job.type.value if hasattr(job.type, 'value') else str(job.type),
-                resume_summary=resume.ai_summary if resume and resume.ai_summary else "No resume provided",
-                cover_letter=application.cover_letter or "",
-                required_skills=required_skills,
-                preferred_skills=preferred_skills,
-                min_years_experience=min_years,
-                required_education=required_education,
-            ),
-        )
+        result = await step.run("calculate-match-score", score_application, inputs)
+        timer.record("score", result.get("duration_seconds", 0.0))
 
         if result.get("rating") is not None:
-            application.rating = result["rating"]
-            application.ai_analysis = result["reasoning"]
-            
-            # Store additional data if your model supports it
-            if hasattr(application, "match_breakdown"):
-                application.match_breakdown = json.dumps(result.get("breakdown", {}))
-            if hasattr(application, "recommendation"):
-                application.recommendation = result.get("recommendation")
-            
+            with timer.stage("persist"):
+                application.rating = result["rating"]
+                application.ai_analysis = result["reasoning"]
+                application.input_fingerprint = fingerprint
+                application.ranked_at = datetime.now(timezone.utc)
+
+                # Store additional data if your model supports it
+                if hasattr(application, "match_breakdown"):
+                    application.match_breakdown = json.dumps(result.get("breakdown", {}))
+                if hasattr(application, "recommendation"):
+                    application.recommendation = result.get("recommendation")
+
+                db.flush()
+            # Stored with the results (the timings cover everything up to the flush)
+            timings = timer.observe()
+            application.rank_timings = timings
             db.commit()
             
             return {
@@ -243,12 +265,18 @@ async def rank_applicant_job(ctx, step):
                 "reasoning": result["reasoning"],
                 "breakdown": result.get("breakdown"),
                 "recommendation": result.get("recommendation"),
+                "timings": timings,
             }
         else:
+            timer.observe()
             return {"error": "Failed to calculate match score", "details": result.get("reasoning")}
 
+    except RateLimitError:
+        raise
     except Exception as e:
-        print(f"Error in rank_applicant_job: {e}")
+        log.exception(
+            "ranking.failed", job_listing_id=job_listing_id, candidate_id=candidate_id
+        )
         return {"error": str(e)}
     finally:
         db.close()
\ No newline at end of file
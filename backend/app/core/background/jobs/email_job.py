@@ -1,61 +1,140 @@
 # app/background/jobs/email_jobs.py
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
+from app.config import settings
 from app.core.background.inngest_client import inngest_client
 from app.core.services.email import email_service
 from app.db.database import SessionLocal
 from app.models.application import JobListingApplication
+from app.models.job_listing import JobListings
+from app.models.organization import Organizations
 from app.models.user import User
 from inngest import TriggerCron
+from sqlalchemy import func, select
+from sqlalchemy.orm import aliased
 
 
-@inngest_client.create_function(
-    fn_id="send-daily-application-emails",
-    trigger=TriggerCron(cron="0 9 * * *"),  # Every day at 9 AM
-)
-async def send_daily_emails_job(ctx, step):
+def digest_window_start() -> str:
+    """Start of the 24h window, memoized as a step so retries see the same one"""
+    return (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+
+
+def send_digest_batch(since_iso: str, after_org_id: Optional[str]) -> dict:
+    """Email the digest to the next batch of organizations (ordered by id).
+
+    One GROUP BY query counts new applications per organization, joined to
+    the owner who receives the digest; one windowed query fetches the top
+    matches of every organization in the batch. Messages go out through the
+    pooled batch sender.
+    """
+    since = datetime.fromisoformat(since_iso)
+    batch_size = settings.DAILY_DIGEST_BATCH_SIZE
     db = SessionLocal()
     try:
-        # Get applications from last 24 hours
-        yesterday = datetime.now(timezone.utc) - timedelta(days=1)
-
-        new_applications = (
-            db.query(JobListingApplication)
-            .filter(JobListingApplication.created_at >= yesterday)
+        query = (
+            db.query(
+                Organizations.id,
+                User.email,
+                User.name,
+                func.count(JobListingApplication.user_id),
+            )
+            .join(JobListings, JobListings.organization_id == Organizations.id)
+            .join(
+                JobListingApplication,
+                JobListingApplication.job_listing_id == JobListings.id,
+            )
+            .join(User, User.id == Organizations.owner_user_id)
+            .filter(JobListingApplication.applied_at >= since)
+        )
+        if after_org_id is not None:
+            query = query.filter(Organizations.id > after_org_id)
+        summaries = (
+            query.group_by(Organizations.id, User.email, User.name)
+            .order_by(Organizations.id)
+            .limit(batch_size)
             .all()
         )
+        if not summaries:
+            return {"organizations": 0, "sent": 0, "failed": 0, "last_org_id": None}
 
-        # Group by organization
-        from collections import defaultdict
+        # Top matches per organization in one pass (ROW_NUMBER per org)
+        applicant = aliased(User)
+        ranked = (
+            select(
+                JobListings.organization_id.label("organization_id"),
+                applicant.name.label("user_name"),
+                JobListings.title.label("job_title"),
+                JobListingApplication.rating.label("rating"),
+                func.row_number()
+                .over(
+                    partition_by=JobListings.organization_id,
+                    order_by=JobListingApplication.rating.desc().nulls_last(),
+                )
+                .label("position"),
+            )
+            .join(JobListings, JobListingApplication.job_listing_id == JobListings.id)
+            .join(applicant, applicant.id == JobListingApplication.user_id)
+            .where(
+                JobListingApplication.applied_at >= since,
+                JobListings.organization_id.in_([row[0] for row in summaries]),
+            )
+            .subquery()
+        )
+        top_matches = {}
+        for org_id, user_name, job_title, rating in db.execute(
+            select(
+                ranked.c.organization_id,
+                ranked.c.user_name,
+                ranked.c.job_title,
+                ranked.c.rating,
+            )
+            .where(ranked.c.position <= settings.DAILY_DIGEST_TOP_MATCHES)
+            .order_by(ranked.c.organization_id, ranked.c.position)
+        ):
+            top_matches.setdefault(org_id, []).append(
+                {"user_name": user_name, "job_title": job_title, "rating": rating or 0}
+            )
+    finally:
+        db.close()
 
-        org_applications = defaultdict(list)
+    emails = [
+        email_service.render_daily_applications_summary(
+            owner_email, owner_name, top_matches.get(org_id, []), total=total
+        )
+        for org_id, owner_email, owner_name, total in summaries
+    ]
+    results = email_service.send_many(emails)
+    failed = [result.to_email for result in results if not result.ok]
+    return {
+        "organizations": len(summaries),
+        "sent": len(results) - len(failed),
+        "failed": len(failed),
+        "last_org_id": summaries[-1][0] if len(summaries) == batch_size else None,
+    }
 
-        for app in new_applications:
-            org_id = app.job_listing.organization_id
-            org_applications[org_id].append(
-                {
-                    "user_name": app.user.name,
-                    "job_title": app.job_listing.title,
-                    "rating": app.rating or 0,
-                }
-            )
 
-        # Send email to each organization admin
-        for org_id, apps in org_applications.items():
-            # Get org admins (simplified - you'd query OrganizationMembership)
-            # For now, send to first admin
-            admin = db.query(User).first()  # Replace with actual admin query
-
-            if admin:
-                await step.run(
-                    f"send-email-{org_id}",
-                    email_service.send_daily_applications_summary,
-                    admin.email,
-                    admin.name,
-                    apps,
-                )
+@inngest_client.create_function(
+    fn_id="send-daily-application-emails",
+    trigger=TriggerCron(cron=settings.DAILY_DIGEST_CRON),
+)
+async def send_daily_emails_job(ctx, step):
+    """Send each organization owner a summary of yesterday's applications"""
+    since_iso = await step.run("digest-window", digest_window_start)
 
-        return {"success": True, "emails_sent": len(org_applications)}
+    totals = {"organizations": 0, "sent": 0, "failed": 0}
+    after_org_id = None
+    batch = 0
+    # Each batch is its own step, so a retry never re-sends completed batches
+    while True:
+        result = await step.run(
+            f"send-digest-batch-{batch}", send_digest_batch, since_iso, after_org_id
+        )
+        for key in totals:
+            totals[key] += result[key]
+        after_org_id = result["last_org_id"]
+        if after_org_id is None:
+            break
+        batch += 1
 
-    finally:
-        db.close()
+    return {"success": True, "emails_sent": totals["sent"], **totals}
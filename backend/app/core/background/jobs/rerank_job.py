@@ -0,0 +1,216 @@
+# app/core/background/jobs/rerank_job.py
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+import inngest
+from sqlalchemy import update
+
+from app.config import settings
+from app.core.background.inngest_client import inngest_client
+from app.core.background.jobs.applicant_ranking_job import calculate_match_score
+from app.core.services.match_scoring import (
+    input_fingerprint,
+    keyword_score,
+    ranking_inputs,
+)
+from app.db.database import SessionLocal
+from app.models.application import JobListingApplication
+from app.models.candidates import Candidates
+from app.models.job_listing import JobListings
+from app.models.resume import Resume, ResumeParseStatus
+
+KEYWORD_ANALYSIS = "Keyword match score (not reviewed by AI)"
+
+
+def _applications_query(db, job_listing_id: Optional[str], candidate_id: Optional[str]):
+    query = (
+        db.query(JobListingApplication, JobListings, Resume)
+        .join(JobListings, JobListings.id == JobListingApplication.job_listing_id)
+        .join(Candidates, Candidates.user_id == JobListingApplication.user_id)
+        .outerjoin(Resume, Resume.candidate_id == Candidates.id)
+    )
+    if job_listing_id is not None:
+        query = query.filter(JobListingApplication.job_listing_id == job_listing_id)
+    if candidate_id is not None:
+        query = query.filter(Candidates.id == candidate_id)
+    return query
+
+
+def find_stale_applications(
+    job_listing_id: Optional[str], candidate_id: Optional[str]
+) -> List[dict]:
+    """Applications whose ranking inputs changed since they were scored, with
+    their keyword score.
+
+    Applications whose resume is still being parsed are left alone; the
+    resume.parsed event re-ranks them once the summary exists.
+    """
+    db = SessionLocal()
+    try:
+        stale = []
+        for application, job, resume in _applications_query(
+            db, job_listing_id, candidate_id
+        ).yield_per(500):
+            if resume is not None and resume.parse_status in (
+                ResumeParseStatus.PENDING,
+                ResumeParseStatus.PROCESSING,
+            ):
+                continue
+            inputs = ranking_inputs(
+                job, resume.ai_summary if resume else None, application.cover_letter
+            )
+            fingerprint = input_fingerprint(inputs)
+            if fingerprint == application.input_fingerprint:
+                continue
+            stale.append(
+                {
+                    "job_listing_id": application.job_listing_id,
+                    "user_id": application.user_id,
+                    "fingerprint": fingerprint,
+                    "keyword_score": keyword_score(inputs),
+                    "llm_rated": application.rating is not None
+                    and application.ai_analysis != KEYWORD_ANALYSIS,
+                }
+            )
+        return stale
+    finally:
+        db.close()
+
+
+def score_with_llm(job_listing_id: str, user_id: int) -> Optional[dict]:
+    """LLM match score of one application, computed from its current inputs"""
+    db = SessionLocal()
+    try:
+        row = (
+            _applications_query(db, job_listing_id, None)
+            .filter(JobListingApplication.user_id == user_id)
+            .first()
+        )
+        if row is None:
+            return None
+        application, job, resume = row
+        inputs = ranking_inputs(
+            job, resume.ai_summary if resume else None, application.cover_letter
+        )
+    finally:
+        db.close()
+
+    result = calculate_match_score(**inputs)
+    if result.get("rating") is None:
+        return None
+    return {
+        "rating": result["rating"],
+        "analysis": result["reasoning"],
+        "fingerprint": input_fingerprint(inputs),
+    }
+
+
+def save_scores(scores: List[dict]) -> int:
+    """Write new ratings in one executemany UPDATE (by primary key)"""
+    if not scores:
+        return 0
+    ranked_at = datetime.now(timezone.utc)
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(JobListingApplication),
+            [
+                {
+                    "ranked_at": ranked_at,
+                    "job_listing_id": score["job_listing_id"],
+                    "user_id": score["user_id"],
+                    "rating": score["rating"],
+                    "ai_analysis": score["analysis"],
+                    "input_fingerprint": score["fingerprint"],
+                }
+                for score in scores
+            ],
+        )
+        db.commit()
+        return len(scores)
+    finally:
+        db.close()
+
+
+async def rerank_applications(
+    step, job_listing_id: Optional[str] = None, candidate_id: Optional[str] = None
+) -> dict:
+    """Re-score applications whose inputs changed.
+
+    The best RERANK_LLM_FINALISTS stale applications by keyword score are
+    re-scored by the LLM, one step each so a retry never pays for the same
+    call twice. The rest (and finalists the LLM could not score) keep an
+    earlier LLM rating if they have one, or else get the keyword score. Either
+    way their fingerprint is not updated, so they stay stale and a later
+    re-rank can still give them an LLM score.
+    """
+    stale = await step.run(
+        "find-stale-applications", find_stale_applications, job_listing_id, candidate_id
+    )
+    if not stale:
+        return {"success": True, "rescored": 0, "llm_scored": 0}
+
+    stale.sort(key=lambda app: app["keyword_score"], reverse=True)
+    scores = []
+    llm_scored = 0
+    for position, app in enumerate(stale):
+        score = None
+        if position < settings.RERANK_LLM_FINALISTS:
+            score = await step.run(
+                f"llm-score-{app['job_listing_id']}-{app['user_id']}",
+                score_with_llm,
+                app["job_listing_id"],
+                app["user_id"],
+            )
+        if score is not None:
+            llm_scored += 1
+        elif app.get("llm_rated"):
+            continue
+        else:
+            score = {
+                "rating": app["keyword_score"],
+                "analysis": KEYWORD_ANALYSIS,
+                "fingerprint": None,
+            }
+        scores.append(
+            {
+                "job_listing_id": app["job_listing_id"],
+                "user_id": app["user_id"],
+                **score,
+            }
+        )
+
+    saved = await step.run("save-scores", save_scores, scores)
+    return {"success": True, "rescored": saved, "llm_scored": llm_scored}
+
+
+_debounce_period = timedelta(seconds=settings.RERANK_DEBOUNCE_SECONDS)
+
+
+@inngest_client.create_function(
+    fn_id="rerank-job-applications",
+    trigger=inngest.TriggerEvent(event="app/job_listing.updated"),
+    # Edits made within the window collapse into one re-rank of the job
+    debounce=inngest.Debounce(period=_debounce_period, key="event.data.job_listing_id"),
+    concurrency=[
+        inngest.Concurrency(
+            limit=settings.RANKING_CONCURRENCY_PER_ORG,
+            key="event.data.organization_id",
+        )
+    ],
+)
+async def rerank_job_applications_job(ctx, step):
+    """Re-rank a job's applications after its listing changed"""
+    return await rerank_applications(
+        step, job_listing_id=ctx.event.data["job_listing_id"]
+    )
+
+
+@inngest_client.create_function(
+    fn_id="rerank-candidate-applications",
+    trigger=inngest.TriggerEvent(event="app/resume.parsed"),
+    debounce=inngest.Debounce(period=_debounce_period, key="event.data.candidate_id"),
+)
+async def rerank_candidate_applications_job(ctx, step):
+    """Re-rank a candidate's applications after a new resume was parsed"""
+    return await rerank_applications(step, candidate_id=ctx.event.data["candidate_id"])
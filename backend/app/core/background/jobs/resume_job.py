@@ -1,21 +1,28 @@
 # app/core/background/jobs/resume_job.py
+import asyncio
 import base64
 import io
-import traceback
+from datetime import datetime, timezone
 
-import google.generativeai as genai
-import PyPDF2
-from docx import Document
 import inngest
 
 from app.config import settings
 from app.core.background.inngest_client import inngest_client
+from app.core.log import get_logger
+from app.core.metrics import StageTimer
+from app.core.services.llm import RateLimitError, get_llm_provider
+from app.core.services.outbox import enqueue_event, outbox_relay
 from app.db.database import SessionLocal
 from app.models.resume import Resume, ResumeParseStatus
 
+log = get_logger("app.jobs.resume")
+
 
 def extract_text_from_pdf(file_content: bytes) -> str:
     """Extract text from PDF file"""
+    # Parsers are imported on first use, keeping them out of API processes
+    import PyPDF2
+
     try:
         pdf_file = io.BytesIO(file_content)
         pdf_reader = PyPDF2.PdfReader(pdf_file)
@@ -24,32 +31,31 @@ def extract_text_from_pdf(file_content: bytes) -> str:
             text += page.extract_text()
         return text
     except Exception as e:
-        print(f"[PDF Extract] Error: {e}")
+        log.warning("resume.extract_failed", file_type="pdf", error=e)
         return ""
 
 
 def extract_text_from_docx(file_content: bytes) -> str:
     """Extract text from DOCX file"""
+    from docx import Document
+
     try:
         doc_file = io.BytesIO(file_content)
         doc = Document(doc_file)
         text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
         return text
     except Exception as e:
-        print(f"[DOCX Extract] Error: {e}")
+        log.warning("resume.extract_failed", file_type="docx", error=e)
         return ""
 
 
 def generate_resume_summary(extracted_text: str) -> str:
-    """Generate AI summary using Gemini"""
-    if not settings.GEMINI_API_KEY:
+    """Generate AI summary using the configured LLM provider"""
+    provider = get_llm_provider()
+    if provider is None:
         return "AI summary unavailable - no API key configured"
 
-    try:
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        model = genai.GenerativeModel("gemini-2.5-flash")
-
-        prompt = f"""Analyze this resume and create a comprehensive summary for a hiring manager.
+    prompt = f"""Analyze this resume and create a comprehensive summary for a hiring manager.
 
 Resume Text:
 {extracted_text[:5000]}
@@ -63,11 +69,13 @@ Provide a structured summary that includes:
 
 Format your response in markdown. Be concise but thorough."""
 
-        response = model.generate_content(prompt)
-        return response.text
-
+    try:
+        return provider.generate(prompt).text
+    except RateLimitError:
+        # Fail the run so it is retried, rather than saving an error as summary
+        raise
     except Exception as e:
-        print(f"[Gemini] Error: {e}")
+        log.warning("resume.summary_failed", error=e)
         return f"AI summary generation failed: {str(e)}"
 
 
@@ -77,134 +85,130 @@ Format your response in markdown. Be concise but thorough."""
 )
 async def parse_resume_job(ctx, step=None):
     """Background job to parse resume and generate AI summary"""
-    
-    print(f"\n{'='*60}")
-    print(f"[Inngest Job] Starting resume parsing job")
-    print(f"[Inngest Job] Event ID: {ctx.event.id if hasattr(ctx.event, 'id') else 'unknown'}")
-    print(f"{'='*60}\n")
-    
     db = None
     resume = None
-    
+    candidate_id = None
+    timer = StageTimer("parse-resume")
+
     try:
         # Get event data with safety checks
-        print(f"[Event Data] Raw event: {ctx.event}")
         event_data = ctx.event.data if hasattr(ctx.event, 'data') else {}
-        print(f"[Event Data] Parsed data: {event_data}")
-        
         candidate_id = event_data.get("candidate_id")
         file_content_b64 = event_data.get("file_content")
         file_type = event_data.get("file_type")
 
-        print(f"[Job Data] Candidate ID: {candidate_id}")
-        print(f"[Job Data] File Type: {file_type}")
-        print(f"[Job Data] Base64 Content Length: {len(file_content_b64) if file_content_b64 else 0}")
+        log.info(
+            "resume.parse.started",
+            event_id=getattr(ctx.event, "id", None),
+            candidate_id=candidate_id,
+            file_type=file_type,
+            content_chars=len(file_content_b64) if file_content_b64 else 0,
+        )
+        log.payload(
+            "resume.parse.event",
+            **{key: value for key, value in event_data.items() if key != "file_content"},
+        )
 
         # Validate required data
-        if not candidate_id:
-            print("[Validation] ERROR: Missing candidate_id")
-            return {"error": "Missing candidate_id"}
-        
-        if not file_content_b64:
-            print("[Validation] ERROR: Missing file_content")
-            return {"error": "Missing file_content"}
-        
-        if not file_type:
-            print("[Validation] ERROR: Missing file_type")
-            return {"error": "Missing file_type"}
+        for field in ("candidate_id", "file_content", "file_type"):
+            if not event_data.get(field):
+                log.warning("resume.parse.invalid_event", missing=field)
+                return {"error": f"Missing {field}"}
 
         # Decode base64 file content
-        print(f"[Decode] Decoding base64 content...")
         try:
-            file_content = base64.b64decode(file_content_b64)
-            print(f"[Decode] SUCCESS - Decoded {len(file_content)} bytes")
+            with timer.stage("decode"):
+                file_content = base64.b64decode(file_content_b64)
         except Exception as e:
-            print(f"[Decode] ERROR: {e}")
-            traceback.print_exc()
+            log.warning("resume.parse.decode_failed", candidate_id=candidate_id, error=e)
             return {"error": f"Failed to decode file content: {str(e)}"}
 
         # Get resume from database
-        print(f"[Database] Connecting to database...")
         db = SessionLocal()
-        
-        print(f"[Database] Querying resume for candidate_id: {candidate_id}")
-        resume = db.query(Resume).filter(Resume.candidate_id == candidate_id).first()
+        with timer.stage("load"):
+            resume = db.query(Resume).filter(Resume.candidate_id == candidate_id).first()
+
+            if resume:
+                # Update status to processing
+                resume.parse_status = ResumeParseStatus.PROCESSING
+                db.commit()
 
         if not resume:
-            print(f"[Database] ERROR: Resume not found for candidate_id: {candidate_id}")
+            log.warning("resume.parse.not_found", candidate_id=candidate_id)
             return {"error": "Resume not found"}
 
-        print(f"[Database] Found resume ID: {resume.id}")
-
-        # Update status to processing
-        print(f"[Status] Updating status to PROCESSING...")
-        resume.parse_status = ResumeParseStatus.PROCESSING
-        db.commit()
-        print(f"[Status] Status updated successfully")
-
         # Extract text from file
-        print(f"[Extract] Extracting text from {file_type} file...")
-        if file_type == "pdf":
-            extracted_text = extract_text_from_pdf(file_content)
-        else:
-            extracted_text = extract_text_from_docx(file_content)
-        
-        text_length = len(extracted_text) if extracted_text else 0
-        print(f"[Extract] Extracted {text_length} characters")
+        with timer.stage("extract"):
+            if file_type == "pdf":
+                extracted_text = extract_text_from_pdf(file_content)
+            else:
+                extracted_text = extract_text_from_docx(file_content)
 
         if not extracted_text or len(extracted_text.strip()) < 50:
-            print(f"[Extract] ERROR: Insufficient text extracted")
+            log.warning(
+                "resume.parse.insufficient_text",
+                candidate_id=candidate_id,
+                file_type=file_type,
+                text_chars=len(extracted_text or ""),
+            )
             resume.extracted_text = extracted_text
             resume.parse_status = ResumeParseStatus.FAILED
+            resume.parse_timings = timer.observe()
             db.commit()
             return {"error": "Could not extract sufficient text from resume"}
 
-        # Save extracted text (preview for debugging)
-        print(f"[Extract] Text preview: {extracted_text[:200]}...")
+        log.payload("resume.parse.text", candidate_id=candidate_id, text=extracted_text)
 
         # Generate AI summary using Gemini
-        print(f"[AI Summary] Generating summary with Gemini...")
-        ai_summary = generate_resume_summary(extracted_text)
-        print(f"[AI Summary] Generated {len(ai_summary)} characters")
-        print(f"[AI Summary] Preview: {ai_summary[:200]}...")
+        with timer.stage("summarize"):
+            # In a thread: the LLM call blocks for seconds
+            ai_summary = await asyncio.to_thread(generate_resume_summary, extracted_text)
+        log.payload("resume.parse.summary", candidate_id=candidate_id, summary=ai_summary)
 
         # Update resume with results
-        print(f"[Database] Saving results to database...")
-        resume.extracted_text = extracted_text
-        resume.ai_summary = ai_summary
-        resume.parse_status = ResumeParseStatus.COMPLETED
+        with timer.stage("persist"):
+            resume.extracted_text = extracted_text
+            resume.ai_summary = ai_summary
+            resume.parse_status = ResumeParseStatus.COMPLETED
+            resume.parsed_at = datetime.now(timezone.utc)
+            # Re-rank the candidate's applications against the new summary
+            enqueue_event(db, "app/resume.parsed", {"candidate_id": candidate_id})
+            db.flush()
+        # Stored with the results (the timings cover everything up to the flush)
+        timings = timer.observe()
+        resume.parse_timings = timings
         db.commit()
-
-        print(f"\n{'='*60}")
-        print(f"[SUCCESS] Resume parsing completed for candidate_id: {candidate_id}")
-        print(f"{'='*60}\n")
-        
+        outbox_relay.notify()
+
+        log.info(
+            "resume.parse.completed",
+            candidate_id=candidate_id,
+            text_chars=len(extracted_text),
+            summary_chars=len(ai_summary),
+            seconds=timings["total"],
+        )
         return {
-            "success": True, 
+            "success": True,
             "candidate_id": candidate_id,
             "text_length": len(extracted_text),
-            "summary_length": len(ai_summary)
+            "summary_length": len(ai_summary),
+            "timings": timings,
         }
 
-    except Exception as e:
-        print(f"\n{'='*60}")
-        print(f"[ERROR] Exception in parse_resume_job: {e}")
-        print(f"{'='*60}")
-        traceback.print_exc()
-        
+    except Exception:
+        log.exception("resume.parse.failed", candidate_id=candidate_id)
+
         # Try to mark resume as failed
         try:
             if db and resume:
                 resume.parse_status = ResumeParseStatus.FAILED
                 db.commit()
-                print(f"[Status] Marked resume as FAILED")
-        except Exception as commit_error:
-            print(f"[Status] ERROR: Could not mark resume as failed: {commit_error}")
-        
+        except Exception:
+            log.exception("resume.parse.mark_failed_error", candidate_id=candidate_id)
+
         # Re-raise so Inngest can retry
         raise
-        
+
     finally:
         if db:
             db.close()
-            print(f"[Database] Connection closed")
\ No newline at end of file
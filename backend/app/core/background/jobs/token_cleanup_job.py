@@ -0,0 +1,63 @@
+# app/core/background/jobs/token_cleanup_job.py
+import datetime as dt
+
+from inngest import TriggerCron
+from sqlalchemy import or_
+
+from app.config import settings
+from app.core.background.inngest_client import inngest_client
+from app.db.database import SessionLocal
+from app.models.refresh_token import RefreshToken
+
+
+def purge_refresh_token_batch(batch_size: int) -> int:
+    """Delete up to `batch_size` expired or revoked refresh tokens"""
+    db = SessionLocal()
+    try:
+        now = dt.datetime.now(dt.UTC)
+        stale_ids = [
+            token_id
+            for (token_id,) in db.query(RefreshToken.id)
+            .filter(
+                or_(
+                    RefreshToken.is_revoked.is_(True),
+                    RefreshToken.expires_at < now,
+                )
+            )
+            .limit(batch_size)
+            .all()
+        ]
+        if not stale_ids:
+            return 0
+
+        deleted = (
+            db.query(RefreshToken)
+            .filter(RefreshToken.id.in_(stale_ids))
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        return deleted
+    finally:
+        db.close()
+
+
+@inngest_client.create_function(
+    fn_id="cleanup-refresh-tokens",
+    trigger=TriggerCron(cron=settings.REFRESH_TOKEN_CLEANUP_CRON),
+)
+async def cleanup_refresh_tokens_job(ctx, step):
+    """Sweep expired/revoked refresh tokens in bounded batches"""
+    batch_size = settings.REFRESH_TOKEN_CLEANUP_BATCH_SIZE
+    total_deleted = 0
+
+    # Each batch is its own step (short transaction, memoized on retry); the
+    # batch cap keeps a single run bounded, the next run picks up the rest.
+    for batch in range(settings.REFRESH_TOKEN_CLEANUP_MAX_BATCHES):
+        deleted = await step.run(
+            f"purge-batch-{batch}", purge_refresh_token_batch, batch_size
+        )
+        total_deleted += deleted
+        if deleted < batch_size:
+            break
+
+    return {"success": True, "deleted": total_deleted}
@@ -0,0 +1,555 @@
+# app/core/background/runner.py
+import asyncio
+import heapq
+import inspect
+import itertools
+import json
+import logging
+import time
+import uuid
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import inngest
+
+from app.config import settings
+from app.core.log import get_logger
+from app.core.services.outbox import EventPublisher
+from app.models.outbox import OutboxEvent
+
+log = get_logger("app.jobs.runner")
+
+
+@dataclass
+class LocalEvent:
+    name: str
+    data: Dict[str, Any]
+    id: str = ""
+    ts: int = 0
+
+
+@dataclass
+class LocalContext:
+    """The subset of inngest.Context our job handlers use"""
+
+    event: LocalEvent
+    events: List[LocalEvent]
+    attempt: int
+    run_id: str
+    logger: logging.Logger = log.logger
+
+
+def _is_picklable(handler: Callable) -> bool:
+    """Module-level functions can be sent to a worker process; lambdas and
+    closures (which capture ORM objects and sessions) cannot"""
+    qualname = getattr(handler, "__qualname__", "")
+    return inspect.isfunction(handler) and qualname == handler.__name__
+
+
+def _seconds(duration: Any) -> float:
+    """Inngest durations are timedeltas or integer milliseconds"""
+    if hasattr(duration, "total_seconds"):
+        return duration.total_seconds()
+    return duration / 1000
+
+
+def _key_path(expression: str) -> List[str]:
+    """Field path of an Inngest key expression such as event.data.organization_id"""
+    prefix = "event.data."
+    if not expression.startswith(prefix):
+        raise ValueError(f"Unsupported key expression: {expression}")
+    return expression[len(prefix) :].split(".")
+
+
+def _event_value(data: Dict[str, Any], path: Optional[List[str]]) -> str:
+    if path is None:
+        return ""
+    value: Any = data
+    for part in path:
+        value = value.get(part) if isinstance(value, dict) else None
+    return "" if value is None else str(value)
+
+
+class LocalStep:
+    """In-process `step` with Inngest's memoization semantics.
+
+    A step that completed is not executed again when the run is retried; its
+    recorded output (JSON round-tripped, as Inngest would store it) is
+    returned instead. Sync step handlers run in a worker thread so blocking
+    work (PDF parsing, LLM calls) doesn't stall other runs, or in the runner's
+    process pool when it has one and the handler is a module-level function.
+    """
+
+    def __init__(self, runner: "LocalJobRunner", memos: Dict[str, Any]):
+        self._runner = runner
+        self._memos = memos
+
+    async def run(self, step_id: str, handler: Callable, *handler_args: Any) -> Any:
+        if step_id in self._memos:
+            return self._memos[step_id]
+        if inspect.iscoroutinefunction(handler):
+            output = await handler(*handler_args)
+        elif self._runner.process_pool is not None and _is_picklable(handler):
+            output = await asyncio.get_running_loop().run_in_executor(
+                self._runner.process_pool, handler, *handler_args
+            )
+        else:
+            output = await asyncio.to_thread(handler, *handler_args)
+            if inspect.isawaitable(output):
+                output = await output
+        output = json.loads(json.dumps(output))
+        self._memos[step_id] = output
+        return output
+
+    async def sleep(self, step_id: str, duration: Any) -> None:
+        if step_id in self._memos:
+            return
+        await asyncio.sleep(_seconds(duration))
+        self._memos[step_id] = None
+
+    async def send_event(self, step_id: str, events: Any) -> List[str]:
+        if step_id in self._memos:
+            return self._memos[step_id]
+        events = events if isinstance(events, list) else [events]
+        ids = []
+        for event in events:
+            event_id = getattr(event, "id", "") or str(uuid.uuid4())
+            self._runner.submit(
+                {"id": event_id, "name": event.name, "data": dict(event.data)}
+            )
+            ids.append(event_id)
+        self._memos[step_id] = ids
+        return ids
+
+
+@dataclass
+class _Run:
+    """One function run: its event, memoized steps and scheduling state"""
+
+    event: LocalEvent
+    key: str
+    future: asyncio.Future
+    run_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    memos: Dict[str, Any] = field(default_factory=dict)
+    attempt: int = 0
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class LaneStats:
+    started: int = 0  # Attempts, including retries
+    succeeded: int = 0
+    failed: int = 0
+    retries: int = 0
+    run_seconds: float = 0.0
+    wait_seconds: float = 0.0  # Time attempts spent queued before starting
+    max_wait_seconds: float = 0.0
+    debounced: int = 0  # Events absorbed by a later event with the same key
+
+
+@dataclass
+class _Debounced:
+    """Latest event of a debounce key, waiting for its quiet period to end"""
+
+    event: LocalEvent
+    future: asyncio.Future
+    first_at: float
+    handle: Optional[asyncio.TimerHandle] = None
+
+
+class _Lane:
+    """Queued runs of one function, shared fairly between keys.
+
+    Start-time fair queuing: each key (the function's concurrency key, e.g.
+    organization_id) has its own FIFO, and the next run comes from the key
+    with the smallest virtual start tag. A key's tag advances by 1/weight per
+    run, so keys take turns in proportion to their weights no matter how many
+    runs each one queued. Keys at their concurrency cap are skipped.
+    """
+
+    def __init__(
+        self,
+        fn: inngest.Function,
+        priority: int,
+        limit: int,
+        key_path: Optional[List[str]],
+        key_limit: Optional[int],
+        retries: int,
+        weights: Dict[str, float],
+        debounce: Optional[inngest.Debounce] = None,
+    ):
+        self.fn = fn
+        self.fn_id = fn._opts.local_id
+        self.priority = priority
+        self.limit = limit
+        self.key_path = key_path
+        self.key_limit = key_limit
+        self.retries = retries
+        self.weights = weights
+        self.debounce_period = self.debounce_timeout = None
+        self.debounce_key_path = None
+        if debounce is not None:
+            self.debounce_period = _seconds(debounce.period)
+            if debounce.timeout is not None:
+                self.debounce_timeout = _seconds(debounce.timeout)
+            if debounce.key is not None:
+                self.debounce_key_path = _key_path(debounce.key)
+        self.debouncing = 0
+        self.queued = 0
+        self.running = 0
+        self.running_by_key: Dict[str, int] = defaultdict(int)
+        self.stats = LaneStats()
+        self._queues: Dict[str, Deque[_Run]] = {}
+        self._heads: List[Tuple[float, int, str]] = []  # (start tag, seq, key)
+        self._finish: Dict[str, float] = {}
+        self._clock = 0.0
+        self._seq = itertools.count()
+
+    def key_of(self, event: LocalEvent) -> str:
+        return _event_value(event.data, self.key_path)
+
+    def push(self, run: _Run) -> None:
+        queue = self._queues.get(run.key)
+        if queue is None:
+            queue = self._queues[run.key] = deque()
+            # A key that was idle starts at the current virtual time: it gets
+            # no credit for the time it had nothing queued
+            start = max(self._clock, self._finish.get(run.key, 0.0))
+            heapq.heappush(self._heads, (start, next(self._seq), run.key))
+        queue.append(run)
+        self.queued += 1
+
+    def _at_cap(self, key: str) -> bool:
+        return (
+            self.key_limit is not None
+            and key != ""
+            and self.running_by_key[key] >= self.key_limit
+        )
+
+    def pop(self) -> Optional[_Run]:
+        """Next run to start, or None if every queued key is at its cap"""
+        skipped = []
+        run = None
+        while self._heads:
+            start, seq, key = heapq.heappop(self._heads)
+            if self._at_cap(key):
+                skipped.append((start, seq, key))
+                continue
+            queue = self._queues[key]
+            run = queue.popleft()
+            self.queued -= 1
+            self._clock = start
+            finish = start + 1.0 / self.weights.get(key, 1.0)
+            self._finish[key] = finish
+            if queue:
+                heapq.heappush(self._heads, (finish, next(self._seq), key))
+            else:
+                del self._queues[key]
+            break
+        for entry in skipped:
+            heapq.heappush(self._heads, entry)
+        return run
+
+    def snapshot(self) -> Dict[str, Any]:
+        stats = vars(self.stats).copy()
+        stats.update(
+            priority=self.priority,
+            debouncing=self.debouncing,
+            queued=self.queued,
+            running=self.running,
+            active_keys=len(self._queues),
+            avg_wait_seconds=(
+                self.stats.wait_seconds / self.stats.started
+                if self.stats.started
+                else 0.0
+            ),
+        )
+        return stats
+
+
+class LocalJobRunner:
+    """Runs Inngest functions in-process, triggered by the same events.
+
+    A drop-in for the Inngest server in development, tests, load tests and
+    small single-machine deployments. Each function is a lane with:
+
+    - a priority (LOCAL_RUNNER_PRIORITIES): free workers go to the
+      highest-priority lane with runnable work, so resume parsing starts
+      ahead of ranking. Because every lane is capped by its own concurrency,
+      lower lanes always keep the remaining workers and are never starved;
+    - a concurrency limit (the function's unkeyed `concurrency` option, else
+      LOCAL_RUNNER_CONCURRENCY) and, for a keyed option such as
+      event.data.organization_id, a per-key cap plus weighted fair queuing
+      between keys (weights from LOCAL_RUNNER_ORG_WEIGHTS);
+    - a retry budget (its `retries` option, else LOCAL_RUNNER_RETRIES).
+      Failed attempts go back to the queue after an exponential backoff
+      without holding a worker;
+    - optional debouncing (its `debounce` option): events with the same key
+      are coalesced and one run starts with the latest event once no new
+      event arrived for the period (or the timeout passed).
+
+    At most LOCAL_RUNNER_WORKERS runs execute at once. Cron triggers are not
+    scheduled.
+    """
+
+    def __init__(
+        self,
+        functions: List[inngest.Function],
+        workers: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        retries: Optional[int] = None,
+        retry_base_seconds: Optional[float] = None,
+        process_workers: Optional[int] = None,
+        priorities: Optional[Dict[str, int]] = None,
+        weights: Optional[Dict[str, float]] = None,
+    ):
+        self.workers = workers or settings.LOCAL_RUNNER_WORKERS
+        self.default_concurrency = concurrency or settings.LOCAL_RUNNER_CONCURRENCY
+        self.default_retries = (
+            settings.LOCAL_RUNNER_RETRIES if retries is None else retries
+        )
+        self.retry_base_seconds = (
+            settings.LOCAL_RUNNER_RETRY_BASE_SECONDS
+            if retry_base_seconds is None
+            else retry_base_seconds
+        )
+        if process_workers is None:
+            process_workers = settings.LOCAL_RUNNER_PROCESS_WORKERS
+        self.process_pool = (
+            ProcessPoolExecutor(max_workers=process_workers)
+            if process_workers > 0
+            else None
+        )
+        self.priorities = (
+            settings.LOCAL_RUNNER_PRIORITIES if priorities is None else priorities
+        )
+        self.weights = settings.LOCAL_RUNNER_ORG_WEIGHTS if weights is None else weights
+
+        # Highest priority first; sorted() keeps registration order for ties
+        self.lanes = sorted(
+            (self._lane(fn) for fn in functions), key=lambda lane: -lane.priority
+        )
+        self._by_event: Dict[str, List[_Lane]] = defaultdict(list)
+        for lane in self.lanes:
+            for trigger in lane.fn._triggers:
+                if isinstance(trigger, inngest.TriggerEvent):
+                    self._by_event[trigger.event].append(lane)
+
+        self.running = 0
+        self._tasks: set = set()
+        self._pending: set = set()
+        self._debounced: Dict[Tuple[str, str], _Debounced] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopped = False
+
+    def _lane(self, fn: inngest.Function) -> _Lane:
+        opts = fn._opts
+        limit = self.default_concurrency
+        key_path = key_limit = None
+        for concurrency in opts.concurrency or []:
+            if concurrency.key is None:
+                limit = concurrency.limit
+            else:
+                key_path = _key_path(concurrency.key)
+                key_limit = concurrency.limit
+        return _Lane(
+            fn=fn,
+            priority=self.priorities.get(opts.local_id, 0),
+            limit=limit,
+            key_path=key_path,
+            key_limit=key_limit,
+            retries=self.default_retries if opts.retries is None else opts.retries,
+            weights=self.weights,
+            debounce=opts.debounce,
+        )
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+
+    def submit(self, event: Dict[str, Any]) -> List[asyncio.Future]:
+        """Queue a run of every function triggered by `event` (loop thread only).
+
+        Returns one future per run, resolved with the function's output (None
+        if it failed). Debounced events share the future of the run they were
+        coalesced into.
+        """
+        loop = self._loop or asyncio.get_running_loop()
+        local_event = LocalEvent(
+            name=event["name"],
+            data=event.get("data") or {},
+            id=event.get("id") or str(uuid.uuid4()),
+            ts=event.get("ts") or int(time.time() * 1000),
+        )
+        futures = []
+        for lane in self._by_event.get(local_event.name, []):
+            if lane.debounce_period is not None:
+                futures.append(self._debounce(lane, local_event, loop))
+                continue
+            future = self._new_future(loop)
+            lane.push(
+                _Run(event=local_event, key=lane.key_of(local_event), future=future)
+            )
+            futures.append(future)
+        self._dispatch()
+        return futures
+
+    def _new_future(self, loop: asyncio.AbstractEventLoop) -> asyncio.Future:
+        future = loop.create_future()
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+
+    def _debounce(
+        self, lane: _Lane, event: LocalEvent, loop: asyncio.AbstractEventLoop
+    ) -> asyncio.Future:
+        key = (lane.fn_id, _event_value(event.data, lane.debounce_key_path))
+        now = loop.time()
+        pending = self._debounced.get(key)
+        if pending is None:
+            pending = _Debounced(
+                event=event, future=self._new_future(loop), first_at=now
+            )
+            self._debounced[key] = pending
+            lane.debouncing += 1
+        else:
+            pending.handle.cancel()
+            pending.event = event
+            lane.stats.debounced += 1
+
+        delay = lane.debounce_period
+        if lane.debounce_timeout is not None:
+            delay = max(0.0, min(delay, pending.first_at + lane.debounce_timeout - now))
+        pending.handle = loop.call_later(delay, self._release, lane, key)
+        return pending.future
+
+    def _release(self, lane: _Lane, key: Tuple[str, str]) -> None:
+        """Debounce period over: queue one run with the latest event"""
+        pending = self._debounced.pop(key)
+        lane.debouncing -= 1
+        if self._stopped:
+            pending.future.cancel()
+            return
+        lane.push(
+            _Run(
+                event=pending.event,
+                key=lane.key_of(pending.event),
+                future=pending.future,
+            )
+        )
+        self._dispatch()
+
+    def submit_threadsafe(self, event: Dict[str, Any]) -> None:
+        """Hand an event to the runner from any thread (e.g. the outbox relay)"""
+        if self._loop is None:
+            raise RuntimeError("LocalJobRunner.start() has not been called")
+        self._loop.call_soon_threadsafe(self.submit, event)
+
+    def _dispatch(self) -> None:
+        """Start queued runs while workers are free, highest lane first"""
+        while self.running < self.workers and not self._stopped:
+            for lane in self.lanes:
+                if lane.queued and lane.running < lane.limit:
+                    run = lane.pop()
+                    if run is not None:
+                        break
+            else:
+                return
+            self._start(lane, run)
+
+    def _start(self, lane: _Lane, run: _Run) -> None:
+        waited = time.perf_counter() - run.enqueued_at
+        lane.stats.started += 1
+        lane.stats.wait_seconds += waited
+        lane.stats.max_wait_seconds = max(lane.stats.max_wait_seconds, waited)
+        self.running += 1
+        lane.running += 1
+        lane.running_by_key[run.key] += 1
+        task = asyncio.create_task(self._attempt(lane, run))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _attempt(self, lane: _Lane, run: _Run) -> None:
+        ctx = LocalContext(
+            event=run.event, events=[run.event], attempt=run.attempt, run_id=run.run_id
+        )
+        started_at = time.perf_counter()
+        retry = False
+        try:
+            output = await lane.fn._handler(ctx, LocalStep(self, run.memos))
+        except asyncio.CancelledError:
+            run.future.cancel()
+            raise
+        except inngest.NonRetriableError:
+            log.exception(
+                "job.failed", function=lane.fn_id, attempt=run.attempt, retried=False
+            )
+            lane.stats.failed += 1
+            run.future.set_result(None)
+        except Exception:
+            if run.attempt < lane.retries:
+                retry = True
+            else:
+                log.exception("job.failed", function=lane.fn_id, attempt=run.attempt)
+                lane.stats.failed += 1
+                run.future.set_result(None)
+        else:
+            lane.stats.succeeded += 1
+            run.future.set_result(output)
+        finally:
+            lane.stats.run_seconds += time.perf_counter() - started_at
+            self.running -= 1
+            lane.running -= 1
+            lane.running_by_key[run.key] -= 1
+            if not lane.running_by_key[run.key]:
+                del lane.running_by_key[run.key]
+
+        if retry:
+            lane.stats.retries += 1
+            delay = self.retry_base_seconds * 2**run.attempt
+            run.attempt += 1
+            asyncio.get_running_loop().call_later(delay, self._requeue, lane, run)
+        self._dispatch()
+
+    def _requeue(self, lane: _Lane, run: _Run) -> None:
+        if self._stopped:
+            run.future.cancel()
+            return
+        run.enqueued_at = time.perf_counter()
+        lane.push(run)
+        self._dispatch()
+
+    async def drain(self) -> None:
+        """Wait until every run (including runs started meanwhile) finished"""
+        while self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+    async def stop(self) -> None:
+        self._stopped = True
+        for pending in self._debounced.values():
+            pending.handle.cancel()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        for future in list(self._pending):
+            future.cancel()
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-lane counters, queue depth and queue wait times"""
+        return {lane.fn_id: lane.snapshot() for lane in self.lanes}
+
+
+class LocalRunnerPublisher(EventPublisher):
+    """Outbox publisher that hands events straight to a LocalJobRunner"""
+
+    def __init__(self, runner: LocalJobRunner):
+        self.runner = runner
+
+    def publish(self, events: List[OutboxEvent]) -> None:
+        for event in events:
+            self.runner.submit_threadsafe(
+                {"id": f"outbox-{event.id}", "name": event.name, "data": event.data}
+            )
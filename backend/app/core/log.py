@@ -0,0 +1,188 @@
+# app/core/log.py
+import atexit
+import copy
+import json
+import logging
+import queue
+import random
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.core.metrics import registry
+
+ROOT_LOGGER = "app"
+
+LOG_RECORDS_DROPPED = registry.counter(
+    "log_records_dropped_total", "Log records dropped because the log queue was full"
+)
+
+
+def _cap(value: Any, limit: int) -> Any:
+    """A field value safe to log: numbers as-is, anything else as a string of
+    at most `limit` characters (bytes are only described, never rendered)"""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        return f"<{len(value)} bytes>"
+    text = value if isinstance(value, str) else str(value)
+    if len(text) > limit:
+        return f"{text[:limit]}...(+{len(text) - limit} chars)"
+    return text
+
+
+def _quote(value: Any) -> str:
+    text = str(value)
+    if not text or any(char in text for char in ' ="\n'):
+        return json.dumps(text)
+    return text
+
+
+class StructuredFormatter(logging.Formatter):
+    """One line per record: `event key=value ...` or a JSON object"""
+
+    def __init__(self, output: str = "text"):
+        super().__init__()
+        self.json = output == "json"
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields: Dict[str, Any] = getattr(record, "fields", {})
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = self.formatException(record.exc_info)
+        if self.json:
+            entry = {
+                "ts": self.formatTime(record),
+                "level": record.levelname,
+                "logger": record.name,
+                "event": record.getMessage(),
+                **fields,
+            }
+            if exc_text:
+                entry["exc"] = exc_text
+            return json.dumps(entry, default=str)
+        line = " ".join(
+            [
+                self.formatTime(record),
+                record.levelname,
+                record.name,
+                record.getMessage(),
+                *(f"{key}={_quote(value)}" for key, value in fields.items()),
+            ]
+        )
+        return f"{line}\n{exc_text}" if exc_text else line
+
+
+class _QueueHandler(QueueHandler):
+    """Hands records to the listener thread without formatting them and
+    without ever blocking the caller: when the queue is full the record is
+    dropped (and counted)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Tracebacks reference live frames, so render them now
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc()
+
+
+_lock = threading.Lock()
+_listener: Optional[QueueListener] = None
+_handler: Optional[QueueHandler] = None
+
+
+def configure_logging() -> None:
+    """Route the `app.*` loggers through a queue to a background thread that
+    formats and writes them to stderr. Safe to call more than once."""
+    global _listener, _handler
+    with _lock:
+        if _listener is not None:
+            return
+        stream = logging.StreamHandler()
+        stream.setFormatter(StructuredFormatter(settings.LOG_FORMAT))
+        records: queue.Queue = queue.Queue(settings.LOG_QUEUE_SIZE)
+        _handler = _QueueHandler(records)
+        root = logging.getLogger(ROOT_LOGGER)
+        root.setLevel(settings.LOG_LEVEL.upper())
+        root.addHandler(_handler)
+        root.propagate = False
+        _listener = QueueListener(records, stream)
+        _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Write out the queued records and stop the listener thread"""
+    global _listener, _handler
+    with _lock:
+        if _listener is None:
+            return
+        logging.getLogger(ROOT_LOGGER).removeHandler(_handler)
+        _listener.stop()
+        _listener = _handler = None
+
+
+class StructuredLogger:
+    """Leveled logging of an event name plus key=value fields:
+
+        log.info("resume.parsed", candidate_id=candidate_id, chars=len(text))
+
+    Field values are capped at LOG_MAX_FIELD_CHARS. `sample=0.1` keeps about
+    one in ten records of a chatty event; LOG_SAMPLE_RATES overrides the rate
+    per event name. Nothing is built for a level that is disabled.
+    """
+
+    def __init__(self, name: str):
+        self.logger = logging.getLogger(name)
+
+    def _log(self, level: int, event: str, sample: float, exc_info: bool, fields):
+        if not self.logger.isEnabledFor(level):
+            return
+        rate = settings.LOG_SAMPLE_RATES.get(event, sample)
+        if rate < 1.0 and random.random() >= rate:
+            return
+        limit = settings.LOG_MAX_FIELD_CHARS
+        capped = {key: _cap(value, limit) for key, value in fields.items()}
+        if rate < 1.0:
+            capped["sample_rate"] = rate
+        self.logger.log(
+            level, event, exc_info=exc_info, extra={"fields": capped}, stacklevel=3
+        )
+
+    def debug(self, event: str, *, sample: float = 1.0, **fields: Any) -> None:
+        self._log(logging.DEBUG, event, sample, False, fields)
+
+    def info(self, event: str, *, sample: float = 1.0, **fields: Any) -> None:
+        self._log(logging.INFO, event, sample, False, fields)
+
+    def warning(self, event: str, *, sample: float = 1.0, **fields: Any) -> None:
+        self._log(logging.WARNING, event, sample, False, fields)
+
+    def error(self, event: str, *, sample: float = 1.0, **fields: Any) -> None:
+        self._log(logging.ERROR, event, sample, False, fields)
+
+    def exception(self, event: str, *, sample: float = 1.0, **fields: Any) -> None:
+        """ERROR with the traceback of the exception being handled"""
+        self._log(logging.ERROR, event, sample, True, fields)
+
+    def payload(self, event: str, **fields: Any) -> None:
+        """DEBUG dump of message bodies, previews and the like; only logged
+        with LOG_DEBUG_PAYLOADS (and LOG_LEVEL=DEBUG)"""
+        if settings.LOG_DEBUG_PAYLOADS:
+            self._log(logging.DEBUG, event, 1.0, False, fields)
+
+
+def get_logger(name: str) -> StructuredLogger:
+    """Logger for a module, e.g. get_logger("app.jobs.resume")"""
+    configure_logging()
+    return StructuredLogger(name)
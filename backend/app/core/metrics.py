@@ -0,0 +1,268 @@
+# app/core/metrics.py
+import bisect
+import contextlib
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# Prometheus default buckets (seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def _samples(self) -> Iterable[str]: ...
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self._samples(),
+        ]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (last one is +Inf)..., sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        position = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * (len(self.buckets) + 2)
+            series[position] += 1
+            series[-1] += value
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            values = sorted((key, list(series)) for key, series in self._values.items())
+        names = self.labelnames + ("le",)
+        for key, series in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), series):
+                cumulative += count
+                labels = _format_labels(names, key + (_format_value(bound),))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(series[-1])}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Registry:
+    """Process-local metrics in the Prometheus text exposition format"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, *args, **kwargs) -> Counter:
+        return self.register(Counter(*args, **kwargs))
+
+    def gauge(self, *args, **kwargs) -> Gauge:
+        return self.register(Gauge(*args, **kwargs))
+
+    def histogram(self, *args, **kwargs) -> Histogram:
+        return self.register(Histogram(*args, **kwargs))
+
+    def render(self, extra: Iterable[_Metric] = ()) -> str:
+        """Text exposition of the registered metrics plus `extra` ones built
+        at scrape time (e.g. job queue depths)"""
+        metrics = [*self._metrics, *extra]
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+
+registry = Registry()
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "HTTP requests handled", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route")
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being handled"
+)
+HTTP_RESPONSE_SIZE = registry.histogram(
+    "http_response_size_bytes",
+    "HTTP response body size",
+    ("method", "route"),
+    buckets=SIZE_BUCKETS,
+)
+DB_STATEMENTS_PER_REQUEST = registry.histogram(
+    "db_statements_per_request",
+    "SQL statements executed per HTTP request",
+    ("route",),
+    buckets=COUNT_BUCKETS,
+)
+DB_SECONDS_PER_REQUEST = registry.histogram(
+    "db_statement_seconds_per_request",
+    "Time spent in SQL statements per HTTP request",
+    ("route",),
+)
+DB_REPEATED_STATEMENTS = registry.counter(
+    "db_repeated_statement_requests_total",
+    "Requests that ran one SQL statement at least the N+1 threshold times",
+    ("route",),
+)
+JOB_STAGE_DURATION = registry.histogram(
+    "job_stage_duration_seconds",
+    "Duration of each stage of a background job run",
+    ("job", "stage"),
+    buckets=DEFAULT_BUCKETS + (30, 60, 120),
+)
+
+
+class StageTimer:
+    """Per-stage durations of one job run.
+
+    Stages are timed with `with timer.stage("extract"): ...` (or `record`
+    for a duration measured elsewhere, e.g. inside a memoized step) and only
+    reach the histogram on `observe()`, so a run that Inngest re-invokes
+    after each step is counted once.
+    """
+
+    def __init__(self, job: str):
+        self.job = job
+        self.timings: Dict[str, float] = {}
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started_at)
+
+    def record(self, name: str, seconds: float) -> None:
+        self.timings[name] = round(self.timings.get(name, 0.0) + seconds, 6)
+
+    def total(self) -> float:
+        return round(sum(self.timings.values()), 6)
+
+    def observe(self) -> Dict[str, float]:
+        for name, seconds in self.timings.items():
+            JOB_STAGE_DURATION.observe(seconds, job=self.job, stage=name)
+        return {**self.timings, "total": self.total()}
+
+
+def job_runner_metrics(stats: Dict[str, Dict[str, float]]) -> List[_Metric]:
+    """Per-lane gauges and counters from LocalJobRunner.stats()"""
+    gauges = {
+        "job_lane_queued": "Runs waiting in the lane",
+        "job_lane_running": "Runs executing in the lane",
+        "job_lane_debouncing": "Debounce keys waiting for their quiet period",
+    }
+    counters = {
+        "job_lane_started_total": ("started", "Attempts started, including retries"),
+        "job_lane_succeeded_total": ("succeeded", "Runs that succeeded"),
+        "job_lane_failed_total": ("failed", "Runs that failed after all retries"),
+        "job_lane_retries_total": ("retries", "Attempts retried"),
+        "job_lane_wait_seconds_total": ("wait_seconds", "Time attempts spent queued"),
+        "job_lane_run_seconds_total": ("run_seconds", "Time attempts spent running"),
+    }
+    metrics: List[_Metric] = []
+    for name, documentation in gauges.items():
+        gauge = Gauge(name, documentation, ("lane",))
+        field = name.removeprefix("job_lane_")
+        for lane, values in stats.items():
+            gauge.set(values[field], lane=lane)
+        metrics.append(gauge)
+    for name, (field, documentation) in counters.items():
+        counter = Counter(name, documentation, ("lane",))
+        for lane, values in stats.items():
+            counter.inc(values[field], lane=lane)
+        metrics.append(counter)
+    max_wait = Gauge(
+        "job_lane_max_wait_seconds", "Longest time an attempt waited", ("lane",)
+    )
+    for lane, values in stats.items():
+        max_wait.set(values["max_wait_seconds"], lane=lane)
+    metrics.append(max_wait)
+    return metrics
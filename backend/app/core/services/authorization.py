@@ -0,0 +1,115 @@
+# app/core/services/authorization.py
+import threading
+import time
+from typing import Dict, Optional, Set, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.organization import Organizations
+from app.models.organization_member import MemberRole, OrganizationMember
+
+
+class OrganizationAuthorizationService:
+    """Resolves and caches a user's role in every organization they belong to.
+
+    The cache maps ``user_id -> {org_id: role}``, plus the orgs the user was
+    confirmed not to belong to. Entries are dropped explicitly when
+    memberships change in this process, and expire after a short TTL so
+    changes made by other workers are picked up too.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._cache: Dict[int, Tuple[float, Dict[str, MemberRole], Set[str]]] = {}
+        self._lock = threading.Lock()
+
+    def load_roles(self, user_id: int, db: Session) -> Dict[str, MemberRole]:
+        """Fetch the user's roles for all orgs (owned or member) in one query"""
+        rows = (
+            db.query(
+                Organizations.id,
+                Organizations.owner_user_id,
+                OrganizationMember.role,
+            )
+            .outerjoin(
+                OrganizationMember,
+                and_(
+                    OrganizationMember.organization_id == Organizations.id,
+                    OrganizationMember.user_id == user_id,
+                ),
+            )
+            .filter(
+                or_(
+                    Organizations.owner_user_id == user_id,
+                    OrganizationMember.user_id == user_id,
+                )
+            )
+            .all()
+        )
+
+        roles = {
+            org_id: MemberRole.OWNER if owner_id == user_id else role
+            for org_id, owner_id, role in rows
+        }
+
+        with self._lock:
+            self._cache[user_id] = (time.monotonic() + self.ttl_seconds, roles, set())
+        return roles
+
+    def _entry(self, user_id: int):
+        entry = self._cache.get(user_id)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry
+        return None
+
+    def get_roles(self, user_id: int, db: Session) -> Dict[str, MemberRole]:
+        """Return the cached role map for a user, loading it on a miss"""
+        entry = self._entry(user_id)
+        if entry is not None:
+            return entry[1]
+        return self.load_roles(user_id, db)
+
+    def get_role(self, org_id: str, user_id: int, db: Session) -> Optional[MemberRole]:
+        """Return the user's role in an organization, or None if not a member.
+
+        A miss on a warm cache is re-checked against the database once, so an
+        org created or joined through another worker is not denied for a whole
+        TTL. The denial is then cached with the entry, so repeated requests
+        from a non-member don't query again.
+        """
+        entry = self._entry(user_id)
+        if entry is None:
+            # Just loaded, so a miss needs no second look
+            roles = self.load_roles(user_id, db)
+        elif org_id in entry[1] or org_id in entry[2]:
+            return entry[1].get(org_id)
+        else:
+            roles = self.load_roles(user_id, db)
+        role = roles.get(org_id)
+        if role is None:
+            with self._lock:
+                entry = self._cache.get(user_id)
+                if entry is not None:
+                    entry[2].add(org_id)
+        return role
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            self._cache.pop(user_id, None)
+
+    def invalidate_organization(self, org_id: str) -> None:
+        with self._lock:
+            stale_users = [
+                user_id
+                for user_id, (_, roles, denied) in self._cache.items()
+                if org_id in roles or org_id in denied
+            ]
+            for user_id in stale_users:
+                del self._cache[user_id]
+
+
+org_authorization = OrganizationAuthorizationService(
+    ttl_seconds=settings.ORG_PERMISSION_CACHE_TTL_SECONDS
+)
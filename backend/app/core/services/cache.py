@@ -0,0 +1,165 @@
+# app/core/services/cache.py
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Hashable, NamedTuple, Optional, Tuple
+
+from app.config import settings
+
+
+class CacheBackend(ABC):
+    """Key/value store for serialized responses plus per-namespace generations"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        ...
+
+    @abstractmethod
+    def get_generation(self, namespace: str) -> int:
+        ...
+
+    @abstractmethod
+    def bump_generation(self, namespace: str) -> int:
+        ...
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Per-process LRU cache with TTL expiry"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    def bump_generation(self, namespace: str) -> int:
+        with self._lock:
+            generation = self._generations.get(namespace, 0) + 1
+            self._generations[namespace] = generation
+            # Old generations can never be read again; free them right away
+            prefix = f"{namespace}:"
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+            return generation
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache shared by all workers. Requires the optional `redis` package."""
+
+    def __init__(self, url: str):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "CACHE_BACKEND_URL points at Redis but the 'redis' package is not installed"
+            ) from e
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        self._client.set(key, value, ex=ttl_seconds)
+
+    def get_generation(self, namespace: str) -> int:
+        return int(self._client.get(f"generation:{namespace}") or 0)
+
+    def bump_generation(self, namespace: str) -> int:
+        # Entries of older generations are left to expire via their TTL
+        return int(self._client.incr(f"generation:{namespace}"))
+
+
+def create_cache_backend(url: str) -> CacheBackend:
+    if url.startswith(("redis://", "rediss://")):
+        return RedisCacheBackend(url)
+    if url.startswith("memory://"):
+        return InMemoryCacheBackend(max_entries=settings.CACHE_MAX_ENTRIES)
+    raise ValueError(f"Unsupported CACHE_BACKEND_URL: {url}")
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+
+
+def make_etag(*parts: object) -> str:
+    """Strong ETag from a serialized response body, or from row versions
+    (ids, counts, timestamps, query params)"""
+    if len(parts) == 1 and isinstance(parts[0], bytes):
+        data = parts[0]
+    else:
+        data = "|".join(map(str, parts)).encode()
+    return f'"{hashlib.sha256(data).hexdigest()[:32]}"'
+
+
+class ResponseCache:
+    """Versioned response cache for one resource namespace.
+
+    Every key embeds the namespace's current generation, so `invalidate()` is a
+    single counter bump no matter how many responses are cached.
+    """
+
+    def __init__(self, backend: CacheBackend, namespace: str, ttl_seconds: int):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+
+    def make_key(self, *parts: Hashable) -> str:
+        generation = self.backend.get_generation(self.namespace)
+        return f"{self.namespace}:{generation}:" + "|".join(map(str, parts))
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        if self.ttl_seconds <= 0:
+            return None
+        value = self.backend.get(key)
+        if value is None:
+            return None
+        etag, _, body = value.partition(b"\n")
+        return CachedResponse(body=body, etag=etag.decode())
+
+    def set(self, key: str, body: bytes) -> CachedResponse:
+        """Store a serialized body; the ETag is computed once and kept alongside"""
+        entry = CachedResponse(body=body, etag=make_etag(body))
+        if self.ttl_seconds > 0:
+            self.backend.set(key, entry.etag.encode() + b"\n" + body, self.ttl_seconds)
+        return entry
+
+    def invalidate(self) -> None:
+        self.backend.bump_generation(self.namespace)
+
+
+cache_backend = create_cache_backend(settings.CACHE_BACKEND_URL)
+
+job_listing_cache = ResponseCache(
+    cache_backend,
+    namespace="job-listings",
+    ttl_seconds=settings.JOB_LISTING_CACHE_TTL_SECONDS,
+)
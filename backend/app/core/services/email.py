@@ -1,9 +1,121 @@
 # app/services/email.py
+import queue
 import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from email.mime.text import MIMEText
+from html import escape
 from email.mime.multipart import MIMEMultipart
-from typing import List
+from typing import Iterator, List, NamedTuple, Optional
 from app.config import settings
+from app.core.log import get_logger
+
+log = get_logger("app.email")
+
+
+class OutgoingEmail(NamedTuple):
+    to_email: str
+    subject: str
+    html_content: str
+    text_content: Optional[str] = None
+
+
+class DeliveryResult(NamedTuple):
+    to_email: str
+    ok: bool
+    error: Optional[str] = None
+
+
+class _PooledConnection:
+    def __init__(self, server: smtplib.SMTP):
+        self.server = server
+        self.messages_sent = 0
+
+
+# Errors after which the connection is unusable and the message may be retried
+_CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+class SMTPConnectionPool:
+    """Small pool of connected, authenticated SMTP sessions.
+
+    Connections are opened lazily (connect + STARTTLS + login once), reused for
+    many messages, and recycled after `max_messages` to respect server limits.
+    A connection that fails mid-send is discarded; the caller reconnects.
+    """
+
+    def __init__(
+        self,
+        host: Optional[str],
+        port: int,
+        user: Optional[str],
+        password: Optional[str],
+        use_tls: bool,
+        size: int,
+        timeout: float,
+        max_messages: int,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.use_tls = use_tls
+        self.size = size
+        self.timeout = timeout
+        self.max_messages = max_messages
+        self._idle: "queue.LifoQueue[_PooledConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _connect(self) -> _PooledConnection:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.user:
+                server.login(self.user, self.password)
+        except Exception:
+            server.close()
+            raise
+        return _PooledConnection(server)
+
+    @staticmethod
+    def _close(connection: _PooledConnection) -> None:
+        try:
+            connection.server.quit()
+        except Exception:
+            connection.server.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[_PooledConnection]:
+        """Borrow a connection; it is returned to the pool unless it broke"""
+        with self._slots:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                connection = self._connect()
+            try:
+                yield connection
+            except _CONNECTION_ERRORS:
+                self._close(connection)
+                raise
+            except Exception:
+                # SMTP-level errors (refused recipient, etc.) leave the session
+                # usable; smtplib has already reset the transaction
+                self._idle.put(connection)
+                raise
+            if connection.messages_sent >= self.max_messages:
+                self._close(connection)
+            else:
+                self._idle.put(connection)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._close(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
 
 class EmailService:
     def __init__(self):
@@ -13,7 +125,71 @@ class EmailService:
         self.smtp_password = settings.SMTP_PASSWORD
         self.from_email = settings.EMAIL_FROM
         self.from_name = settings.EMAIL_FROM_NAME
-    
+        self.pool = SMTPConnectionPool(
+            host=self.smtp_host,
+            port=self.smtp_port,
+            user=self.smtp_user,
+            password=self.smtp_password,
+            use_tls=settings.SMTP_USE_TLS,
+            size=settings.SMTP_POOL_SIZE,
+            timeout=settings.SMTP_TIMEOUT_SECONDS,
+            max_messages=settings.SMTP_MAX_MESSAGES_PER_CONNECTION,
+        )
+
+    def build_message(self, email: OutgoingEmail) -> MIMEMultipart:
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = email.subject
+        msg["From"] = f"{self.from_name} <{self.from_email}>"
+        msg["To"] = email.to_email
+
+        # Add text and HTML parts
+        if email.text_content:
+            msg.attach(MIMEText(email.text_content, "plain"))
+        msg.attach(MIMEText(email.html_content, "html"))
+        return msg
+
+    def _deliver(self, msg: MIMEMultipart, to_email: str) -> DeliveryResult:
+        """Send one message over a pooled connection, reconnecting once if the
+        connection turns out to be dead (e.g. closed by the server while idle)"""
+        for attempt in range(2):
+            try:
+                with self.pool.connection() as connection:
+                    refused = connection.server.send_message(msg)
+                    connection.messages_sent += 1
+                if to_email in refused:
+                    code, reason = refused[to_email]
+                    return DeliveryResult(to_email, False, f"{code} {reason!r}")
+                return DeliveryResult(to_email, True)
+            except _CONNECTION_ERRORS as e:
+                if attempt == 1:
+                    return DeliveryResult(to_email, False, f"connection error: {e}")
+            except smtplib.SMTPRecipientsRefused as e:
+                code, reason = e.recipients.get(to_email, (None, "refused"))
+                return DeliveryResult(to_email, False, f"{code} {reason!r}")
+            except (smtplib.SMTPException, OSError) as e:
+                return DeliveryResult(to_email, False, str(e))
+
+    def send_many(self, emails: List[OutgoingEmail]) -> List[DeliveryResult]:
+        """Send many messages over the connection pool.
+
+        Messages are spread across up to SMTP_POOL_SIZE connections, each of
+        which sends its share back to back. Returns one result per message, in
+        order; failures are reported, not raised.
+        """
+        if not emails:
+            return []
+        messages = [self.build_message(email) for email in emails]
+        workers = min(self.pool.size, len(emails))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    self._deliver, messages, [email.to_email for email in emails]
+                )
+            )
+        failed = sum(1 for result in results if not result.ok)
+        log.info("email.batch_sent", sent=len(results) - failed, failed=failed)
+        return results
+
     def send_email(
         self,
         to_email: str,
@@ -22,29 +198,16 @@ class EmailService:
         text_content: str = None
     ):
         """Send an email using SMTP"""
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = subject
-        msg["From"] = f"{self.from_name} <{self.from_email}>"
-        msg["To"] = to_email
-        
-        # Add text and HTML parts
-        if text_content:
-            part1 = MIMEText(text_content, "plain")
-            msg.attach(part1)
-        
-        part2 = MIMEText(html_content, "html")
-        msg.attach(part2)
-        
-        # Send email
-        try:
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_password)
-                server.send_message(msg)
-                print(f"Email sent to {to_email}")
-        except Exception as e:
-            print(f"Failed to send email: {e}")
-            raise
+        result = self._deliver(
+            self.build_message(
+                OutgoingEmail(to_email, subject, html_content, text_content)
+            ),
+            to_email,
+        )
+        if not result.ok:
+            log.warning("email.failed", to=to_email, error=result.error)
+            raise smtplib.SMTPException(result.error)
+        log.info("email.sent", to=to_email)
     
     def send_daily_applications_summary(
         self,
@@ -53,14 +216,30 @@ class EmailService:
         applications: List[dict]
     ):
         """Send daily summary of new applications"""
-        subject = f"New Applications - {len(applications)} candidates"
+        email = self.render_daily_applications_summary(
+            to_email, user_name, applications
+        )
+        self.send_email(email.to_email, email.subject, email.html_content)
+
+    def render_daily_applications_summary(
+        self,
+        to_email: str,
+        user_name: str,
+        applications: List[dict],
+        total: Optional[int] = None,
+    ) -> OutgoingEmail:
+        """Render the daily summary; `applications` are the top matches and
+        `total` the number of new applications (defaults to their count)"""
+        if total is None:
+            total = len(applications)
+        subject = f"New Applications - {total} candidates"
         
         # Build HTML content
         html_content = f"""
         <html>
           <body style="font-family: Arial, sans-serif;">
-            <h1>Hi {user_name}! 👋</h1>
-            <p>You have <strong>{len(applications)}</strong> new applications today.</p>
+            <h1>Hi {escape(user_name)}! 👋</h1>
+            <p>You have <strong>{total}</strong> new applications today.</p>
             
             <h2>Top Matches:</h2>
             <table style="width: 100%; border-collapse: collapse;">
@@ -75,8 +254,8 @@ class EmailService:
             match_color = "green" if app["rating"] >= 90 else "blue" if app["rating"] >= 75 else "orange"
             html_content += f"""
               <tr style="border-bottom: 1px solid #ddd;">
-                <td style="padding: 12px;">{app["user_name"]}</td>
-                <td style="padding: 12px;">{app["job_title"]}</td>
+                <td style="padding: 12px;">{escape(app["user_name"])}</td>
+                <td style="padding: 12px;">{escape(app["job_title"])}</td>
                 <td style="padding: 12px; text-align: center;">
                   <span style="background-color: {match_color}; color: white; padding: 4px 8px; border-radius: 4px;">
                     {app["rating"]}%
@@ -95,6 +274,6 @@ class EmailService:
         </html>
         """
         
-        self.send_email(to_email, subject, html_content)
+        return OutgoingEmail(to_email, subject, html_content)
 
 email_service = EmailService()
\ No newline at end of file
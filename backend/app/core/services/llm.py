@@ -0,0 +1,286 @@
+# app/core/services/llm.py
+import hashlib
+import json
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+from app.config import settings
+
+
+class LLMError(Exception):
+    """The provider failed to produce a response"""
+
+
+class RateLimitError(LLMError):
+    """The provider rejected the call for quota reasons; retry later"""
+
+
+@dataclass
+class LLMResponse:
+    text: str
+    input_tokens: int
+    output_tokens: int
+
+
+@dataclass
+class LLMUsage:
+    calls: int = 0
+    rate_limited: int = 0
+    cache_hits: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    def cost_usd(self) -> float:
+        return (
+            self.input_tokens * settings.LLM_INPUT_COST_PER_MTOK
+            + self.output_tokens * settings.LLM_OUTPUT_COST_PER_MTOK
+        ) / 1_000_000
+
+
+_usage_lock = threading.Lock()
+usage = LLMUsage()
+
+
+def record_usage(**amounts: int) -> None:
+    with _usage_lock:
+        for name, amount in amounts.items():
+            setattr(usage, name, getattr(usage, name) + amount)
+
+
+def usage_snapshot() -> Dict[str, Any]:
+    """Calls, tokens and estimated cost since start (or the last reset)"""
+    with _usage_lock:
+        return {**asdict(usage), "cost_usd": round(usage.cost_usd(), 6)}
+
+
+def reset_usage() -> None:
+    with _usage_lock:
+        for name in asdict(usage):
+            setattr(usage, name, 0)
+
+
+def estimate_tokens(text: str) -> int:
+    # About four characters per token for English text
+    return max(1, len(text) // 4)
+
+
+class LLMProvider(ABC):
+    """Generates text, or JSON matching `response_schema`, for a prompt.
+
+    Calls are blocking; async callers run them in a thread.
+    """
+
+    @abstractmethod
+    def generate(
+        self, prompt: str, response_schema: Optional[Dict[str, Any]] = None
+    ) -> LLMResponse: ...
+
+
+class GeminiProvider(LLMProvider):
+    def __init__(self, api_key: str, model: str):
+        self.api_key = api_key
+        self.model = model
+
+    def generate(self, prompt, response_schema=None):
+        # Imported on first use: the SDK is slow to import and API-only
+        # processes never call it
+        import google.generativeai as genai
+        from google.api_core import exceptions
+
+        genai.configure(api_key=self.api_key)
+        generation_config = None
+        if response_schema is not None:
+            generation_config = {
+                "response_mime_type": "application/json",
+                "response_schema": response_schema,
+            }
+        model = genai.GenerativeModel(self.model, generation_config=generation_config)
+        try:
+            response = model.generate_content(prompt)
+        except (exceptions.ResourceExhausted, exceptions.TooManyRequests) as e:
+            record_usage(rate_limited=1)
+            raise RateLimitError(str(e)) from e
+        metadata = getattr(response, "usage_metadata", None)
+        input_tokens = getattr(metadata, "prompt_token_count", 0) or estimate_tokens(
+            prompt
+        )
+        output_tokens = getattr(metadata, "candidates_token_count", 0) or (
+            estimate_tokens(response.text)
+        )
+        record_usage(calls=1, input_tokens=input_tokens, output_tokens=output_tokens)
+        return LLMResponse(response.text, input_tokens, output_tokens)
+
+
+class FakeProvider(LLMProvider):
+    """Offline stand-in for load tests and benchmarks.
+
+    Responses are derived from a hash of the prompt, so the same prompt always
+    gets the same answer. Latency is log-normal around `latency_median`, and
+    `rate_limit_rate` of the attempts raise RateLimitError; both are drawn
+    per (prompt, attempt), so a run is reproducible whatever the scheduling.
+    Attempts are counted for the `max_tracked_prompts` most recent prompts.
+    """
+
+    def __init__(
+        self,
+        latency_median: float = 1.5,
+        latency_sigma: float = 0.5,
+        rate_limit_rate: float = 0.0,
+        seed: int = 0,
+        max_tracked_prompts: int = 10_000,
+    ):
+        self.latency_median = latency_median
+        self.latency_sigma = latency_sigma
+        self.rate_limit_rate = rate_limit_rate
+        self.seed = seed
+        self.max_tracked_prompts = max_tracked_prompts
+        self._attempts: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _rng(self, prompt: str, salt: str) -> random.Random:
+        digest = hashlib.sha256(f"{self.seed}:{salt}:{prompt}".encode()).digest()
+        return random.Random(digest)
+
+    def generate(self, prompt, response_schema=None):
+        key = hashlib.sha256(prompt.encode()).hexdigest()
+        with self._lock:
+            attempt = self._attempts.pop(key, 0)
+            self._attempts[key] = attempt + 1
+            if len(self._attempts) > self.max_tracked_prompts:
+                self._attempts.popitem(last=False)
+        timing = self._rng(prompt, f"attempt-{attempt}")
+        if timing.random() < self.rate_limit_rate:
+            # Rejections come back quickly, like a real 429
+            time.sleep(timing.uniform(0.01, 0.05))
+            record_usage(rate_limited=1)
+            raise RateLimitError("Fake provider: rate limit exceeded")
+        time.sleep(timing.lognormvariate(0, self.latency_sigma) * self.latency_median)
+
+        content = self._rng(prompt, "content")
+        if response_schema is None:
+            text = _fake_markdown(content)
+        else:
+            text = json.dumps(_fake_value(response_schema, content))
+        input_tokens = estimate_tokens(prompt)
+        output_tokens = estimate_tokens(text)
+        record_usage(calls=1, input_tokens=input_tokens, output_tokens=output_tokens)
+        return LLMResponse(text, input_tokens, output_tokens)
+
+
+_WORDS = (
+    "experienced engineer delivered scalable services led team migration "
+    "improved reliability designed APIs mentored developers shipped features "
+    "optimized queries automated deployments collaborated with product"
+).split()
+
+
+def _fake_sentence(rng: random.Random) -> str:
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(6, 14))]
+    return " ".join(words).capitalize() + "."
+
+
+def _fake_markdown(rng: random.Random) -> str:
+    sections = ["Professional Summary", "Key Skills", "Work Experience Highlights"]
+    return "\n\n".join(
+        f"## {section}\n"
+        + "\n".join(f"- {_fake_sentence(rng)}" for _ in range(rng.randint(2, 4)))
+        for section in sections
+    )
+
+
+def _fake_value(schema: Dict[str, Any], rng: random.Random) -> Any:
+    """A value of the shape `schema` (OpenAPI subset used by Gemini) describes"""
+    kind = schema.get("type")
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+    if kind == "object":
+        return {
+            name: _fake_value(prop, rng)
+            for name, prop in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        return [
+            _fake_value(schema.get("items", {}), rng) for _ in range(rng.randint(2, 3))
+        ]
+    if kind == "integer":
+        return rng.randint(schema.get("minimum", 0), schema.get("maximum", 100))
+    if kind == "number":
+        return round(rng.uniform(schema.get("minimum", 0), schema.get("maximum", 1)), 3)
+    if kind == "boolean":
+        return rng.random() < 0.5
+    return _fake_sentence(rng)
+
+
+class CachingProvider(LLMProvider):
+    """LRU cache in front of a provider, for prompts that repeat (re-uploads
+    of the same resume, re-ranks whose inputs did not change the prompt)"""
+
+    def __init__(self, provider: LLMProvider, max_entries: int):
+        self.provider = provider
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, LLMResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, response_schema=None):
+        key = hashlib.sha256(
+            json.dumps([prompt, response_schema], sort_keys=True).encode()
+        ).hexdigest()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+        if cached is not None:
+            record_usage(cache_hits=1)
+            return cached
+        response = self.provider.generate(prompt, response_schema)
+        with self._lock:
+            self._entries[key] = response
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return response
+
+
+_provider: Optional[LLMProvider] = None
+_provider_lock = threading.Lock()
+
+
+def build_provider() -> Optional[LLMProvider]:
+    """The provider configured in settings; None when Gemini has no API key"""
+    if settings.LLM_PROVIDER == "fake":
+        provider: LLMProvider = FakeProvider(
+            latency_median=settings.LLM_FAKE_LATENCY_MEDIAN_SECONDS,
+            latency_sigma=settings.LLM_FAKE_LATENCY_SIGMA,
+            rate_limit_rate=settings.LLM_FAKE_RATE_LIMIT_RATE,
+            seed=settings.LLM_FAKE_SEED,
+        )
+    elif settings.LLM_PROVIDER == "gemini":
+        if not settings.GEMINI_API_KEY:
+            return None
+        provider = GeminiProvider(settings.GEMINI_API_KEY, settings.LLM_MODEL)
+    else:
+        raise ValueError(f"Unknown LLM_PROVIDER: {settings.LLM_PROVIDER}")
+    if settings.LLM_CACHE_SIZE > 0:
+        provider = CachingProvider(provider, settings.LLM_CACHE_SIZE)
+    return provider
+
+
+def get_llm_provider() -> Optional[LLMProvider]:
+    """Process-wide provider, built from settings on first use"""
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                _provider = build_provider()
+    return _provider
+
+
+def set_llm_provider(provider: Optional[LLMProvider]) -> None:
+    """Replace the process-wide provider (benchmarks, local experiments)"""
+    global _provider
+    with _provider_lock:
+        _provider = provider
@@ -0,0 +1,78 @@
+# app/core/services/match_scoring.py
+import hashlib
+import json
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+from app.models.job_listing import JobListings
+
+# Bump when the ranking prompt or inputs change, so every application is
+# re-scored once
+FINGERPRINT_VERSION = "1"
+
+NO_RESUME = "No resume provided"
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+STOPWORDS = frozenset("""
+    a about above across after all also an and any are as at be been being
+    both but by can could do does for from had has have having he her his how
+    i if in into is it its just more most my no not of on or our out over own
+    per same she should so some such than that the their them then there these
+    they this those through to too under up us very was we were what when where
+    which while who will with within would you your
+    ability able candidate candidates company experience job looking plus
+    preferred required requirements responsibilities role team work working
+    years year strong skills excellent good great new
+    """.split())
+
+TITLE_WEIGHT = 3
+
+
+def ranking_inputs(
+    job: JobListings, resume_summary: Optional[str], cover_letter: Optional[str]
+) -> Dict[str, str]:
+    """Everything the match score depends on, as calculate_match_score_* kwargs"""
+    return {
+        "job_title": job.title,
+        "job_description": job.description or "",
+        "experience_level": getattr(
+            job.experience_level, "value", str(job.experience_level)
+        ),
+        "job_type": getattr(job.type, "value", str(job.type)),
+        "resume_summary": resume_summary or NO_RESUME,
+        "cover_letter": cover_letter or "",
+    }
+
+
+def input_fingerprint(inputs: Dict[str, str]) -> str:
+    """Stable hash of the ranking inputs; equal fingerprints mean the stored
+    rating is still current"""
+    payload = json.dumps([FINGERPRINT_VERSION, inputs], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def keywords(text: str) -> List[str]:
+    return [
+        token
+        for token in _TOKEN.findall(text.lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+def keyword_score(inputs: Dict[str, str]) -> int:
+    """Cheap 0-100 match score: the share of the job's keywords (weighted by
+    how often the posting uses them, title words counting triple) that appear
+    in the candidate's resume summary or cover letter"""
+    if inputs["resume_summary"] == NO_RESUME and not inputs["cover_letter"]:
+        return 0
+    wanted = Counter(keywords(inputs["job_description"]))
+    for token in keywords(inputs["job_title"]):
+        wanted[token] += TITLE_WEIGHT
+    total = sum(wanted.values())
+    if not total:
+        return 0
+    offered = set(keywords(inputs["resume_summary"] + " " + inputs["cover_letter"]))
+    matched = sum(weight for token, weight in wanted.items() if token in offered)
+    return round(100 * matched / total)
@@ -0,0 +1,277 @@
+# app/core/services/outbox.py
+import asyncio
+import contextlib
+import datetime as dt
+import queue
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.log import get_logger
+from app.db.database import SessionLocal
+from app.models.outbox import OutboxEvent
+
+log = get_logger("app.outbox")
+
+
+def enqueue_event(db: Session, name: str, data: Dict[str, Any]) -> OutboxEvent:
+    """Stage a background event in the caller's transaction.
+
+    Nothing is sent until the caller commits; the relay then delivers it. If
+    the transaction rolls back, the event disappears with it.
+    """
+    event = OutboxEvent(name=name, data=data)
+    db.add(event)
+    return event
+
+
+def dead_events(db: Session, limit: int = 100) -> List[OutboxEvent]:
+    """Events that used up OUTBOX_MAX_ATTEMPTS; the relay no longer picks
+    them up"""
+    return (
+        db.query(OutboxEvent)
+        .filter(OutboxEvent.attempts >= settings.OUTBOX_MAX_ATTEMPTS)
+        .order_by(OutboxEvent.id)
+        .limit(limit)
+        .all()
+    )
+
+
+def requeue_dead_events(db: Session, ids: Optional[Sequence[int]] = None) -> int:
+    """Give dead events (all of them, or those in `ids`) a fresh set of
+    attempts; commits and returns how many were requeued"""
+    query = db.query(OutboxEvent).filter(
+        OutboxEvent.attempts >= settings.OUTBOX_MAX_ATTEMPTS
+    )
+    if ids is not None:
+        query = query.filter(OutboxEvent.id.in_(ids))
+    requeued = query.update(
+        {"attempts": 0, "next_attempt_at": None}, synchronize_session=False
+    )
+    db.commit()
+    return requeued
+
+
+class PublishRejectedError(Exception):
+    """The publisher reached its service, which refused the events themselves
+    (malformed, too large). Sending the same batch again won't help."""
+
+
+class EventPublisher(ABC):
+    """Delivers a batch of outbox events; raises if the batch was not accepted.
+
+    Raises PublishRejectedError when the events were refused; any other error
+    means the service could not be reached or failed, and says nothing about
+    the events.
+    """
+
+    @abstractmethod
+    def publish(self, events: List[OutboxEvent]) -> None: ...
+
+
+class InngestPublisher(EventPublisher):
+    def publish(self, events: List[OutboxEvent]) -> None:
+        # Imported on first publish: the SDK is slow to import, and API
+        # processes only need it once there is something to send
+        import inngest
+
+        from app.core.background.inngest_client import inngest_client
+
+        # The outbox id doubles as the Inngest event id, so a batch that is
+        # re-sent after a crash is deduplicated by Inngest
+        try:
+            inngest_client.send_sync(
+                [
+                    inngest.Event(
+                        id=f"outbox-{event.id}", name=event.name, data=event.data
+                    )
+                    for event in events
+                ]
+            )
+        except ValueError:
+            # A body that isn't JSON: an error page from a proxy in front of
+            # the Event API (502, 504), not an answer about these events
+            raise
+        except Exception as e:
+            # The SDK retries connection errors and 5xx itself and gives up
+            # with "never received response"; anything else is the Event API
+            # (or the SDK, before sending) refusing this payload
+            if "never received response" in str(e):
+                raise
+            raise PublishRejectedError(str(e)) from e
+
+
+class LocalQueuePublisher(EventPublisher):
+    """In-process stand-in for Inngest (development and tests)"""
+
+    def __init__(self):
+        self.queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+
+    def publish(self, events: List[OutboxEvent]) -> None:
+        for event in events:
+            self.queue.put(
+                {"id": f"outbox-{event.id}", "name": event.name, "data": event.data}
+            )
+
+
+def create_publisher(kind: str) -> EventPublisher:
+    if kind == "inngest":
+        return InngestPublisher()
+    if kind == "local":
+        return LocalQueuePublisher()
+    raise ValueError(f"Unsupported OUTBOX_PUBLISHER: {kind}")
+
+
+class OutboxRelay:
+    """Drains the outbox to a publisher in batches, with retry and backoff.
+
+    Delivery is at-least-once: rows are deleted only after the publisher
+    accepted them. On PostgreSQL, rows are claimed with SKIP LOCKED so several
+    workers can relay concurrently without sending the same batch twice.
+    """
+
+    def __init__(self, publisher: EventPublisher):
+        self.publisher = publisher
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    def _backoff(attempts: int) -> dt.timedelta:
+        seconds = settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+        return dt.timedelta(seconds=min(seconds, settings.OUTBOX_RETRY_MAX_SECONDS))
+
+    def relay_batch(self) -> int:
+        """Publish one batch of due events; returns how many were delivered"""
+        db = SessionLocal()
+        try:
+            now = dt.datetime.now(dt.UTC)
+            events = (
+                db.query(OutboxEvent)
+                .filter(
+                    OutboxEvent.attempts < settings.OUTBOX_MAX_ATTEMPTS,
+                    or_(
+                        OutboxEvent.next_attempt_at.is_(None),
+                        OutboxEvent.next_attempt_at <= now,
+                    ),
+                )
+                .order_by(OutboxEvent.id)
+                .limit(settings.OUTBOX_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            if not events:
+                return 0
+
+            delivered, failed = self._publish(events)
+            for event, error in failed:
+                event.attempts += 1
+                event.next_attempt_at = now + self._backoff(event.attempts)
+                event.last_error = str(error)[:1000]
+                if event.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+                    # Kept for inspection; requeue with requeue_dead_events
+                    log.error(
+                        "outbox.event_dead",
+                        event_id=event.id,
+                        name=event.name,
+                        attempts=event.attempts,
+                        error=error,
+                    )
+            if failed:
+                log.warning(
+                    "outbox.publish_failed",
+                    events=len(failed),
+                    delivered=len(delivered),
+                    error=failed[0][1],
+                )
+            if delivered:
+                db.query(OutboxEvent).filter(
+                    OutboxEvent.id.in_([event.id for event in delivered])
+                ).delete(synchronize_session=False)
+            db.commit()
+            return len(delivered)
+        finally:
+            db.close()
+
+    def _publish(
+        self, events: List[OutboxEvent]
+    ) -> Tuple[List[OutboxEvent], List[Tuple[OutboxEvent, Exception]]]:
+        """Publish a batch; if it is rejected, split it in half and retry each
+        half, so one bad event (say, an oversized payload) only fails itself.
+        Any other error (service down, timeout) fails every event not yet
+        delivered at once, so an outage costs one call per poll rather than
+        one per event. Returns the delivered events and the failed ones with
+        their error."""
+        delivered: List[OutboxEvent] = []
+        failed: List[Tuple[OutboxEvent, Exception]] = []
+        try:
+            self._publish_or_split(events, delivered, failed)
+        except Exception as e:
+            done = {event.id for event in delivered}
+            done.update(event.id for event, _ in failed)
+            failed += [(event, e) for event in events if event.id not in done]
+        return delivered, failed
+
+    def _publish_or_split(
+        self,
+        events: List[OutboxEvent],
+        delivered: List[OutboxEvent],
+        rejected: List[Tuple[OutboxEvent, Exception]],
+    ) -> None:
+        try:
+            self.publisher.publish(events)
+        except PublishRejectedError as e:
+            if len(events) == 1:
+                rejected.append((events[0], e))
+                return
+            middle = len(events) // 2
+            self._publish_or_split(events[:middle], delivered, rejected)
+            self._publish_or_split(events[middle:], delivered, rejected)
+            return
+        delivered.extend(events)
+
+    def notify(self) -> None:
+        """Wake the relay loop early (safe to call from any thread)"""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def run(self) -> None:
+        """Relay loop: drain while there is work, otherwise wait for a notify
+        or the poll interval"""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        while True:
+            self._wakeup.clear()
+            try:
+                delivered = await asyncio.to_thread(self.relay_batch)
+            except Exception:
+                log.exception("outbox.relay_error")
+                delivered = 0
+            if delivered:
+                continue
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), settings.OUTBOX_POLL_INTERVAL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    @contextlib.asynccontextmanager
+    async def running(self) -> AsyncIterator[None]:
+        """Run the relay loop for the duration of the block, if this process
+        is configured to relay (OUTBOX_RELAY_ENABLED)"""
+        if not settings.OUTBOX_RELAY_ENABLED:
+            yield
+            return
+        task = asyncio.create_task(self.run())
+        try:
+            yield
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+
+outbox_relay = OutboxRelay(create_publisher(settings.OUTBOX_PUBLISHER))
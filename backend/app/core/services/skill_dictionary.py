@@ -0,0 +1,202 @@
+# app/core/services/skill_dictionary.py
+import bisect
+import difflib
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.skills import Skill
+from app.utils.skills import normalize_skill_name
+
+# Common shorthand -> canonical skill name. An alias only applies when its
+# canonical skill exists in the `skills` table.
+SKILL_ALIASES = {
+    "js": "JavaScript",
+    "ts": "TypeScript",
+    "py": "Python",
+    "golang": "Go",
+    "k8s": "Kubernetes",
+    "postgres": "PostgreSQL",
+    "psql": "PostgreSQL",
+    "mongo": "MongoDB",
+    "reactjs": "React",
+    "react.js": "React",
+    "nodejs": "Node.js",
+    "node": "Node.js",
+    "vuejs": "Vue.js",
+    "nextjs": "Next.js",
+    "ml": "Machine Learning",
+    "ai": "Artificial Intelligence",
+    "nlp": "Natural Language Processing",
+    "gcp": "Google Cloud Platform",
+    "aws": "Amazon Web Services",
+    "c sharp": "C#",
+    "csharp": "C#",
+    "cpp": "C++",
+}
+
+FUZZY_CUTOFF = 0.75
+FUZZY_MIN_QUERY_LENGTH = 3
+FUZZY_MAX_LENGTH_DIFFERENCE = 3
+
+
+class SkillDictionary:
+    """Process-wide index of skill names for lookup and autocomplete.
+
+    Holds an exact map of normalized names and aliases to skill ids, plus a
+    sorted array of search keys (full names, aliases and the start of every
+    later word, so "api" finds "Fast API") that answers prefix queries with a
+    binary search. Loaded at startup and kept current as this process creates
+    skills. Skills created by other workers are a miss until the next reload,
+    so callers must treat a miss as "maybe unknown" and check the database.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: Dict[int, str] = {}
+        self._index: List[Tuple[str, int]] = []
+        self._by_initial: Dict[str, List[str]] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _search_keys(key: str) -> List[str]:
+        words = key.split(" ")
+        return [" ".join(words[i:]) for i in range(len(words))]
+
+    def _rebuild(self, names: Dict[int, str]) -> None:
+        ids: Dict[str, int] = {}
+        for skill_id, name in names.items():
+            key = normalize_skill_name(name)
+            # A blank name has no key to look it up by (and no first character)
+            if key:
+                ids[key] = skill_id
+        for alias, canonical in SKILL_ALIASES.items():
+            skill_id = ids.get(normalize_skill_name(canonical))
+            if skill_id is not None:
+                ids.setdefault(alias, skill_id)
+
+        index = sorted(
+            {
+                (search_key, skill_id)
+                for key, skill_id in ids.items()
+                for search_key in self._search_keys(key)
+            }
+        )
+        # Fuzzy candidates: typos rarely change the first character
+        by_initial: Dict[str, List[str]] = {}
+        for key in ids:
+            by_initial.setdefault(key[0], []).append(key)
+
+        # Swap in complete structures so readers never see a partial rebuild
+        self._ids, self._names = ids, names
+        self._index, self._by_initial = index, by_initial
+
+    def load(self, db: Session) -> None:
+        rows = db.query(Skill.id, Skill.name).all()
+        with self._lock:
+            self._rebuild(dict(rows))
+            self._loaded = True
+
+    def ensure_loaded(self, db: Session) -> None:
+        if not self._loaded:
+            self.load(db)
+
+    def add(self, skill_id: int, name: str) -> None:
+        self.add_many([(skill_id, name)])
+
+    def _insert(self, key: str, skill_id: int) -> None:
+        self._ids[key] = skill_id
+        for search_key in self._search_keys(key):
+            bisect.insort(self._index, (search_key, skill_id))
+        self._by_initial.setdefault(key[0], []).append(key)
+
+    def add_many(self, skills: Iterable[Tuple[int, str]]) -> None:
+        with self._lock:
+            added = {
+                skill_id: name
+                for skill_id, name in skills
+                if self._names.get(skill_id) != name
+            }
+            keys = {
+                skill_id: normalize_skill_name(name) for skill_id, name in added.items()
+            }
+            if any(
+                skill_id in self._names or keys[skill_id] in self._ids
+                for skill_id in added
+            ):
+                # A renamed skill, or a name that takes over an alias: the old
+                # entries have to go, which only a rebuild does
+                self._rebuild({**self._names, **added})
+                return
+            # New skills go straight into the sorted index; the name is
+            # stored first so a reader never finds an id without one
+            for skill_id, name in added.items():
+                self._names[skill_id] = name
+                key = keys[skill_id]
+                if not key:
+                    continue
+                self._insert(key, skill_id)
+                for alias, canonical in SKILL_ALIASES.items():
+                    if (
+                        normalize_skill_name(canonical) == key
+                        and alias not in self._ids
+                    ):
+                        self._insert(alias, skill_id)
+
+    def resolve(self, name: str) -> Optional[int]:
+        """Skill id for a free-text name or alias, or None if unknown here"""
+        return self._ids.get(normalize_skill_name(name))
+
+    def name_of(self, skill_id: int) -> Optional[str]:
+        return self._names.get(skill_id)
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[int, str]]:
+        """Autocomplete: prefix matches first, then fuzzy matches for typos.
+
+        Prefix matches rank the exact name first, then names starting with the
+        query, then shorter names. Fuzzy matching only runs when the prefix
+        matches don't fill the page, and only compares names with the same
+        first character and a similar length.
+        """
+        key = normalize_skill_name(query)
+        if not key:
+            return []
+        ids, names, index = self._ids, self._names, self._index
+        by_initial = self._by_initial
+
+        matches: Dict[int, Tuple[bool, bool, int, str]] = {}
+        position = bisect.bisect_left(index, (key,))
+        while position < len(index) and len(matches) < limit * 5:
+            search_key, skill_id = index[position]
+            if not search_key.startswith(key):
+                break
+            name = names[skill_id]
+            normalized = normalize_skill_name(name)
+            matches.setdefault(
+                skill_id,
+                (normalized != key, not normalized.startswith(key), len(name), name),
+            )
+            position += 1
+        results = sorted(matches, key=matches.__getitem__)[:limit]
+
+        if len(results) < limit and len(key) >= FUZZY_MIN_QUERY_LENGTH:
+            candidates = [
+                candidate
+                for candidate in by_initial.get(key[0], ())
+                if abs(len(candidate) - len(key)) <= FUZZY_MAX_LENGTH_DIFFERENCE
+            ]
+            for close in difflib.get_close_matches(
+                key, candidates, n=limit, cutoff=FUZZY_CUTOFF
+            ):
+                skill_id = ids[close]
+                if skill_id not in results:
+                    results.append(skill_id)
+                    if len(results) == limit:
+                        break
+
+        return [(skill_id, names[skill_id]) for skill_id in results]
+
+
+skill_dictionary = SkillDictionary()
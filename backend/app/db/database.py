@@ -21,6 +21,19 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def dialect_insert(table):
+    """INSERT construct with ON CONFLICT support (PostgreSQL and SQLite)"""
+    if engine.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif engine.dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(
+            f"ON CONFLICT inserts are not supported on {engine.dialect.name}"
+        )
+    return insert(table)
+
+
 def init_db():
     """Initialize database tables"""
     Base.metadata.create_all(bind=engine)
@@ -1,76 +1,28 @@
-import inngest.fast_api
-from app.api.routes import (
-    applications_router,
-    auth_router,
-    candidates_router,
-    dashboard_router,
-    job_listing_router,
-    organization_router,
-    resumes_router,
-    saved_jobs_router,
-    skills_router,
-)
-from app.config import settings
-from app.core.background.inngest_client import inngest_client
-from app.core.background.jobs.applicant_ranking_job import rank_applicant_job
-from app.core.background.jobs.resume_job import parse_resume_job
+# app/main.py
+# Combined entry point: uvicorn app.main:app
+#
+# The API routes and the background jobs in one process. Deployments that
+# scale them separately run app.api_server and app.worker instead.
+from app.api_server import create_app
+from app.core.services.outbox import outbox_relay
+from app.core.services.skill_dictionary import skill_dictionary
 from app.db import init_db
-from dotenv import load_dotenv
+from app.db.database import SessionLocal
+from app.worker import job_functions, running_jobs, serve_jobs
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 
-# Load environment variables first
-load_dotenv()
-
-# Import other modules
-
-# Import inngest_client
+__all__ = ["app", "job_functions"]
 
 
 async def lifespan(app: FastAPI):
     # Startup
     init_db()
-    yield
-    # Shutdown (cleanup if needed)
-
-
-app = FastAPI(title="JobLinker API", lifespan=lifespan)
-
-# CORS middleware - allow all origins
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=False,  # Must be False when allow_origins is ["*"]
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include routers
-app.include_router(auth_router)
-app.include_router(applications_router)
-app.include_router(dashboard_router)
-app.include_router(job_listing_router)
-app.include_router(organization_router)
-app.include_router(candidates_router)
-app.include_router(skills_router)
-app.include_router(resumes_router)
-app.include_router(saved_jobs_router)
-
-
-# Inngest endpoint for background jobs
-inngest.fast_api.serve(
-    app,
-    inngest_client,
-    [parse_resume_job, rank_applicant_job],
-    serve_origin="http://localhost:8000",
-)
-
-
-@app.get("/")
-async def root():
-    return {"message": "JobLinker API", "version": settings.VERSION}
+    with SessionLocal() as db:
+        skill_dictionary.load(db)
+    # The relay stops before the runner it feeds
+    async with running_jobs(app), outbox_relay.running():
+        yield
 
 
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy", "version": settings.VERSION}
+app = create_app(lifespan=lifespan)
+serve_jobs(app)
@@ -5,6 +5,7 @@ from app.models.candidates import Candidates
 from app.models.job_listing import JobListings
 from app.models.organization import Organizations
 from app.models.organization_member import OrganizationMember
+from app.models.outbox import OutboxEvent
 from app.models.refresh_token import RefreshToken
 from app.models.resume import Resume
 from app.models.saved_jobs import SavedJob
@@ -25,4 +26,5 @@ __all__ = [
     "Resume",
     "SavedJob",
     "RefreshToken",
+    "OutboxEvent",
 ]
@@ -1,7 +1,17 @@
 # app/models/application.py
 import enum
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -39,6 +49,11 @@ class JobListingApplication(Base):
     cover_letter = Column(Text, nullable=True)
     rating = Column(Integer, nullable=True, index=True)  # 0-100 match score
     ai_analysis = Column(Text, nullable=True)  # AI-generated reasoning
+    # Hash of the inputs the rating was computed from (see match_scoring)
+    input_fingerprint = Column(String(64), nullable=True)
+    ranked_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    # Seconds per pipeline stage of the last ranking run (load, score, persist)
+    rank_timings = Column(JSON, nullable=True)
     stage = Column(
         Enum(ApplicationStage), nullable=False, default=ApplicationStage.APPLIED
     )
@@ -0,0 +1,26 @@
+# app/models/outbox.py
+from sqlalchemy import JSON, Column, DateTime, Integer, String, Text, func
+
+from app.db.database import Base
+
+
+class OutboxEvent(Base):
+    """Background event written in the same transaction as the change that
+    caused it, and delivered to the job queue afterwards by the outbox relay"""
+
+    __tablename__ = "outbox_events"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, nullable=False)
+    data = Column(JSON, nullable=False)
+
+    attempts = Column(Integer, nullable=False, default=0)
+    # NULL = due now; set to a later time after a failed delivery
+    next_attempt_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Ids are used as Inngest event ids for deduplication, so SQLite must not
+    # reuse the ids of delivered (deleted) rows
+    __table_args__ = {"sqlite_autoincrement": True}
@@ -1,5 +1,15 @@
 # app/models/refresh_token.py
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    false,
+    func,
+)
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -13,10 +23,22 @@ class RefreshToken(Base):
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
     token_hash = Column(String, unique=True, nullable=False, index=True)
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
     is_revoked = Column(Boolean, default=False, nullable=False)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     user = relationship("User", back_populates="refresh_tokens")
+
+    __table_args__ = (
+        # Partial index over active tokens only, used to enforce the per-user
+        # cap. Revoked rows never enter it, so it stays small between sweeps.
+        Index(
+            "ix_refresh_tokens_active_user",
+            "user_id",
+            "created_at",
+            postgresql_where=is_revoked == false(),
+            sqlite_where=is_revoked == false(),
+        ),
+    )
@@ -1,7 +1,7 @@
 # app/models/resume.py
 import enum
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, String, Text, func
+from sqlalchemy import JSON, Column, DateTime, Enum, ForeignKey, String, Text, func
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -38,7 +38,9 @@ class Resume(Base):
     ai_summary = Column(Text, nullable=True)
 
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
-    parsed_at = Column(DateTime(timezone=True), nullable=True)
+    parsed_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    # Seconds per pipeline stage of the last parse (decode, load, extract, ...)
+    parse_timings = Column(JSON, nullable=True)
 
     # Relationships
     candidate = relationship("Candidates", back_populates="resumes")
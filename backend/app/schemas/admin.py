@@ -0,0 +1,41 @@
+# app/schemas/admin.py
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class StageSummary(BaseModel):
+    count: int
+    p50: float
+    p95: float
+    max: float
+
+
+class JobPipelineStats(BaseModel):
+    runs: int
+    stages: Dict[str, StageSummary]  # Includes "total" for the whole run
+
+
+class PipelineStatsResponse(BaseModel):
+    window_minutes: int
+    jobs: Dict[str, JobPipelineStats]
+
+
+class DeadOutboxEvent(BaseModel):
+    id: int
+    name: str
+    attempts: int
+    last_error: Optional[str]
+    created_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
+class OutboxRequeueRequest(BaseModel):
+    ids: Optional[List[int]] = None  # None requeues every dead event
+
+
+class OutboxRequeueResponse(BaseModel):
+    requeued: int
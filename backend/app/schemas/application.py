@@ -1,8 +1,8 @@
 # app/schemas/application.py
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from app.models.application import ApplicationStage
 
@@ -21,6 +21,35 @@ class ApplicationUpdate(BaseModel):
     rating: Optional[int] = Field(None, ge=0, le=100)
 
 
+class BulkStageUpdate(BaseModel):
+    """Move many applications of one job to `stage`.
+
+    Target either explicit `user_ids` or every application matching the
+    filters; at least one of them is required.
+    """
+
+    stage: ApplicationStage
+    user_ids: Optional[List[int]] = Field(None, min_length=1, max_length=5000)
+    current_stage: Optional[ApplicationStage] = None
+    rating_below: Optional[int] = Field(None, ge=0, le=101)
+    include_unrated: bool = False  # with rating_below, also match unrated ones
+
+    @model_validator(mode="after")
+    def require_selection(self):
+        if self.user_ids is None and (
+            self.current_stage is None and self.rating_below is None
+        ):
+            raise ValueError("Provide user_ids or at least one filter")
+        return self
+
+
+class BulkStageUpdateResponse(BaseModel):
+    stage: ApplicationStage
+    updated: int
+    user_ids: List[int]
+    previous_stages: Dict[ApplicationStage, int]  # updated count per old stage
+
+
 class ApplicationResponse(ApplicationBase):
     job_listing_id: str
     user_id: int  # Changed from str to int to match database model
@@ -1,8 +1,8 @@
 # app/schemas/job_listing.py
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 
 from app.schemas.base import BaseSchema
 from app.models.job_listing import (
@@ -53,3 +53,16 @@ class JobListingResponse(JobListingBase):
     is_featured: bool
     posted_at: Optional[datetime]
     created_at: datetime
+
+
+class BulkJobListingResult(BaseModel):
+    index: int  # position of the row in the request body
+    status: Literal["created", "error"]
+    id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkJobListingResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[BulkJobListingResult]
@@ -1,7 +1,18 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from app.utils.skills import clean_skill_name
+
+
+def _require_skill_name(name: Optional[str]) -> Optional[str]:
+    # min_length alone lets whitespace-only names through
+    if name is not None:
+        name = clean_skill_name(name)
+        if not name:
+            raise ValueError("Skill name must not be blank")
+    return name
 
 
 class SkillBase(BaseModel):
@@ -10,7 +21,7 @@ class SkillBase(BaseModel):
 
 
 class SkillCreate(SkillBase):
-    pass
+    _clean_name = field_validator("name")(_require_skill_name)
 
 
 class SkillResponse(SkillBase):
@@ -21,12 +32,34 @@ class SkillResponse(SkillBase):
         from_attributes = True
 
 
+class SkillSuggestion(BaseModel):
+    id: int
+    name: str
+
+
 class CandidateSkillCreate(BaseModel):
     skill_id: int
     proficiency_level: int = Field(..., ge=1, le=5)
     years_experience: Optional[int] = Field(None, ge=0)
 
 
+class CandidateSkillUpsert(BaseModel):
+    """One skill for the bulk upsert; identify it by skill_id or by name"""
+
+    skill_id: Optional[int] = None
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    proficiency_level: int = Field(3, ge=1, le=5)
+    years_experience: Optional[int] = Field(None, ge=0)
+
+    _clean_name = field_validator("name")(_require_skill_name)
+
+    @model_validator(mode="after")
+    def require_skill(self):
+        if (self.skill_id is None) == (self.name is None):
+            raise ValueError("Provide exactly one of skill_id or name")
+        return self
+
+
 class CandidateSkillUpdate(BaseModel):
     proficiency_level: Optional[int] = Field(None, ge=1, le=5)
     years_experience: Optional[int] = Field(None, ge=0)
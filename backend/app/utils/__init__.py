@@ -1,5 +1,12 @@
 # Utils package
 from app.utils.auth import hash_password, verify_password
 from app.utils.jwt import create_access_token
+from app.utils.skills import clean_skill_name, normalize_skill_name
 
-__all__ = ["hash_password", "verify_password", "create_access_token"]
+__all__ = [
+    "hash_password",
+    "verify_password",
+    "create_access_token",
+    "clean_skill_name",
+    "normalize_skill_name",
+]
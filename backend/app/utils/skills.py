@@ -0,0 +1,13 @@
+import re
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def clean_skill_name(name: str) -> str:
+    """Display form of a user-supplied skill name (whitespace collapsed)"""
+    return _WHITESPACE.sub(" ", name).strip()
+
+
+def normalize_skill_name(name: str) -> str:
+    """Case-insensitive, whitespace-insensitive lookup key for a skill name"""
+    return clean_skill_name(name).casefold()
@@ -0,0 +1,91 @@
+# app/worker.py
+# Background job entry point: uvicorn app.worker:create_worker_app --factory
+#
+# Serves the Inngest endpoint for the job functions, or with JOB_BACKEND=local
+# runs them in this process. No API routes; see app.api_server for those.
+import contextlib
+
+import inngest.fast_api
+from app.config import settings
+from app.core.background.inngest_client import inngest_client
+from app.core.background.jobs.applicant_ranking_job import rank_applicant_job
+from app.core.background.jobs.email_job import send_daily_emails_job
+from app.core.background.jobs.rerank_job import (
+    rerank_candidate_applications_job,
+    rerank_job_applications_job,
+)
+from app.core.background.jobs.resume_job import parse_resume_job
+from app.core.background.jobs.token_cleanup_job import cleanup_refresh_tokens_job
+from app.core.background.runner import LocalJobRunner, LocalRunnerPublisher
+from app.core.services.outbox import outbox_relay
+from app.db import init_db
+from dotenv import load_dotenv
+from fastapi import FastAPI
+
+# Load environment variables first
+load_dotenv()
+
+job_functions = [
+    parse_resume_job,
+    rank_applicant_job,
+    rerank_job_applications_job,
+    rerank_candidate_applications_job,
+    cleanup_refresh_tokens_job,
+    send_daily_emails_job,
+]
+
+
+@contextlib.asynccontextmanager
+async def running_jobs(app: FastAPI):
+    """Run the local job runner for the duration of the block when
+    JOB_BACKEND is local (with Inngest, runs arrive over HTTP instead)"""
+    app.state.job_runner = None
+    if settings.JOB_BACKEND == "local":
+        # Run jobs in this process; the outbox relay feeds the runner directly
+        app.state.job_runner = LocalJobRunner(job_functions)
+        app.state.job_runner.start()
+        outbox_relay.publisher = LocalRunnerPublisher(app.state.job_runner)
+    try:
+        yield
+    finally:
+        if app.state.job_runner is not None:
+            await app.state.job_runner.stop()
+
+
+async def lifespan(app: FastAPI):
+    # Startup
+    init_db()
+    # The relay stops before the runner it feeds
+    async with running_jobs(app), outbox_relay.running():
+        yield
+
+
+def serve_jobs(app: FastAPI) -> None:
+    # Inngest endpoint for background jobs
+    inngest.fast_api.serve(
+        app,
+        inngest_client,
+        job_functions,
+        serve_origin="http://localhost:8000",
+    )
+
+
+def create_worker_app() -> FastAPI:
+    # A factory, so importing this module (as app.main does) builds no app
+    app = FastAPI(title="JobLinker Worker", lifespan=lifespan)
+    serve_jobs(app)
+
+    @app.get("/health")
+    async def health_check():
+        health = {"status": "healthy", "version": settings.VERSION}
+        if app.state.job_runner is not None:
+            # Queue depth and wait times per lane of the in-process runner
+            health["jobs"] = app.state.job_runner.stats()
+        return health
+
+    if settings.METRICS_ENABLED:
+        from app.api.routes.metrics import router as metrics_router
+
+        app.include_router(metrics_router)
+
+    return app
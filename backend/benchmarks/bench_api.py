@@ -0,0 +1,316 @@
+"""
+Benchmark: API hot paths against a seeded synthetic dataset
+Drives job search, job applications, employer dashboard, login and apply
+through an in-process ASGI client and writes throughput, latency
+percentiles and SQL statements per request to JSON
+The dataset comes from generate_data.py (see its presets)
+Run with: python benchmarks/bench_api.py [--preset bench] [--output results.json]
+          python benchmarks/bench_api.py --compare before.json --output after.json
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import datetime as dt
+import itertools
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+SEARCH_TERMS = ["engineer", "developer", "data", "designer", "reliability", None]
+LOCATIONS = ["San Francisco", "Austin", "Seattle", None]
+
+# A request: (method, url, json body or None, user id to authenticate as or None)
+Request = Tuple[str, str, Optional[dict], Optional[int]]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of unsorted values"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def apply_pairs(dataset, count: int) -> List[Tuple[int, str]]:
+    """(candidate user id, job id) pairs that have no application yet"""
+    pairs = (
+        (user_id, job_id)
+        for job_id in dataset.fresh_job_ids
+        for user_id in dataset.candidate_ids
+    )
+    return list(itertools.islice(pairs, count))
+
+
+def scenarios(dataset, rng: random.Random, requests: int) -> Dict[str, Callable]:
+    """Request factories per scenario; each call returns the next request"""
+    jobs = list(dataset.job_owners)
+    pairs = iter(apply_pairs(dataset, requests))
+
+    def job_search() -> Request:
+        params = [f"limit=20&skip={rng.choice([0, 0, 0, 20, 40])}"]
+        term = rng.choice(SEARCH_TERMS)
+        location = rng.choice(LOCATIONS)
+        if term:
+            params.append(f"search={term}")
+        if location:
+            params.append(f"location={location}")
+        return "GET", "/job-listings/?" + "&".join(params), None, None
+
+    def job_applications() -> Request:
+        job_id = rng.choice(jobs)
+        url = f"/applications/job/{job_id}?limit=50"
+        return "GET", url, None, dataset.job_owners[job_id]
+
+    def employer_dashboard() -> Request:
+        return "GET", "/dashboard/employer", None, rng.choice(dataset.owner_ids)
+
+    def login() -> Request:
+        index = rng.randrange(len(dataset.candidate_ids))
+        body = {
+            "email": f"candidate{index}@example.com",
+            "password": dataset.password,
+        }
+        return "POST", "/auth/login", body, None
+
+    def apply() -> Request:
+        user_id, job_id = next(pairs)
+        body = {"job_listing_id": job_id, "cover_letter": "Benchmark application"}
+        return "POST", "/applications/", body, user_id
+
+    # apply writes rows, so it runs last
+    return {
+        "job_search": job_search,
+        "job_applications": job_applications,
+        "employer_dashboard": employer_dashboard,
+        "login": login,
+        "apply": apply,
+    }
+
+
+async def run_scenario(client, make_request, tokens, statements, args) -> dict:
+    from httpx import HTTPError
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one(record: bool) -> None:
+        nonlocal errors
+        method, url, body, user_id = make_request()
+        headers = {}
+        if user_id is not None:
+            headers["Authorization"] = f"Bearer {tokens(user_id)}"
+        async with semaphore:
+            started_at = time.perf_counter()
+            try:
+                response = await client.request(method, url, json=body, headers=headers)
+                ok = response.status_code < 400
+            except HTTPError:
+                ok = False
+            elapsed = time.perf_counter() - started_at
+        if record:
+            latencies.append(elapsed)
+            errors += not ok
+
+    await asyncio.gather(*(one(False) for _ in range(args.warmup)))
+    statements_before = statements[0]
+    started_at = time.perf_counter()
+    await asyncio.gather(*(one(True) for _ in range(args.requests)))
+    wall = time.perf_counter() - started_at
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / wall, 2),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 3),
+            "p95": round(percentile(latencies, 95) * 1000, 3),
+            "p99": round(percentile(latencies, 99) * 1000, 3),
+            "mean": round(statistics.fmean(latencies) * 1000, 3),
+            "max": round(max(latencies) * 1000, 3),
+        },
+        "queries_per_request": round(
+            (statements[0] - statements_before) / len(latencies), 2
+        ),
+    }
+
+
+async def run(args, dataset) -> Dict[str, dict]:
+    import httpx
+    from sqlalchemy import event
+
+    from app.db.database import engine
+    from app.main import app
+    from app.utils.jwt import create_access_token
+
+    # Statements executed per scenario (scenarios run one at a time)
+    statements = [0]
+
+    def count_statement(*_):
+        statements[0] += 1
+
+    event.listen(engine, "after_cursor_execute", count_statement)
+
+    token_cache: Dict[int, str] = {}
+
+    def tokens(user_id: int) -> str:
+        if user_id not in token_cache:
+            token_cache[user_id] = create_access_token({"sub": str(user_id)})
+        return token_cache[user_id]
+
+    rng = random.Random(args.seed)
+    selected = args.scenarios or None
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        for name, make_request in scenarios(
+            dataset, rng, args.requests + args.warmup
+        ).items():
+            if selected and name not in selected:
+                continue
+            results[name] = await run_scenario(
+                client, make_request, tokens, statements, args
+            )
+            print_result(name, results[name])
+    return results
+
+
+def print_result(name: str, result: dict) -> None:
+    latency = result["latency_ms"]
+    print(
+        f"  {name:<20} {result['throughput_rps']:>9.1f} req/s  "
+        f"p50 {latency['p50']:>8.2f} ms  p95 {latency['p95']:>8.2f} ms  "
+        f"p99 {latency['p99']:>8.2f} ms  {result['queries_per_request']:>6.1f} q/req"
+        + (f"  {result['errors']} errors" if result["errors"] else "")
+    )
+
+
+def compare(baseline: dict, results: Dict[str, dict]) -> None:
+    print(f"Compared with {baseline['meta'].get('git_commit') or 'baseline'}:")
+    for name, result in results.items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            continue
+
+        def change(new: float, old: float) -> str:
+            return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+        print(
+            f"  {name:<20} throughput "
+            f"{change(result['throughput_rps'], before['throughput_rps']):>8}  p95 "
+            f"{change(result['latency_ms']['p95'], before['latency_ms']['p95']):>8}"
+            f"  q/req {before['queries_per_request']} -> "
+            f"{result['queries_per_request']}"
+        )
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        help="Database to seed (default: a fresh SQLite file in a temp directory)",
+    )
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Drop and recreate all tables first (required for a non-empty database)",
+    )
+    parser.add_argument("--preset", default="bench", help="generate_data.py preset")
+    parser.add_argument("--orgs", type=int, help="Overrides the preset")
+    parser.add_argument("--jobs", type=int, help="Overrides the preset")
+    parser.add_argument("--candidates", type=int, help="Overrides the preset")
+    parser.add_argument("--applications", type=int, help="Overrides the preset")
+    parser.add_argument("--skills", type=int, help="Overrides the preset")
+    parser.add_argument("--requests", type=int, default=200, help="Per scenario")
+    parser.add_argument("--warmup", type=int, default=20, help="Per scenario")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scenarios", nargs="*", help="Subset of scenarios to run")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Earlier results JSON to compare with")
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if database_url is None:
+        database_url = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db")
+    # Settings are read at import time, so configure before importing the app
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["OUTBOX_RELAY_ENABLED"] = "false"
+    # Inngest dev mode needs no signing key; nothing is sent with the relay off
+    os.environ.setdefault("INNGEST_BASE_URL", "http://localhost:8288")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    import app.models  # noqa: F401 - registers all tables
+    from generate_data import PRESETS, populate
+    from app.db.database import Base, engine
+
+    if args.reset:
+        Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    overrides = {
+        name: getattr(args, name)
+        for name in ("orgs", "jobs", "candidates", "applications", "skills")
+        if getattr(args, name) is not None
+    }
+    scale = dataclasses.replace(PRESETS[args.preset], **overrides)
+    print(f"Seeding {engine.dialect.name} ({scale})...")
+    started_at = time.perf_counter()
+    dataset = populate(engine, scale, args.seed)
+    print(f"  {dataset.rows} in {time.perf_counter() - started_at:.1f}s")
+
+    print(
+        f"Running {args.requests} requests per scenario, concurrency {args.concurrency}:"
+    )
+    results = asyncio.run(run(args, dataset))
+
+    output = {
+        "meta": {
+            "timestamp": dt.datetime.now(dt.timezone.utc).isoformat(),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "database": engine.dialect.name,
+            "scale": vars(scale),
+            "rows": dataset.rows,
+            "seed": args.seed,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+        },
+        "scenarios": results,
+    }
+    if args.compare:
+        compare(json.loads(Path(args.compare).read_text()), results)
+    if args.output:
+        Path(args.output).write_text(json.dumps(output, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
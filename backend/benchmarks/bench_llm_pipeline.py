@@ -0,0 +1,366 @@
+"""
+Benchmark: the LLM pipeline (resume parsing and applicant ranking) offline
+Replays resume uploads and applications through the real job functions on
+the local job runner, with the fake LLM provider standing in for Gemini,
+and reports throughput, end-to-end latency, queue time, rate-limit retries
+and estimated LLM cost for each configuration (concurrency, response cache,
+event batch size). Each configuration runs in a fresh process and database.
+Run with: python benchmarks/bench_llm_pipeline.py [--concurrency 4 8 16]
+          [--cache 0 1000] [--batch-size 1 100] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import base64
+import io
+import itertools
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of unsorted values"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def resume_document(rng: random.Random, index: int) -> bytes:
+    """A small DOCX resume"""
+    from docx import Document
+
+    from generate_data import SKILLS, TITLES
+
+    document = Document()
+    document.add_heading(f"Candidate {index}", level=1)
+    document.add_paragraph(
+        f"{rng.choice(TITLES)} with {rng.randint(1, 15)} years of experience "
+        "building and operating production systems."
+    )
+    document.add_paragraph("Skills: " + ", ".join(rng.sample(SKILLS, 6)))
+    for _ in range(3):
+        document.add_paragraph(
+            f"{rng.choice(TITLES)} at Company {rng.randint(1, 500)}: shipped "
+            f"{rng.randint(2, 20)} features and cut latency by {rng.randint(5, 60)}%."
+        )
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def build_events(args, config: dict) -> List[dict]:
+    """Uploads first, then applications, as they would arrive"""
+    from sqlalchemy import update
+
+    from app.db.database import SessionLocal
+    from app.models.application import JobListingApplication
+    from app.models.candidates import Candidates
+    from app.models.job_listing import JobListings
+    from app.models.resume import Resume, ResumeParseStatus
+
+    rng = random.Random(args.seed)
+    db = SessionLocal()
+    try:
+        # The generated resumes become pending uploads
+        db.execute(
+            update(Resume).values(
+                parse_status=ResumeParseStatus.PENDING,
+                ai_summary=None,
+                extracted_text=None,
+            )
+        )
+        db.commit()
+        candidate_ids = [
+            candidate_id
+            for (candidate_id,) in db.query(Candidates.id).order_by(Candidates.user_id)
+        ]
+        applications = (
+            db.query(
+                JobListingApplication.job_listing_id,
+                Candidates.id,
+                JobListings.organization_id,
+            )
+            .join(Candidates, Candidates.user_id == JobListingApplication.user_id)
+            .join(JobListings, JobListings.id == JobListingApplication.job_listing_id)
+            .order_by(JobListingApplication.applied_at)
+            .all()
+        )
+    finally:
+        db.close()
+
+    events = []
+    documents: List[str] = []
+    for index, candidate_id in enumerate(candidate_ids):
+        if documents and rng.random() < config["duplicate_rate"]:
+            # Same file uploaded again (e.g. by another account)
+            content = rng.choice(documents)
+        else:
+            content = base64.b64encode(resume_document(rng, index)).decode()
+            documents.append(content)
+        events.append(
+            {
+                "name": "app/resume.uploaded",
+                "data": {
+                    "candidate_id": candidate_id,
+                    "file_content": content,
+                    "file_type": "docx",
+                },
+            }
+        )
+    for job_listing_id, candidate_id, organization_id in applications:
+        events.append(
+            {
+                "name": "app/application.created",
+                "data": {
+                    "job_listing_id": job_listing_id,
+                    "candidate_id": candidate_id,
+                    "organization_id": organization_id,
+                },
+            }
+        )
+    return events
+
+
+async def replay(runner, events: List[dict], batch_size: int, interval: float):
+    """Submit events in batches (as the outbox relay delivers them) and wait
+    for every run; returns (submitted_at, finished_at, output) per run"""
+    loop = asyncio.get_running_loop()
+    runs = []
+
+    def track(submitted_at: float, future: asyncio.Future) -> None:
+        record = [submitted_at, None, None]
+        runs.append(record)
+
+        def done(future: asyncio.Future) -> None:
+            record[1] = loop.time()
+            record[2] = None if future.cancelled() else future.result()
+
+        future.add_done_callback(done)
+
+    futures = []
+    for start in range(0, len(events), batch_size):
+        submitted_at = loop.time()
+        for event in events[start : start + batch_size]:
+            for future in runner.submit(event):
+                track(submitted_at, future)
+                futures.append(future)
+        if interval:
+            await asyncio.sleep(interval)
+    await asyncio.gather(*futures)
+    return runs
+
+
+def run_configuration(args, config: dict) -> dict:
+    """Runs in a child process, with settings taken from the environment"""
+    import app.models  # noqa: F401 - registers all tables
+    from app.core.background.jobs.applicant_ranking_job import rank_applicant_job
+    from app.core.background.jobs.resume_job import parse_resume_job
+    from app.core.background.runner import LocalJobRunner
+    from app.core.services.llm import usage_snapshot
+    from app.db.database import Base, engine
+    from generate_data import Scale, populate
+
+    Base.metadata.create_all(engine)
+    populate(
+        engine,
+        Scale(
+            orgs=args.orgs,
+            jobs=args.jobs,
+            candidates=args.uploads,
+            applications=args.applications,
+            skills=60,
+        ),
+        args.seed,
+    )
+    events = build_events(args, config)
+
+    async def main() -> dict:
+        loop = asyncio.get_running_loop()
+        # LLM calls run in threads; the default pool is sized by CPU count,
+        # which would cap concurrency below the configured value
+        loop.set_default_executor(ThreadPoolExecutor(config["concurrency"] * 2))
+        runner = LocalJobRunner(
+            [parse_resume_job, rank_applicant_job],
+            workers=config["concurrency"] * 2,
+            concurrency=config["concurrency"],
+            retries=args.retries,
+            retry_base_seconds=args.retry_base_seconds,
+        )
+        runner.start()
+        started_at = loop.time()
+        runs = await replay(runner, events, config["batch_size"], args.batch_interval)
+        wall = loop.time() - started_at
+        stats = runner.stats()
+        await runner.stop()
+        return runs, wall, stats
+
+    runs, wall, stats = asyncio.run(main())
+    latencies = [finished - submitted for submitted, finished, _ in runs]
+    failed = sum(1 for _, _, output in runs if output is None or output.get("error"))
+    llm = usage_snapshot()
+    return {
+        "config": config,
+        "runs": len(runs),
+        "failed": failed,
+        "wall_seconds": round(wall, 3),
+        "throughput_per_second": round(len(runs) / wall, 3),
+        "latency_seconds": {
+            "p50": round(percentile(latencies, 50), 3),
+            "p95": round(percentile(latencies, 95), 3),
+            "p99": round(percentile(latencies, 99), 3),
+        },
+        "lanes": {
+            lane: {
+                "runs": values["succeeded"] + values["failed"],
+                "retries": values["retries"],
+                "avg_queue_seconds": round(values["avg_wait_seconds"], 3),
+                "max_queue_seconds": round(values["max_wait_seconds"], 3),
+            }
+            for lane, values in stats.items()
+        },
+        "llm": {
+            **llm,
+            "cost_per_run_usd": round(llm["cost_usd"] / max(1, len(runs)), 8),
+        },
+    }
+
+
+def child_environment(args, config: dict) -> Dict[str, str]:
+    database = os.path.join(tempfile.mkdtemp(), "pipeline.db")
+    return {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{database}",
+        "OUTBOX_RELAY_ENABLED": "false",
+        "INNGEST_BASE_URL": "http://localhost:8288",
+        "LOG_LEVEL": "ERROR",
+        "LLM_PROVIDER": "fake",
+        "LLM_CACHE_SIZE": str(config["cache"]),
+        "LLM_FAKE_LATENCY_MEDIAN_SECONDS": str(args.latency_median),
+        "LLM_FAKE_LATENCY_SIGMA": str(args.latency_sigma),
+        "LLM_FAKE_RATE_LIMIT_RATE": str(args.rate_limit_rate),
+        "LLM_FAKE_SEED": str(args.seed),
+        # The ranking function's own concurrency options follow the config
+        "RANKING_CONCURRENCY": str(config["concurrency"]),
+        "RANKING_CONCURRENCY_PER_ORG": str(
+            args.per_org_concurrency or config["concurrency"]
+        ),
+    }
+
+
+def print_result(result: dict) -> None:
+    config = result["config"]
+    queue = max(lane["avg_queue_seconds"] for lane in result["lanes"].values())
+    print(
+        f"  c={config['concurrency']:<3} cache={config['cache']:<5} "
+        f"batch={config['batch_size']:<4} "
+        f"{result['throughput_per_second']:>7.2f} runs/s  "
+        f"p50 {result['latency_seconds']['p50']:>7.2f}s  "
+        f"p95 {result['latency_seconds']['p95']:>7.2f}s  "
+        f"queue {queue:>6.2f}s  "
+        f"LLM calls {result['llm']['calls']:>5} (hits {result['llm']['cache_hits']}, "
+        f"429s {result['llm']['rate_limited']})  "
+        f"${result['llm']['cost_usd']:.4f}"
+        + (f"  {result['failed']} failed" if result["failed"] else "")
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--uploads", type=int, default=50)
+    parser.add_argument("--applications", type=int, default=150)
+    parser.add_argument("--orgs", type=int, default=5)
+    parser.add_argument("--jobs", type=int, default=25)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[4, 8])
+    parser.add_argument(
+        "--per-org-concurrency",
+        type=int,
+        help="Per-organization ranking cap (default: same as --concurrency)",
+    )
+    parser.add_argument(
+        "--cache", type=int, nargs="+", default=[0, 1000], help="LLM cache sizes"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, nargs="+", default=[100], help="Events per batch"
+    )
+    parser.add_argument(
+        "--batch-interval", type=float, default=0.0, help="Seconds between batches"
+    )
+    parser.add_argument("--duplicate-rate", type=float, default=0.2)
+    parser.add_argument("--latency-median", type=float, default=1.5)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.02)
+    parser.add_argument("--retries", type=int, default=5)
+    parser.add_argument("--retry-base-seconds", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = run_configuration(args, json.loads(args.child))
+        print(json.dumps(result))
+        return
+
+    configs = [
+        {
+            "concurrency": concurrency,
+            "cache": cache,
+            "batch_size": batch_size,
+            "duplicate_rate": args.duplicate_rate,
+        }
+        for concurrency, cache, batch_size in itertools.product(
+            args.concurrency, args.cache, args.batch_size
+        )
+    ]
+    print(
+        f"Replaying {args.uploads} uploads and {args.applications} applications "
+        f"(fake LLM: median {args.latency_median}s, "
+        f"{args.rate_limit_rate:.0%} rate limited):"
+    )
+    results = []
+    for config in configs:
+        started_at = time.perf_counter()
+        child = subprocess.run(
+            [sys.executable, *sys.argv, "--child", json.dumps(config)],
+            env=child_environment(args, config),
+            capture_output=True,
+            text=True,
+        )
+        if child.returncode != 0:
+            print(child.stderr, file=sys.stderr)
+            raise SystemExit(f"Configuration {config} failed")
+        result = json.loads(child.stdout.strip().splitlines()[-1])
+        result["process_seconds"] = round(time.perf_counter() - started_at, 3)
+        results.append(result)
+        print_result(result)
+
+    if args.output:
+        output = {
+            "meta": {
+                "uploads": args.uploads,
+                "applications": args.applications,
+                "latency_median": args.latency_median,
+                "latency_sigma": args.latency_sigma,
+                "rate_limit_rate": args.rate_limit_rate,
+                "seed": args.seed,
+            },
+            "results": results,
+        }
+        Path(args.output).write_text(json.dumps(output, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
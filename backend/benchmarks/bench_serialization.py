@@ -0,0 +1,184 @@
+"""
+Benchmark: list-response serialization for a job with many applicants
+Compares the previous ORM + jsonable_encoder path against RowShape + orjson
+Run with: python benchmarks/bench_serialization.py [--rows 10000]
+"""
+
+import argparse
+import datetime as dt
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the backend directory to the path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import joinedload, sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+import app.models  # noqa: E402,F401 - registers all tables
+from app.api.routes.applications import JOB_APPLICATION_SHAPE  # noqa: E402
+from app.db.database import Base  # noqa: E402
+from app.models.application import ApplicationStage, JobListingApplication  # noqa: E402
+from app.models.job_listing import (  # noqa: E402
+    ExperienceLevel,
+    JobListings,
+    JobListingStatus,
+    JobListingType,
+    LocationRequirement,
+)
+from app.models.organization import Organizations  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+JOB_ID = "bench-job"
+
+
+def build_database(rows: int):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    now = dt.datetime.now(dt.UTC)
+    stages = list(ApplicationStage)
+
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [
+                {
+                    "id": i,
+                    "email": f"user{i}@example.com",
+                    "name": f"Candidate {i}",
+                    "hashed_password": "x",
+                }
+                for i in range(1, rows + 2)
+            ],
+        )
+        conn.execute(
+            insert(Organizations),
+            [{"id": "bench-org", "owner_user_id": rows + 1, "name": "Bench Org"}],
+        )
+        conn.execute(
+            insert(JobListings),
+            [
+                {
+                    "id": JOB_ID,
+                    "organization_id": "bench-org",
+                    "title": "Backend Engineer",
+                    "description": "Build APIs. " * 50,
+                    "location_requirement": LocationRequirement.REMOTE,
+                    "experience_level": ExperienceLevel.MID_LEVEL,
+                    "type": JobListingType.FULL_TIME,
+                    "status": JobListingStatus.PUBLISHED,
+                }
+            ],
+        )
+        conn.execute(
+            insert(JobListingApplication),
+            [
+                {
+                    "job_listing_id": JOB_ID,
+                    "user_id": i,
+                    "cover_letter": "I am a great fit for this role. " * 10,
+                    "rating": i % 101,
+                    "ai_analysis": "Strong backend experience, some gaps. " * 5,
+                    "stage": stages[i % len(stages)],
+                    "applied_at": now - dt.timedelta(minutes=i),
+                }
+                for i in range(1, rows + 1)
+            ],
+        )
+    return sessionmaker(bind=engine)
+
+
+def orm_path(db) -> bytes:
+    """The previous implementation: ORM objects, dicts, jsonable_encoder, json"""
+    applications = (
+        db.query(JobListingApplication)
+        .filter(JobListingApplication.job_listing_id == JOB_ID)
+        .options(joinedload(JobListingApplication.user))
+        .order_by(JobListingApplication.rating.desc().nulls_last())
+        .all()
+    )
+    content = [
+        {
+            "job_listing_id": app.job_listing_id,
+            "user_id": app.user_id,
+            "cover_letter": app.cover_letter,
+            "rating": app.rating,
+            "ai_analysis": app.ai_analysis,
+            "stage": app.stage,
+            "applied_at": app.applied_at,
+            "user": {
+                "id": app.user.id,
+                "name": app.user.name,
+                "email": app.user.email,
+                "image_url": app.user.image_url,
+            },
+        }
+        for app in applications
+    ]
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def shape_path(db) -> bytes:
+    """RowShape over a column projection, serialized with orjson"""
+    rows = (
+        db.query(*JOB_APPLICATION_SHAPE.columns)
+        .join(User, JobListingApplication.user_id == User.id)
+        .filter(JobListingApplication.job_listing_id == JOB_ID)
+        .order_by(JobListingApplication.rating.desc().nulls_last())
+        .all()
+    )
+    return JOB_APPLICATION_SHAPE.dumps(rows)
+
+
+def measure(session_factory, fn, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        db = session_factory()
+        try:
+            start = time.perf_counter()
+            fn(db)
+            timings.append(time.perf_counter() - start)
+        finally:
+            db.close()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"Seeding {args.rows} applications into in-memory SQLite...")
+    session_factory = build_database(args.rows)
+
+    db = session_factory()
+    assert json.loads(orm_path(db)) == json.loads(shape_path(db)), "payload mismatch"
+    db.close()
+
+    results = {}
+    for name, fn in [
+        ("orm+jsonable_encoder", orm_path),
+        ("rowshape+orjson", shape_path),
+    ]:
+        timings = measure(session_factory, fn, args.repeat)
+        results[name] = statistics.median(timings)
+        print(f"  {name:<22} median {results[name] * 1000:8.1f} ms")
+
+    speedup = results["orm+jsonable_encoder"] / results["rowshape+orjson"]
+    print(f"Speedup: {speedup:.1f}x for {args.rows} rows")
+
+
+if __name__ == "__main__":
+    main()
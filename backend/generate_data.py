@@ -0,0 +1,544 @@
+"""
+Synthetic data generator for JobLinker
+Generates realistic, skewed data at scale from a deterministic seed: a few
+popular jobs draw most of the applicants, skills follow a Zipf distribution.
+Rows are streamed and bulk-loaded in chunks (COPY on PostgreSQL, executemany
+elsewhere); every user shares one precomputed password hash.
+Run with: python generate_data.py --preset 1m [--database-url ...] [--reset]
+"""
+
+import argparse
+import bisect
+import csv
+import datetime as dt
+import io
+import itertools
+import math
+import random
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import create_engine, insert, text  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+
+import app.models  # noqa: E402,F401 - registers all tables
+from app.db.database import Base  # noqa: E402
+from app.models.application import ApplicationStage, JobListingApplication  # noqa: E402
+from app.models.candidates import Candidates  # noqa: E402
+from app.models.job_listing import (  # noqa: E402
+    ExperienceLevel,
+    JobListings,
+    JobListingStatus,
+    JobListingType,
+    LocationRequirement,
+    WageInterval,
+)
+from app.models.organization import Organizations  # noqa: E402
+from app.models.organization_member import (  # noqa: E402
+    MemberRole,
+    OrganizationMember,
+)
+from app.models.resume import Resume, ResumeParseStatus  # noqa: E402
+from app.models.skills import CandidateSkill, JobSkill, Skill  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.utils.auth import hash_password  # noqa: E402
+
+PASSWORD = "Password123!"
+DEFAULT_CHUNK_SIZE = 10_000
+ID_NAMESPACE = uuid.UUID("6f1c2a4e-0b7d-4e53-9a51-3c0f1b9d2e77")
+
+# fmt: off
+FIRST_NAMES = [
+    "Ada", "Ben", "Chloe", "Daniel", "Emeka", "Fatima", "Grace", "Hiro",
+    "Ines", "James", "Kemi", "Liam", "Maya", "Noah", "Osato", "Priya",
+    "Quinn", "Rosa", "Sam", "Tariq", "Uma", "Victor", "Wen", "Yusuf", "Zoe",
+]
+LAST_NAMES = [
+    "Adeyemi", "Brown", "Chen", "Diaz", "Evans", "Garcia", "Hughes", "Ito",
+    "Johnson", "Khan", "Lopez", "Martin", "Nguyen", "Okafor", "Patel",
+    "Rossi", "Smith", "Tanaka", "Walker", "Young",
+]
+TITLES = [
+    "Backend Engineer",
+    "Frontend Developer",
+    "Full Stack Developer",
+    "Data Scientist",
+    "Data Engineer",
+    "DevOps Engineer",
+    "Product Designer",
+    "Mobile Developer",
+    "QA Engineer",
+    "Machine Learning Engineer",
+    "Site Reliability Engineer",
+    "Security Engineer",
+    "Engineering Manager",
+    "Technical Writer",
+]
+CITIES = [
+    ("San Francisco", "CA"),
+    ("New York", "NY"),
+    ("Austin", "TX"),
+    ("Seattle", "WA"),
+    ("Boston", "MA"),
+    ("Chicago", "IL"),
+    ("Denver", "CO"),
+    ("Atlanta", "GA"),
+    ("Miami", "FL"),
+    ("Portland", "OR"),
+]
+# The most popular skills (by Zipf rank); the long tail is numbered
+SKILLS = [
+    "Python", "JavaScript", "SQL", "React", "TypeScript", "AWS", "Docker",
+    "Git", "Java", "Node.js", "Kubernetes", "PostgreSQL", "Communication",
+    "Go", "Figma", "C#", "Linux", "Terraform", "GraphQL", "Machine Learning",
+    "Django", "FastAPI", "Redis", "Kotlin", "Swift", "Rust", "Pandas",
+    "Spark", "Azure", "GCP",
+]
+# fmt: on
+SKILL_CATEGORIES = ["Programming", "Framework", "Database", "Cloud", "Design", "Soft"]
+# Most applications sit in the early stages
+STAGE_WEIGHTS = {
+    ApplicationStage.APPLIED: 50,
+    ApplicationStage.PENDING: 15,
+    ApplicationStage.REVIEWING: 12,
+    ApplicationStage.INTERESTED: 6,
+    ApplicationStage.SHORTLISTED: 5,
+    ApplicationStage.INTERVIEWED: 4,
+    ApplicationStage.DENIED: 7,
+    ApplicationStage.HIRED: 1,
+}
+DESCRIPTION = (
+    "We are looking for a {title} to join our team in {city}. You will design, "
+    "build and operate services used by thousands of customers, work closely "
+    "with product and design, and review code from your peers. "
+)
+SUMMARY = (
+    "## Professional Summary\n{title} with {years} years of experience.\n"
+    "## Key Skills\n{skills}\n"
+)
+
+
+@dataclass
+class Scale:
+    orgs: int = 50
+    jobs: int = 500
+    candidates: int = 5_000
+    applications: int = 25_000
+    skills: int = 300
+    skills_per_candidate: int = 6
+    skills_per_job: int = 5
+    # Zipf exponents: higher means more skew towards the top ranks
+    job_popularity: float = 1.1
+    skill_popularity: float = 1.0
+
+
+PRESETS = {
+    "dev": Scale(orgs=5, jobs=40, candidates=200, applications=800, skills=100),
+    "bench": Scale(),
+    "1m": Scale(
+        orgs=2_000,
+        jobs=50_000,
+        candidates=250_000,
+        applications=1_000_000,
+        skills=2_000,
+    ),
+}
+
+
+@dataclass
+class GeneratedData:
+    """Ids of the generated rows that callers (e.g. benchmarks) need"""
+
+    password: str
+    owner_ids: List[int] = field(default_factory=list)
+    candidate_ids: List[int] = field(default_factory=list)
+    # Job id -> user id of its organization's owner
+    job_owners: Dict[str, int] = field(default_factory=dict)
+    # One just-posted job per organization without applications yet
+    fresh_job_ids: List[str] = field(default_factory=list)
+    rows: Dict[str, int] = field(default_factory=dict)
+
+
+class Zipf:
+    """Samples ranks 0..n-1 with probability proportional to 1 / (rank+1)^s"""
+
+    def __init__(self, n: int, s: float):
+        self.cum_weights = list(
+            itertools.accumulate(1 / (rank + 1) ** s for rank in range(n))
+        )
+        self.total = self.cum_weights[-1] if n else 0.0
+
+    def sample(self, rng: random.Random) -> int:
+        return bisect.bisect(self.cum_weights, rng.random() * self.total)
+
+    def sample_distinct(self, rng: random.Random, k: int) -> List[int]:
+        k = min(k, len(self.cum_weights))
+        chosen: Dict[int, None] = {}
+        while len(chosen) < k:
+            chosen[self.sample(rng)] = None
+        return list(chosen)
+
+
+def _id(kind: str, seed: int, index: int) -> str:
+    """Stable UUID of the index-th row of a kind, so ids can be recomputed
+    instead of kept in memory"""
+    return str(uuid.uuid5(ID_NAMESPACE, f"{seed}:{kind}:{index}"))
+
+
+def _rng(seed: int, table: str) -> random.Random:
+    # One stream per table: changing one table leaves the others unchanged
+    return random.Random(f"{seed}:{table}")
+
+
+def generate(
+    scale: Scale, seed: int = 0
+) -> Tuple[GeneratedData, List[Tuple[type, Callable[[], Iterator[dict]]]]]:
+    """The dataset summary plus, in foreign key order, a row generator per
+    table. Rows are produced lazily, so millions never sit in memory."""
+    now = dt.datetime.now(dt.timezone.utc).replace(microsecond=0)
+    # bcrypt is deliberately slow: hash once and share it
+    data = GeneratedData(password=PASSWORD)
+    hashed_password = hash_password(PASSWORD)
+    orgs = max(1, scale.orgs)
+    jobs = max(orgs, scale.jobs)
+
+    data.owner_ids = list(range(1, orgs + 1))
+    data.candidate_ids = list(range(orgs + 1, orgs + scale.candidates + 1))
+
+    # Each organization's first job is fresh; the rest are spread over the
+    # organizations by a Zipf law (a few large employers, a long tail)
+    org_rng = _rng(seed, "job_owners")
+    org_zipf = Zipf(orgs, 1.0)
+    job_orgs = list(range(orgs)) + [
+        org_zipf.sample(org_rng) for _ in range(jobs - orgs)
+    ]
+    job_ids = [_id("job", seed, index) for index in range(jobs)]
+    for index, job_id in enumerate(job_ids):
+        data.job_owners[job_id] = data.owner_ids[job_orgs[index]]
+    data.fresh_job_ids = job_ids[:orgs]
+    # Jobs that receive applications, most popular first
+    popular_jobs = job_ids[orgs:]
+
+    skill_names = SKILLS[: scale.skills] + [
+        f"Skill {index + 1}" for index in range(len(SKILLS), scale.skills)
+    ]
+    skill_zipf = Zipf(len(skill_names), scale.skill_popularity)
+
+    def users() -> Iterator[dict]:
+        rng = _rng(seed, "users")
+        for index, user_id in enumerate(data.owner_ids):
+            yield {
+                "id": user_id,
+                "email": f"owner{index}@example.com",
+                "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "hashed_password": hashed_password,
+                "is_active": True,
+            }
+        for index, user_id in enumerate(data.candidate_ids):
+            yield {
+                "id": user_id,
+                "email": f"candidate{index}@example.com",
+                "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "hashed_password": hashed_password,
+                "is_active": True,
+            }
+
+    def organizations() -> Iterator[dict]:
+        rng = _rng(seed, "organizations")
+        for index, owner_id in enumerate(data.owner_ids):
+            city, state = rng.choice(CITIES)
+            yield {
+                "id": _id("org", seed, index),
+                "owner_user_id": owner_id,
+                "name": f"{rng.choice(LAST_NAMES)} {rng.choice(['Labs', 'Inc', 'Group', 'Tech'])} {index}",
+                "location": f"{city}, {state}",
+            }
+
+    def organization_members() -> Iterator[dict]:
+        for index, owner_id in enumerate(data.owner_ids):
+            yield {
+                "organization_id": _id("org", seed, index),
+                "user_id": owner_id,
+                "role": MemberRole.OWNER,
+            }
+
+    def job_listings() -> Iterator[dict]:
+        rng = _rng(seed, "job_listings")
+        for index, job_id in enumerate(job_ids):
+            title = rng.choice(TITLES)
+            city, state = rng.choice(CITIES)
+            fresh = index < orgs
+            yield {
+                "id": job_id,
+                "organization_id": _id("org", seed, job_orgs[index]),
+                "title": title,
+                "description": DESCRIPTION.format(title=title, city=city) * 3,
+                "wage": rng.randrange(40_000, 250_000, 5_000),
+                "wage_interval": WageInterval.YEARLY,
+                "state_abbreviation": state,
+                "city": city,
+                "location_requirement": rng.choice(list(LocationRequirement)),
+                "experience_level": rng.choice(list(ExperienceLevel)),
+                "type": rng.choice(list(JobListingType)),
+                "status": JobListingStatus.PUBLISHED,
+                "is_featured": rng.random() < 0.05,
+                "posted_at": now
+                - dt.timedelta(hours=1 if fresh else rng.randrange(2, 24 * 90)),
+            }
+
+    def skills() -> Iterator[dict]:
+        for index, name in enumerate(skill_names):
+            yield {
+                "id": index + 1,
+                "name": name,
+                "category": SKILL_CATEGORIES[index % len(SKILL_CATEGORIES)],
+            }
+
+    def job_skills() -> Iterator[dict]:
+        rng = _rng(seed, "job_skills")
+        for job_id in job_ids:
+            for position, rank in enumerate(
+                skill_zipf.sample_distinct(rng, scale.skills_per_job)
+            ):
+                yield {
+                    "job_listing_id": job_id,
+                    "skill_id": rank + 1,
+                    "is_required": 1 if position < 3 else 0,
+                }
+
+    def candidates() -> Iterator[dict]:
+        rng = _rng(seed, "candidates")
+        for index, user_id in enumerate(data.candidate_ids):
+            yield {
+                "id": _id("candidate", seed, index),
+                "user_id": user_id,
+                "current_job_title": rng.choice(TITLES),
+                "experience_years": min(40, int(rng.expovariate(1 / 6))),
+                "location": rng.choice(CITIES)[0],
+                "desired_salary": rng.randrange(40_000, 250_000, 5_000),
+            }
+
+    def candidate_skills() -> Iterator[dict]:
+        rng = _rng(seed, "candidate_skills")
+        for index in range(len(data.candidate_ids)):
+            for rank in skill_zipf.sample_distinct(rng, scale.skills_per_candidate):
+                yield {
+                    "candidate_id": _id("candidate", seed, index),
+                    "skill_id": rank + 1,
+                    "proficiency_level": rng.randint(1, 5),
+                    "years_experience": rng.randint(0, 10),
+                }
+
+    def resumes() -> Iterator[dict]:
+        rng = _rng(seed, "resumes")
+        for index in range(len(data.candidate_ids)):
+            candidate_id = _id("candidate", seed, index)
+            skills = skill_zipf.sample_distinct(rng, 3)
+            yield {
+                "id": _id("resume", seed, index),
+                "candidate_id": candidate_id,
+                "file_url": f"resumes/{candidate_id}.pdf",
+                "file_name": "resume.pdf",
+                "file_type": "pdf",
+                "parse_status": ResumeParseStatus.COMPLETED,
+                "ai_summary": SUMMARY.format(
+                    title=rng.choice(TITLES),
+                    years=rng.randint(0, 20),
+                    skills="\n".join(f"- {skill_names[rank]}" for rank in skills),
+                ),
+                "parsed_at": now - dt.timedelta(days=rng.randrange(365)),
+            }
+
+    def applications() -> Iterator[dict]:
+        rng = _rng(seed, "applications")
+        job_zipf = Zipf(len(popular_jobs), scale.job_popularity)
+        stages = list(STAGE_WEIGHTS)
+        stage_weights = list(itertools.accumulate(STAGE_WEIGHTS.values()))
+        mean = scale.applications / max(1, len(data.candidate_ids))
+        if not mean:
+            return
+        for user_id in data.candidate_ids:
+            # Most candidates apply to a few jobs, some to many
+            count = min(len(popular_jobs), round(rng.expovariate(1 / mean)))
+            for rank in job_zipf.sample_distinct(rng, count):
+                yield {
+                    "job_listing_id": popular_jobs[rank],
+                    "user_id": user_id,
+                    "cover_letter": "I would love to bring my experience to this role.",
+                    "rating": min(100, max(0, round(rng.gauss(60, 18)))),
+                    "ai_analysis": "Generated for testing",
+                    "stage": rng.choices(stages, cum_weights=stage_weights)[0],
+                    "applied_at": now
+                    - dt.timedelta(minutes=rng.randrange(60 * 24 * 60)),
+                }
+
+    tables = [
+        (User, users),
+        (Organizations, organizations),
+        (OrganizationMember, organization_members),
+        (JobListings, job_listings),
+        (Skill, skills),
+        (JobSkill, job_skills),
+        (Candidates, candidates),
+        (CandidateSkill, candidate_skills),
+        (Resume, resumes),
+        (JobListingApplication, applications),
+    ]
+    return data, tables
+
+
+def _chunks(rows: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    iterator = iter(rows)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _copy_chunk(raw_connection, model, chunk: List[dict], processors) -> None:
+    """COPY one chunk into a PostgreSQL table (psycopg2)"""
+    columns = list(chunk[0])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in chunk:
+        writer.writerow(
+            [
+                "\\N" if (value := row[column]) is None else processors[column](value)
+                for column in columns
+            ]
+        )
+    buffer.seek(0)
+    with raw_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {model.__tablename__} ({', '.join(columns)}) "
+            "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer,
+        )
+
+
+def _copy_processors(model, engine: Engine) -> Dict[str, Callable]:
+    """Per column: value -> what the database stores (e.g. enum names)"""
+    processors = {}
+    for column in model.__table__.columns:
+        bind = column.type.bind_processor(engine.dialect)
+        if bind is None:
+            processors[column.name] = lambda value: value
+        else:
+            processors[column.name] = bind
+    return processors
+
+
+def load(
+    engine: Engine,
+    tables: Sequence[Tuple[type, Callable[[], Iterator[dict]]]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: bool = False,
+) -> Dict[str, int]:
+    """Stream each table's rows into the database in chunks, one transaction"""
+    counts = {}
+    use_copy = engine.dialect.name == "postgresql"
+    with engine.begin() as conn:
+        raw_connection = conn.connection.dbapi_connection if use_copy else None
+        for model, rows in tables:
+            started_at = time.perf_counter()
+            processors = _copy_processors(model, engine) if use_copy else None
+            count = 0
+            for chunk in _chunks(rows(), chunk_size):
+                if use_copy:
+                    _copy_chunk(raw_connection, model, chunk, processors)
+                else:
+                    conn.execute(insert(model), chunk)
+                count += len(chunk)
+            counts[model.__tablename__] = count
+            if progress:
+                seconds = time.perf_counter() - started_at
+                rate = count / seconds if seconds else math.inf
+                print(
+                    f"  {model.__tablename__:<26} {count:>10,} rows "
+                    f"{seconds:7.1f}s ({rate:,.0f} rows/s)"
+                )
+        if use_copy:
+            # Explicit ids leave the serial sequences behind
+            for table in ("users", "skills"):
+                conn.execute(
+                    text(
+                        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                        f"COALESCE((SELECT MAX(id) FROM {table}), 1))"
+                    )
+                )
+    if use_copy:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("ANALYZE"))
+    return counts
+
+
+def populate(
+    engine: Engine,
+    scale: Scale,
+    seed: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: bool = False,
+) -> GeneratedData:
+    """Generate and load a dataset into empty tables on `engine`"""
+    data, tables = generate(scale, seed)
+    data.rows = load(engine, tables, chunk_size, progress)
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--database-url", help="Target database (default: DATABASE_URL setting)"
+    )
+    parser.add_argument(
+        "--reset", action="store_true", help="Drop and recreate all tables first"
+    )
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="dev")
+    for name, value in asdict(Scale()).items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            type=type(value),
+            help=f"Overrides the preset ({name})",
+        )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    overrides = {
+        name: getattr(args, name)
+        for name in asdict(Scale())
+        if getattr(args, name) is not None
+    }
+    scale = Scale(**{**asdict(PRESETS[args.preset]), **overrides})
+
+    if args.database_url:
+        engine = create_engine(args.database_url)
+    else:
+        from app.db.database import engine
+
+    print("=" * 60)
+    print("🌱 JobLinker Data Generator")
+    print("=" * 60)
+    print(f"Database: {engine.url.render_as_string(hide_password=True)}")
+    print(f"Scale: {scale} (seed {args.seed})")
+
+    if args.reset:
+        print("\n🗑️  Dropping and recreating tables...")
+        Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    print("\n📦 Loading rows...")
+    started_at = time.perf_counter()
+    data = populate(engine, scale, args.seed, args.chunk_size, progress=True)
+    total = sum(data.rows.values())
+    print(f"\n✅ {total:,} rows in {time.perf_counter() - started_at:.1f}s")
+    print(f"   Every user's password is {data.password!r}")
+
+
+if __name__ == "__main__":
+    main()
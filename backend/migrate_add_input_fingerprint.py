@@ -0,0 +1,73 @@
+"""
+Migration script to add the input_fingerprint column to job_listing_applications
+(used to skip re-ranking applications whose inputs did not change)
+Run this script to update your database schema
+"""
+
+import sys
+from pathlib import Path
+
+# Add the backend directory to the path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import inspect, text  # noqa: E402
+from sqlalchemy.exc import SQLAlchemyError  # noqa: E402
+
+from app.db.database import engine  # noqa: E402
+from app.models.application import JobListingApplication  # noqa: E402
+
+
+def migrate_database():
+    """Add input_fingerprint column if it doesn't exist"""
+    table = JobListingApplication.__tablename__
+    try:
+        inspector = inspect(engine)
+        if not inspector.has_table(table):
+            print(
+                f"✅ Table '{table}' does not exist yet. It will be created on startup."
+            )
+            return True
+
+        columns = {column["name"] for column in inspector.get_columns(table)}
+        if "input_fingerprint" in columns:
+            print("✅ Column 'input_fingerprint' already exists. No migration needed.")
+            return True
+
+        print(f"🔄 Adding 'input_fingerprint' column to {table} table...")
+        with engine.begin() as conn:
+            conn.execute(
+                text(f"ALTER TABLE {table} ADD COLUMN input_fingerprint VARCHAR(64)")
+            )
+
+        print("✅ Migration completed successfully!")
+        print(f"   - Added 'input_fingerprint' column to {table}")
+        print("   - Existing applications are re-scored on their next change")
+
+        return True
+
+    except SQLAlchemyError as e:
+        print(f"❌ Database error: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("  Database Migration: Add input_fingerprint Column")
+    print("=" * 60)
+    print()
+
+    success = migrate_database()
+
+    print()
+    print("=" * 60)
+    if success:
+        print("  ✨ Migration completed!")
+    else:
+        print("  ❌ Migration failed!")
+    print("=" * 60)
+
+    sys.exit(0 if success else 1)
@@ -0,0 +1,101 @@
+"""
+Migration script to add the pipeline timing columns
+(resumes.parse_timings, job_listing_applications.ranked_at/rank_timings and
+the parsed_at/ranked_at indexes used by /admin/pipeline-stats)
+Run this script to update your database schema
+"""
+
+import sys
+from pathlib import Path
+
+# Add the backend directory to the path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import inspect, text  # noqa: E402
+from sqlalchemy.exc import SQLAlchemyError  # noqa: E402
+
+from app.db.database import engine  # noqa: E402
+from app.models.application import JobListingApplication  # noqa: E402
+from app.models.resume import Resume  # noqa: E402
+
+NEW_COLUMNS = [
+    (Resume.__table__, "parse_timings"),
+    (JobListingApplication.__table__, "ranked_at"),
+    (JobListingApplication.__table__, "rank_timings"),
+]
+NEW_INDEXES = [
+    (Resume.__table__, "parsed_at"),
+    (JobListingApplication.__table__, "ranked_at"),
+]
+
+
+def migrate_database():
+    """Add any missing pipeline timing columns and indexes"""
+    try:
+        inspector = inspect(engine)
+        changes = []
+        with engine.begin() as conn:
+            for table, name in NEW_COLUMNS:
+                if not inspector.has_table(table.name):
+                    continue
+                existing = {
+                    column["name"] for column in inspector.get_columns(table.name)
+                }
+                if name in existing:
+                    continue
+                column_type = table.c[name].type.compile(dialect=engine.dialect)
+                print(f"🔄 Adding '{name}' column to {table.name} table...")
+                conn.execute(
+                    text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type}")
+                )
+                changes.append(f"Added '{name}' column to {table.name}")
+
+        for table, name in NEW_INDEXES:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if [column.name for column in index.columns] != [name]:
+                    continue
+                if index.name in existing:
+                    continue
+                print(f"🔄 Creating index '{index.name}'...")
+                index.create(bind=engine)
+                changes.append(f"Added index '{index.name}' on {table.name}")
+
+        if not changes:
+            print("✅ All pipeline timing columns already exist. No migration needed.")
+            return True
+
+        print("✅ Migration completed successfully!")
+        for change in changes:
+            print(f"   - {change}")
+
+        return True
+
+    except SQLAlchemyError as e:
+        print(f"❌ Database error: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("  Database Migration: Pipeline Timing Columns")
+    print("=" * 60)
+    print()
+
+    success = migrate_database()
+
+    print()
+    print("=" * 60)
+    if success:
+        print("  ✨ Migration completed!")
+    else:
+        print("  ❌ Migration failed!")
+    print("=" * 60)
+
+    sys.exit(0 if success else 1)
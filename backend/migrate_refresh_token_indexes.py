@@ -0,0 +1,78 @@
+"""
+Migration script to add the refresh token cleanup indexes
+(expires_at for the sweeper, partial active-token index for the per-user cap)
+Run this script to update your database schema
+"""
+
+import sys
+from pathlib import Path
+
+# Add the backend directory to the path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import inspect  # noqa: E402
+from sqlalchemy.exc import SQLAlchemyError  # noqa: E402
+
+from app.db.database import engine  # noqa: E402
+from app.models.refresh_token import RefreshToken  # noqa: E402
+
+
+def migrate_database():
+    """Create any missing refresh_tokens indexes"""
+    try:
+        inspector = inspect(engine)
+        if not inspector.has_table(RefreshToken.__tablename__):
+            print(
+                "✅ Table 'refresh_tokens' does not exist yet. It will be created on startup."
+            )
+            return True
+
+        existing = {
+            index["name"] for index in inspector.get_indexes(RefreshToken.__tablename__)
+        }
+        missing = [
+            index
+            for index in RefreshToken.__table__.indexes
+            if index.name not in existing
+        ]
+
+        if not missing:
+            print("✅ All refresh_tokens indexes already exist. No migration needed.")
+            return True
+
+        for index in missing:
+            print(f"🔄 Creating index '{index.name}'...")
+            index.create(bind=engine)
+
+        print("✅ Migration completed successfully!")
+        for index in missing:
+            print(f"   - Added index '{index.name}' on refresh_tokens")
+
+        return True
+
+    except SQLAlchemyError as e:
+        print(f"❌ Database error: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("  Database Migration: Refresh Token Indexes")
+    print("=" * 60)
+    print()
+
+    success = migrate_database()
+
+    print()
+    print("=" * 60)
+    if success:
+        print("  ✨ Migration completed!")
+    else:
+        print("  ❌ Migration failed!")
+    print("=" * 60)
+
+    sys.exit(0 if success else 1)
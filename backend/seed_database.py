@@ -1,6 +1,7 @@
 """
 Database seeding script for JobLinker
 Run with: python seed_database.py
+For large synthetic datasets use generate_data.py
 """
 
 import sys
@@ -66,10 +67,21 @@ def seed_users(db: Session):
         },
     ]
 
+    # One query for the existing users, one bcrypt hash per distinct password
+    existing_users = {
+        user.email: user
+        for user in db.query(User).filter(
+            User.email.in_([user_data["email"] for user_data in users_data])
+        )
+    }
+    hashed_passwords = {
+        password: hash_password(password)
+        for password in {user_data["password"] for user_data in users_data}
+    }
+
     users = []
     for user_data in users_data:
-        # Check if user already exists
-        existing_user = db.query(User).filter(User.email == user_data["email"]).first()
+        existing_user = existing_users.get(user_data["email"])
         if existing_user:
             print(f"  User {user_data['email']} already exists, skipping...")
             users.append(existing_user)
@@ -78,7 +90,7 @@ def seed_users(db: Session):
         user = User(
             email=user_data["email"],
             name=user_data["name"],
-            hashed_password=hash_password(user_data["password"]),
+            hashed_password=hashed_passwords[user_data["password"]],
             is_active=True,
         )
         db.add(user)
@@ -344,10 +356,14 @@ def seed_skills(db: Session):
         "Tailwind CSS",
     ]
 
+    existing_skills = {
+        skill.name: skill
+        for skill in db.query(Skill).filter(Skill.name.in_(skills_data))
+    }
+
     skills = []
     for skill_name in skills_data:
-        # Check if skill already exists
-        existing_skill = db.query(Skill).filter(Skill.name == skill_name).first()
+        existing_skill = existing_skills.get(skill_name)
         if existing_skill:
             skills.append(existing_skill)
             continue
@@ -5,3 +5,6 @@ export const ROLES = {
 
 export type ROLE_TYPE = keyof typeof ROLES;
 export type ROLE_ARRAY_TYPE = (typeof ROLES)[keyof typeof ROLES][];
+
+// Largest page the API's cursor-paginated list endpoints serve (PAGE_SIZE_MAX)
+export const API_PAGE_SIZE = 200;
@@ -15,7 +15,7 @@ class ApplicationService extends BaseService {
   }
 
   async getMyApplications(): Promise<Application[]> {
-    return this.get<Application[]>("/me");
+    return this.getAll<Application>("/me");
   }
 
   async checkApplicationStatus(jobId: string): Promise<{
@@ -29,11 +29,11 @@ class ApplicationService extends BaseService {
   }
 
   async getJobApplications(jobId: string): Promise<Application[]> {
-    return this.get<Application[]>(`/job/${jobId}`);
+    return this.getAll<Application>(`/job/${jobId}`);
   }
 
   async getOrganizationApplications(orgId: string): Promise<Application[]> {
-    return this.get<Application[]>(`/organization/${orgId}`);
+    return this.getAll<Application>(`/organization/${orgId}`);
   }
 
   async updateApplicationStage(
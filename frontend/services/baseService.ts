@@ -1,5 +1,6 @@
 import { AxiosError, AxiosHeaders, AxiosInstance, AxiosResponse } from "axios";
 import { createAxiosInstance } from "./axiosInstance";
+import { API_PAGE_SIZE } from "@/constants";
 
 type BaseServiceConfig = {
   params?: Record<string, unknown>;
@@ -19,9 +20,15 @@ export abstract class BaseService {
   protected async handleRequest<TData>(
     request: Promise<AxiosResponse<TData>>
   ): Promise<TData> {
+    const response = await this.handleResponse(request);
+    return response.data;
+  }
+
+  protected async handleResponse<TData>(
+    request: Promise<AxiosResponse<TData>>
+  ): Promise<AxiosResponse<TData>> {
     try {
-      const response = await request;
-      return response.data;
+      return await request;
     } catch (e) {
       if (e instanceof AxiosError) {
         throw new Error(
@@ -44,6 +51,29 @@ export abstract class BaseService {
     );
   }
 
+  // List endpoints return one page per request, with the cursor of the next
+  // page in the X-Next-Cursor header; follow it until every item is loaded
+  public async getAll<TItem>(
+    url: string,
+    config?: BaseServiceConfig
+  ): Promise<TItem[]> {
+    const items: TItem[] = [];
+    let cursor: string | undefined;
+    do {
+      const response = await this.handleResponse(
+        this.apiInstance.get<TItem[]>(url, {
+          ...config,
+          params: { limit: API_PAGE_SIZE, ...config?.params, cursor },
+          responseType: "json",
+        })
+      );
+      items.push(...response.data);
+      const next = response.headers["x-next-cursor"];
+      cursor = typeof next === "string" && next ? next : undefined;
+    } while (cursor);
+    return items;
+  }
+
   public async post<TResponse, TData>(
     url: string,
     data: TData,
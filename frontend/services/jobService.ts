@@ -42,10 +42,9 @@ class JobService extends BaseService {
     orgId: string,
     status?: string
   ): Promise<JobListing[]> {
-    const url = status
-      ? `/organization/${orgId}?status_filter=${status}`
-      : `/organization/${orgId}`;
-    return this.get<JobListing[]>(url);
+    return this.getAll<JobListing>(`/organization/${orgId}`, {
+      params: status ? { status_filter: status } : undefined,
+    });
   }
 
   async createJobListing(data: JobListingCreate): Promise<JobListing> {
@@ -35,7 +35,7 @@ class OrganizationService extends BaseService {
   }
 
   async getMembers(id: string): Promise<OrganizationMember[]> {
-    return this.get<OrganizationMember[]>(`/${id}/members`);
+    return this.getAll<OrganizationMember>(`/${id}/members`);
   }
 }
 